@@ -1,6 +1,7 @@
 # Gunicorn configuration file for Trends.Earth UI
 
 import multiprocessing as _mp
+import os as _os
 
 # Server socket
 bind = "0.0.0.0:8000"
@@ -9,8 +10,18 @@ backlog = 2048
 # Worker processes
 # NOTE: Dash applications require a single worker due to in-memory state and callback routing
 # Multiple workers cause 405 Method Not Allowed errors for Dash internal routes
+# A shared CACHE_BACKEND (sqlite or redis) keeps the caches warm across
+# max_requests restarts but does not lift the single-worker requirement.
 workers = 1  # Use single worker to avoid Dash callback issues
-worker_class = "sync"
+
+# Concurrency inside each worker.  With the default "sync" class one slow API
+# call (up to 20s) blocks every other user of that worker.  "gthread" with
+# GUNICORN_THREADS > 1 serves several callbacks at once; the caches, the
+# shared HTTP sessions and the single-flight/circuit-breaker state are all
+# thread-safe.  Async classes such as "gevent" are not supported: the app
+# does not monkey-patch, so blocking calls would stall the event loop.
+worker_class = _os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+threads = int(_os.environ.get("GUNICORN_THREADS", "1"))
 worker_connections = 1000
 timeout = 120
 keepalive = 2
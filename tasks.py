@@ -332,6 +332,57 @@ def test(c: Context, coverage: bool = True, verbose: bool = True):
     c.run(" ".join(cmd))
 
 
+@task
+def benchmark(
+    c: Context,
+    save: bool = False,
+    compare: bool = True,
+    threshold: str = "median:20%",
+    slow: bool = True,
+):
+    """Run the hot-path benchmarks.
+
+    ``--save`` stores the run as the new baseline under ``.benchmarks/``;
+    otherwise the run is compared with the latest saved baseline and fails
+    when any benchmark regresses past ``--threshold``.
+    """
+    cmd = [sys.executable, "-m", "pytest", "tests/benchmarks", "--benchmark-only"]
+
+    if not slow:
+        cmd.extend(["-m", '"not slow"'])
+
+    if save:
+        cmd.append("--benchmark-save=baseline")
+    elif compare:
+        cmd.extend(["--benchmark-compare", f"--benchmark-compare-fail={threshold}"])
+
+    c.run(" ".join(cmd))
+
+
+@task
+def loadtest(c: Context, users: str = "1,5,10,20", duration: int = 60, url: str = ""):
+    """Replay Dash callback traffic against gunicorn and the mock API.
+
+    Runs one stage per ``--users`` value and reports callbacks/s, latency
+    percentiles per callback and worker saturation.  ``--url`` targets an
+    already running UI instead of starting one.
+    """
+    cmd = [
+        sys.executable,
+        "-m",
+        "tests.load",
+        "--users",
+        users,
+        "--duration",
+        str(duration),
+    ]
+
+    if url:
+        cmd.extend(["--url", url])
+
+    c.run(" ".join(cmd))
+
+
 @task
 def lint(c: Context, fix: bool = False):
     """Run linting checks."""
@@ -376,6 +427,8 @@ ns.add_collection(translate)
 # Add development tasks
 ns.add_task(dev)
 ns.add_task(test)
+ns.add_task(benchmark)
+ns.add_task(loadtest)
 ns.add_task(lint)
 ns.add_task(format, name="format")
 
@@ -0,0 +1,183 @@
+"""Synthetic inputs for the hot-path benchmarks.
+
+Sizes come in a realistic flavour (what a busy production page sees) and an
+extreme one (the largest payloads we have seen or expect from the API).
+Generators are seeded and memoised, so every run benchmarks identical data
+and building it is not part of the measurement.
+"""
+
+from datetime import UTC, datetime, timedelta
+from functools import cache
+import json
+import math
+import random
+
+EXECUTION_STATUSES = ("FINISHED", "FAILED", "RUNNING", "PENDING", "READY", "CANCELLED")
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@cache
+def make_executions(count: int) -> list[dict]:
+    """Execution rows shaped like ``GET /execution`` results."""
+    rng = random.Random(count)
+    rows = []
+    for i in range(count):
+        start = START + timedelta(minutes=7 * i)
+        rows.append(
+            {
+                "id": f"00000000-0000-4000-8000-{i:012d}",
+                "script_name": f"productivity-{rng.randint(1, 4)}-0-{rng.randint(0, 9)}",
+                "user_email": f"user{rng.randint(1, 2000)}@example.org",
+                "user_name": f"User {i % 2000}",
+                "status": rng.choice(EXECUTION_STATUSES),
+                "progress": rng.randint(0, 100),
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(seconds=rng.randint(30, 7200))).isoformat(),
+                "duration": rng.uniform(30, 7200),
+            }
+        )
+    return rows
+
+
+@cache
+def make_params_json(target_bytes: int) -> str:
+    """A nested execution params document of roughly *target_bytes* bytes."""
+    rng = random.Random(target_bytes)
+    layers = []
+    params = {"task_name": "sdg-15-3-1", "crs": "EPSG:4326", "layers": layers}
+    while len(json.dumps(params)) < target_bytes:
+        batch = [
+            {
+                "name": f"layer_{len(layers) + j}",
+                "band": {"index": j, "metadata": {"year": 2000 + j % 25, "scale": rng.random()}},
+                "values": [round(rng.random(), 6) for _ in range(50)],
+            }
+            for j in range(200)
+        ]
+        layers.extend(batch)
+    return json.dumps(params)
+
+
+@cache
+def make_multipolygon(vertex_count: int, polygons: int = 10) -> dict:
+    """A GeoJSON Feature with a MultiPolygon of about *vertex_count* vertices."""
+    per_ring = max(vertex_count // polygons, 4)
+    coordinates = []
+    for p in range(polygons):
+        cx, cy = -60 + p * 3, -10 + p
+        ring = [
+            [
+                cx + math.cos(2 * math.pi * k / per_ring),
+                cy + math.sin(2 * math.pi * k / per_ring),
+            ]
+            for k in range(per_ring)
+        ]
+        ring.append(ring[0])
+        coordinates.append([ring])
+    return {
+        "type": "Feature",
+        "properties": {"name": "Area of interest"},
+        "geometry": {"type": "MultiPolygon", "coordinates": coordinates},
+    }
+
+
+@cache
+def make_status_series(points: int) -> list[dict]:
+    """Status log rows at one-minute resolution, as the status endpoint returns."""
+    rng = random.Random(points)
+    return [
+        {
+            "timestamp": (START + timedelta(minutes=i)).isoformat(),
+            "executions_active": rng.randint(0, 300),
+            "executions_ready": rng.randint(0, 50),
+            "executions_running": rng.randint(0, 200),
+            "executions_finished": 100_000 + i,
+            "executions_failed": 5_000 + i // 10,
+        }
+        for i in range(points)
+    ]
+
+
+@cache
+def make_execution_stats(days: int) -> dict:
+    """``/stats/executions`` payload covering *days* days."""
+    rng = random.Random(days)
+    return {
+        "data": {
+            "time_series": [
+                {
+                    "timestamp": (START + timedelta(days=i)).isoformat(),
+                    "by_status": {status: rng.randint(0, 400) for status in EXECUTION_STATUSES},
+                }
+                for i in range(days)
+            ],
+            "task_performance": [
+                {
+                    "task": f"script-{t}",
+                    "total_executions": rng.randint(100, 10_000),
+                    "avg_duration_minutes": rng.uniform(1, 90),
+                    "versions": [
+                        {
+                            "version": f"2.{v}.{t % 10}",
+                            "total_executions": rng.randint(10, 1_000),
+                            "success_rate": rng.uniform(50, 100),
+                        }
+                        for v in range(5)
+                    ],
+                }
+                for t in range(40)
+            ],
+            "top_users": [
+                {"name": f"User {u}", "email": f"user{u}@example.org", "execution_count": 5000 - u}
+                for u in range(50)
+            ],
+        }
+    }
+
+
+COUNTRY_CODES = (
+    "USA", "KEN", "BRA", "IND", "CHN", "ARG", "AUS", "CAN", "COL", "ETH",
+    "FRA", "GHA", "IDN", "MEX", "MOZ", "NGA", "PER", "PHL", "SEN", "ZAF",
+)  # fmt: skip
+
+
+@cache
+def make_filter_model(conditions: int) -> dict:
+    """An AG-Grid filter model mixing set, text, number, date and compound filters."""
+    model: dict = {
+        "status": {"filterType": "set", "values": list(EXECUTION_STATUSES)},
+        "start_date": {
+            "filterType": "date",
+            "type": "inRange",
+            "dateFrom": "2025-01-01 00:00:00",
+            "dateTo": "2025-06-30 23:59:59",
+        },
+        "progress": {"filterType": "number", "type": "greaterThan", "filter": 10},
+    }
+    for i in range(conditions):
+        model[f"script_name_{i}"] = {
+            "filterType": "text",
+            "operator": "OR",
+            "conditions": [
+                {"filterType": "text", "type": "contains", "filter": f"product%ivity_{i}"},
+                {"filterType": "text", "type": "startsWith", "filter": f"sdg-'{i}"},
+            ],
+        }
+    return model
+
+
+@cache
+def make_user_stats(days: int) -> dict:
+    """``/stats/users`` payload covering *days* days."""
+    rng = random.Random(days)
+    return {
+        "data": {
+            "registration_trends": [
+                {"date": (START + timedelta(days=i)).isoformat(), "new_users": rng.randint(0, 80)}
+                for i in range(days)
+            ],
+            "geographic_distribution": {
+                "countries": {code: rng.randint(1, 5000) for code in COUNTRY_CODES}
+            },
+        }
+    }
@@ -0,0 +1,40 @@
+"""Benchmarks for AG-Grid request translation."""
+
+import pytest
+
+from trendsearth_ui.utils.aggrid import build_aggrid_request_params, build_filter_clause
+
+from .synthetic import make_filter_model
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark(group="aggrid")
+
+SIZES = [pytest.param(3, id="realistic"), pytest.param(200, id="extreme")]
+
+
+@pytest.mark.parametrize("conditions", SIZES)
+def test_build_filter_clause(benchmark, conditions):
+    filter_model = make_filter_model(conditions)
+
+    clause, _params = benchmark(build_filter_clause, filter_model)
+
+    assert clause.count(" OR ") >= conditions
+
+
+@pytest.mark.parametrize("conditions", SIZES)
+def test_build_aggrid_request_params(benchmark, conditions):
+    request = {
+        "startRow": 450,
+        "endRow": 500,
+        "sortModel": [{"colId": "start_date", "sort": "desc"}, {"colId": "status", "sort": "asc"}],
+        "filterModel": make_filter_model(conditions),
+    }
+
+    params, _state = benchmark(
+        build_aggrid_request_params,
+        request,
+        base_params={"include": "script_name,user_name,user_email"},
+    )
+
+    assert params["page"] == 10
+    assert "filter" in params
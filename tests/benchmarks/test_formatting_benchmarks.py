@@ -0,0 +1,34 @@
+"""Benchmarks for execution row formatting."""
+
+import pytest
+
+from trendsearth_ui.callbacks.executions import process_execution_data
+from trendsearth_ui.utils.helpers import parse_date
+
+from .synthetic import make_executions
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark(group="formatting")
+
+SIZES = [
+    pytest.param(500, id="realistic"),
+    pytest.param(10_000, id="extreme", marks=pytest.mark.slow),
+]
+
+
+@pytest.mark.parametrize("rows", SIZES)
+def test_process_execution_data(benchmark, rows):
+    executions = make_executions(rows)
+
+    result = benchmark(process_execution_data, executions, "ADMIN", "America/Sao_Paulo")
+
+    assert len(result) == rows
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "Asia/Kathmandu"])
+def test_parse_date(benchmark, timezone):
+    dates = [row["start_date"] for row in make_executions(500)]
+
+    result = benchmark(lambda: [parse_date(value, timezone) for value in dates])
+
+    assert all(result)
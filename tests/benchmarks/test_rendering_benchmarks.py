@@ -0,0 +1,37 @@
+"""Benchmarks for the params/results JSON viewer and the execution area map."""
+
+import pytest
+
+from trendsearth_ui.utils.geojson import create_map_from_geojsons
+from trendsearth_ui.utils.json_utils import render_json_tree
+
+from .synthetic import make_multipolygon, make_params_json
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="json-tree")
+def test_render_json_tree_realistic(benchmark):
+    params = make_params_json(50_000)
+
+    assert benchmark(render_json_tree, params) is not None
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="json-tree")
+def test_render_json_tree_extreme(benchmark):
+    # A 5 MB document takes around a minute to render, so a single round is enough.
+    params = make_params_json(5_000_000)
+
+    assert benchmark.pedantic(render_json_tree, args=(params,), rounds=1) is not None
+
+
+@pytest.mark.benchmark(group="geojson-map")
+@pytest.mark.parametrize(
+    "vertices",
+    [pytest.param(1_000, id="realistic"), pytest.param(100_000, id="extreme")],
+)
+def test_create_map_from_geojsons(benchmark, vertices):
+    geojsons = [make_multipolygon(vertices)]
+
+    assert benchmark(create_map_from_geojsons, geojsons, "bench") is not None
@@ -0,0 +1,82 @@
+"""Benchmarks for status time-series down-sampling and the statistics charts."""
+
+import pytest
+
+from trendsearth_ui.utils import stats_visualizations
+from trendsearth_ui.utils.status_data_manager import StatusDataManager
+
+from .synthetic import make_execution_stats, make_status_series, make_user_stats
+
+pytest.importorskip("pytest_benchmark")
+
+PERIODS = [
+    pytest.param("day", 1_440, id="day"),
+    pytest.param("week", 10_080, id="week"),
+    pytest.param("month", 43_200, id="month"),
+]
+
+CHART_PERIODS = [
+    pytest.param("month", 30, id="realistic"),
+    pytest.param("all", 3_650, id="extreme"),
+]
+
+
+@pytest.mark.benchmark(group="time-series")
+@pytest.mark.parametrize(("period", "points"), PERIODS)
+def test_optimize_time_series_data(benchmark, period, points):
+    series = make_status_series(points)
+
+    result = benchmark(StatusDataManager._optimize_time_series_data, series, 500, period)
+
+    assert len(result) <= 500
+
+
+@pytest.mark.benchmark(group="charts")
+@pytest.mark.parametrize(("period", "days"), CHART_PERIODS)
+def test_execution_statistics_chart(benchmark, period, days):
+    execution_stats = make_execution_stats(days)
+    status_series = make_status_series(min(days * 24, 10_000))
+
+    charts = benchmark(
+        stats_visualizations.create_execution_statistics_chart,
+        execution_stats,
+        status_series,
+        user_timezone="Europe/Lisbon",
+        ui_period=period,
+    )
+
+    assert charts
+
+
+@pytest.mark.benchmark(group="charts")
+@pytest.mark.parametrize(("period", "days"), CHART_PERIODS)
+def test_user_statistics_chart(benchmark, period, days):
+    user_stats = make_user_stats(days)
+
+    charts = benchmark(
+        stats_visualizations.create_user_statistics_chart,
+        user_stats,
+        user_timezone="Europe/Lisbon",
+        ui_period=period,
+    )
+
+    assert charts
+
+
+@pytest.mark.benchmark(group="charts")
+@pytest.mark.parametrize(
+    "builder",
+    [
+        stats_visualizations.create_script_version_histogram,
+        stats_visualizations.create_top_users_chart,
+    ],
+    ids=["script-versions", "top-users"],
+)
+def test_execution_breakdown_charts(benchmark, builder):
+    assert benchmark(builder, make_execution_stats(365))
+
+
+@pytest.mark.benchmark(group="charts")
+def test_user_geographic_map(benchmark):
+    map_component = benchmark(stats_visualizations.create_user_geographic_map, make_user_stats(365))
+    assert map_component is not None
@@ -3,6 +3,7 @@
 from datetime import datetime
 import json
 import os
+from pathlib import Path
 
 # Import the application modules
 import sys
@@ -21,6 +22,24 @@ from trendsearth_ui.callbacks import register_all_callbacks  # noqa: E402
 from trendsearth_ui.components import create_main_layout  # noqa: E402
 from trendsearth_ui.config import API_BASE, APP_TITLE, AUTH_URL  # noqa: E402
 
+BENCHMARKS_DIR = Path(__file__).parent / "benchmarks"
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Only collect the benchmark suite when it is asked for explicitly.
+
+    Benchmarks run with ``--benchmark-only`` or when ``tests/benchmarks`` is
+    passed on the command line, so the regular suite stays fast.
+    """
+    if collection_path != BENCHMARKS_DIR:
+        return None
+    if config.getoption("benchmark_only", default=False):
+        return None
+    requested = (Path(arg.split("::")[0]).resolve() for arg in config.args)
+    if any(path.is_relative_to(BENCHMARKS_DIR) for path in requested):
+        return None
+    return True
+
 
 @pytest.fixture
 def dash_app():
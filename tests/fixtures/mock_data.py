@@ -0,0 +1,325 @@
+"""Synthetic Trends.Earth API records shared by the Playwright mocks and the mock API server.
+
+Each record type has a per-row builder (``mock_execution``, ``mock_script``,
+``mock_user``) that takes an index and a random source.  The ``generate_*``
+helpers build whole pages from them; the mock API server in
+``tests/mock_api`` seeds one ``random.Random`` per index instead, so any
+page of a multi-million row table can be produced on demand.
+"""
+
+from datetime import datetime, timedelta
+import random
+from typing import Any
+
+EXECUTION_STATUSES = ["FINISHED", "RUNNING", "FAILED", "QUEUED", "CANCELLED"]
+EXECUTION_SCRIPT_NAMES = [
+    "Land Degradation Analysis",
+    "Vegetation Index Calculation",
+    "Soil Erosion Assessment",
+    "Carbon Stock Monitoring",
+    "Drought Impact Analysis",
+    "Urban Expansion Detection",
+    "Forest Change Detection",
+    "Biodiversity Mapping",
+    "Agricultural Productivity",
+    "Water Quality Assessment",
+]
+EXECUTION_USERS = [
+    "Alice Johnson",
+    "Bob Smith",
+    "Carol Davis",
+    "David Wilson",
+    "Emma Brown",
+    "Frank Miller",
+    "Grace Lee",
+    "Henry Chen",
+    "Isabel Garcia",
+    "Jack Robinson",
+]
+
+SCRIPT_STATUSES = ["PUBLISHED", "DRAFT", "ARCHIVED", "UNDER_REVIEW"]
+SCRIPT_NAMES = [
+    "NDVI Time Series Analysis",
+    "Land Cover Classification",
+    "Soil Organic Carbon Estimation",
+    "Precipitation Trend Analysis",
+    "Deforestation Risk Assessment",
+    "Agricultural Yield Prediction",
+    "Wetland Monitoring System",
+    "Urban Heat Island Detection",
+    "Coastal Erosion Mapping",
+    "Grassland Productivity Index",
+]
+SCRIPT_DESCRIPTIONS = [
+    "Automated analysis of vegetation health indicators",
+    "Machine learning-based land cover mapping",
+    "Carbon stock assessment using satellite data",
+    "Climate trend analysis for agricultural planning",
+    "Early warning system for forest loss",
+    "Crop yield forecasting model",
+    "Wetland ecosystem health monitoring",
+    "Urban temperature analysis tool",
+    "Coastal change detection algorithm",
+    "Grassland productivity monitoring system",
+]
+SCRIPT_AUTHORS = [
+    "Dr. Sarah Mitchell",
+    "Prof. Michael Thompson",
+    "Dr. Lisa Wang",
+    "Dr. James Rodriguez",
+    "Dr. Rachel Green",
+    "Prof. David Kim",
+    "Dr. Maria Santos",
+    "Dr. Ahmed Hassan",
+    "Dr. Jennifer Liu",
+    "Dr. Carlos Mendez",
+]
+
+USER_ROLES = ["USER", "ADMIN", "MODERATOR", "VIEWER"]
+USER_INSTITUTIONS = [
+    "Conservation International",
+    "World Wildlife Fund",
+    "UNEP",
+    "FAO",
+    "CIAT",
+    "CIFOR",
+    "ICRAF",
+    "NASA",
+    "ESA",
+    "USGS",
+    "University of Oxford",
+    "Stanford University",
+    "MIT",
+    "Harvard University",
+    "Cambridge University",
+]
+USER_COUNTRIES = [
+    "United States",
+    "United Kingdom",
+    "Germany",
+    "France",
+    "Brazil",
+    "Kenya",
+    "South Africa",
+    "India",
+    "China",
+    "Australia",
+    "Canada",
+    "Mexico",
+    "Colombia",
+    "Indonesia",
+    "Philippines",
+]
+USER_FIRST_NAMES = [
+    "Alice",
+    "Bob",
+    "Carol",
+    "David",
+    "Emma",
+    "Frank",
+    "Grace",
+    "Henry",
+    "Isabel",
+    "Jack",
+    "Karen",
+    "Liam",
+    "Maria",
+    "Nathan",
+    "Olivia",
+    "Peter",
+]
+USER_LAST_NAMES = [
+    "Johnson",
+    "Smith",
+    "Davis",
+    "Wilson",
+    "Brown",
+    "Miller",
+    "Lee",
+    "Chen",
+    "Garcia",
+    "Robinson",
+    "Anderson",
+    "Taylor",
+    "Thomas",
+    "Martinez",
+    "Clark",
+    "Lewis",
+]
+
+
+EXECUTIONS_START = datetime(2024, 1, 1)
+
+
+def mock_execution(index, rng=random, status=None, spacing_minutes=24 * 60):
+    """Build the execution at *index* (0-based); *status* is random unless given.
+
+    Executions start *spacing_minutes* apart (plus jitter within that slot), so
+    start dates increase with the index.
+    """
+    status = status or rng.choice(EXECUTION_STATUSES)
+    start_date = EXECUTIONS_START + timedelta(
+        minutes=index * spacing_minutes + rng.randint(0, spacing_minutes * 23 // 24)
+    )
+    end_date = None
+    progress = 0
+
+    if status == "FINISHED":
+        end_date = start_date + timedelta(minutes=rng.randint(30, 180))
+        progress = 100
+    elif status == "RUNNING":
+        progress = rng.randint(10, 90)
+    elif status == "FAILED":
+        end_date = start_date + timedelta(minutes=rng.randint(5, 60))
+        progress = rng.randint(5, 50)
+
+    return {
+        "id": f"exec-{index + 1}",
+        "script_name": rng.choice(EXECUTION_SCRIPT_NAMES),
+        "user_name": rng.choice(EXECUTION_USERS),
+        "status": status,
+        "start_date": start_date.isoformat() + "Z",
+        "end_date": end_date.isoformat() + "Z" if end_date else None,
+        "progress": progress,
+    }
+
+
+def mock_script(index, rng=random):
+    """Build the script at *index* (0-based)."""
+    created_date = datetime(2024, 1, 1) + timedelta(days=index * 3, hours=rng.randint(0, 23))
+    updated_date = created_date + timedelta(days=rng.randint(0, 30))
+
+    return {
+        "id": f"script-{index + 1}",
+        "name": SCRIPT_NAMES[index % len(SCRIPT_NAMES)],
+        "user_name": SCRIPT_AUTHORS[index % len(SCRIPT_AUTHORS)],
+        "description": SCRIPT_DESCRIPTIONS[index % len(SCRIPT_DESCRIPTIONS)],
+        "status": rng.choice(SCRIPT_STATUSES),
+        "created_at": created_date.isoformat() + "Z",
+        "updated_at": updated_date.isoformat() + "Z",
+    }
+
+
+def mock_user(index, rng=random):
+    """Build the user at *index* (0-based)."""
+    first_name = rng.choice(USER_FIRST_NAMES)
+    last_name = rng.choice(USER_LAST_NAMES)
+    created_date = datetime(2023, 6, 1) + timedelta(days=index * 7, hours=rng.randint(0, 23))
+    updated_date = created_date + timedelta(days=rng.randint(1, 60))
+
+    return {
+        "id": f"user-{index + 1}",
+        "email": f"{first_name.lower()}.{last_name.lower()}@example.com",
+        "name": f"{first_name} {last_name}",
+        "institution": rng.choice(USER_INSTITUTIONS),
+        "country": rng.choice(USER_COUNTRIES),
+        "role": rng.choice(USER_ROLES),
+        "created_at": created_date.isoformat() + "Z",
+        "updated_at": updated_date.isoformat() + "Z",
+    }
+
+
+def generate_mock_executions_data(count=10, page=1, per_page=50):
+    """Generate mock execution data for Playwright tests."""
+    return {
+        "data": [mock_execution(i) for i in range(count)],
+        "total": count * 3,  # Simulate more total records than current page
+        "page": page,
+        "per_page": per_page,
+    }
+
+
+def generate_mock_scripts_data(count=10, page=1, per_page=50):
+    """Generate mock script data for Playwright tests."""
+    return {
+        "data": [mock_script(i) for i in range(count)],
+        "total": count * 2,  # Simulate more total records than current page
+        "page": page,
+        "per_page": per_page,
+    }
+
+
+def generate_mock_users_data(count=10, page=1, per_page=50):
+    """Generate mock user data for Playwright tests."""
+    return {
+        "data": [mock_user(i) for i in range(count)],
+        "total": count * 4,  # Simulate more total records than current page
+        "page": page,
+        "per_page": per_page,
+    }
+
+
+def generate_mock_status_data():
+    """Generate mock status/system data for Playwright tests."""
+    # Generate mock system statistics
+    current_time = datetime.now()
+
+    # Mock execution statistics
+    total_executions = random.randint(150, 300)
+    running_executions = random.randint(5, 25)
+    finished_executions = random.randint(100, 200)
+    failed_executions = total_executions - running_executions - finished_executions
+
+    # Mock user statistics
+    total_users = random.randint(50, 150)
+    active_users_24h = random.randint(10, 40)
+
+    # Mock system metrics
+    cpu_usage = random.randint(15, 85)
+    memory_usage = random.randint(30, 90)
+
+    return {
+        "data": {
+            "executions": {
+                "total": total_executions,
+                "running": running_executions,
+                "finished": finished_executions,
+                "failed": failed_executions,
+            },
+            "users": {
+                "total": total_users,
+                "active_24h": active_users_24h,
+            },
+            "system": {
+                "cpu_usage": cpu_usage,
+                "memory_usage": memory_usage,
+                "uptime": "15 days, 3 hours",
+                "version": "v2.1.0",
+            },
+            "last_updated": current_time.isoformat() + "Z",
+            "timestamp": current_time.isoformat() + "Z",
+        }
+    }
+
+
+def generate_mock_time_series_data(num_points: int = 24, rng=random) -> list[dict[str, Any]]:
+    """
+    Generate mock time series status data for charts.
+
+    Args:
+        num_points: Number of time series data points to generate
+        rng: Random source (the ``random`` module by default)
+
+    Returns:
+        List of time series status records
+    """
+    time_series = []
+    base_time = datetime.now() - timedelta(hours=num_points)
+
+    for i in range(num_points):
+        timestamp = base_time + timedelta(hours=i)
+        time_series.append(
+            {
+                "timestamp": timestamp.isoformat() + "Z",
+                "executions_active": rng.randint(5, 25),
+                "executions_finished": rng.randint(50, 150),
+                "executions_failed": rng.randint(2, 15),
+                "executions_queued": rng.randint(0, 10),
+                "executions_total": rng.randint(100, 250),
+                "users_active": rng.randint(10, 50),
+                "users_total": rng.randint(80, 200),
+                "scripts_count": rng.randint(15, 45),
+            }
+        )
+
+    return time_series
@@ -0,0 +1,11 @@
+"""Load-test harness that replays Dash callback traffic against a running UI.
+
+Run it with ``python -m tests.load --help``.
+"""
+
+from .client import DashClient
+from .runner import run_stage
+from .scenario import AdminSession
+from .stats import Recorder, StageReport
+
+__all__ = ["AdminSession", "DashClient", "Recorder", "StageReport", "run_stage"]
@@ -0,0 +1,123 @@
+"""Command line entry point: ``python -m tests.load``.
+
+By default this starts the mock API and the UI under ``gunicorn.conf.py``,
+then runs one stage per ``--users`` value and prints callbacks/s, latency
+percentiles per callback and worker saturation.  Pass ``--url`` to load an
+already running UI instead.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import shlex
+import sys
+import tempfile
+
+from .runner import (
+    gunicorn_worker_slots,
+    run_stage,
+    start_gunicorn,
+    start_mock_api,
+)
+from .stats import SUMMARY_HEADER
+
+
+def _user_counts(value: str) -> list[int]:
+    try:
+        counts = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected a comma-separated list of integers") from None
+    if not counts or min(counts) < 1:
+        raise argparse.ArgumentTypeError("user counts must be positive")
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--users",
+        type=_user_counts,
+        default=[1, 5, 10, 20],
+        help="concurrent admins per stage, e.g. '5,10,20,40' (default: %(default)s)",
+    )
+    parser.add_argument("--duration", type=float, default=60, help="seconds measured per stage")
+    parser.add_argument("--ramp-up", type=float, default=5, help="seconds to start all sessions")
+    parser.add_argument("--think-time", type=float, default=8, help="mean seconds between actions")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--email", default="loadtest@example.com")
+    parser.add_argument("--password", default="loadtest")
+    parser.add_argument("--json", type=Path, help="also write the stage reports to this file")
+
+    target = parser.add_argument_group("target")
+    target.add_argument("--url", help="load an already running UI instead of starting gunicorn")
+    target.add_argument(
+        "--worker-slots",
+        type=int,
+        default=1,
+        help="concurrent requests the --url server can run (workers x threads)",
+    )
+    target.add_argument("--bind", default="127.0.0.1:8050", help="gunicorn bind address")
+    target.add_argument("--workers", type=int, help="override gunicorn.conf.py workers")
+    target.add_argument("--worker-class", help="override gunicorn.conf.py worker_class")
+    target.add_argument("--threads", type=int, help="override gunicorn.conf.py threads")
+    target.add_argument("--mock-api-port", type=int, default=5055)
+    target.add_argument(
+        "--mock-api-args",
+        default="--latency lognormal:80,0.6",
+        help="extra arguments for python -m tests.mock_api (default: %(default)r)",
+    )
+    args = parser.parse_args(argv)
+
+    processes = []
+    master_pid = None
+    log = tempfile.NamedTemporaryFile(prefix="trendsearth-load-", suffix=".log", delete=False)  # noqa: SIM115
+    try:
+        if args.url:
+            base_url = args.url.rstrip("/")
+            worker_slots = args.worker_slots
+        else:
+            api_url = f"http://127.0.0.1:{args.mock_api_port}"
+            processes.append(
+                start_mock_api(args.mock_api_port, shlex.split(args.mock_api_args), log)
+            )
+            gunicorn = start_gunicorn(
+                args.bind, api_url, log, args.workers, args.worker_class, args.threads
+            )
+            processes.append(gunicorn)
+            master_pid = gunicorn.pid
+            base_url = f"http://{args.bind}"
+            worker_slots = gunicorn_worker_slots(args.workers, args.threads)
+            print(f"Mock API at {api_url}, UI at {base_url}; server logs in {log.name}")
+
+        reports = []
+        for users in args.users:
+            report = run_stage(
+                base_url,
+                users,
+                args.duration,
+                worker_slots,
+                args.email,
+                args.password,
+                think_time=args.think_time,
+                ramp_up=args.ramp_up,
+                seed=args.seed,
+                master_pid=master_pid,
+            )
+            reports.append(report)
+            print(report.format(), end="\n\n", flush=True)
+
+        print(SUMMARY_HEADER)
+        for report in reports:
+            print(report.summary_row())
+        if args.json:
+            args.json.write_text(json.dumps([report.to_dict() for report in reports], indent=2))
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            process.wait(timeout=30)
+        log.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
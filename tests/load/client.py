@@ -0,0 +1,206 @@
+"""A minimal stand-in for the Dash renderer that fires callbacks over HTTP.
+
+:class:`DashClient` loads ``/_dash-dependencies`` the way the browser does,
+keeps a per-session store of component property values and posts
+``/_dash-update-component`` requests for every server-side callback whose
+inputs include the property that changed.  Callback responses are written
+back into the store, so ``State`` values (table state, log context, tokens)
+come from what the app actually returned rather than from canned fixtures.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+import time
+from typing import Any
+
+import requests
+
+from .stats import Recorder
+
+_SERVER_TOTAL = re.compile(r"(?:^|,\s*)total;dur=([\d.]+)")
+
+
+def _prop_id(dependency: dict[str, str]) -> str:
+    return f"{dependency['id']}.{dependency['property']}"
+
+
+def _clean_property(prop: str) -> str:
+    """Strip the ``@hash`` suffix Dash adds to ``allow_duplicate`` outputs."""
+    return prop.split("@", 1)[0]
+
+
+def _split_output(output: str) -> list[dict[str, str]]:
+    """Split a callback's output string into ``{"id", "property"}`` specs."""
+    parts = output[2:-2].split("...") if output.startswith("..") else [output]
+    specs = []
+    for part in parts:
+        component_id, _, prop = part.rpartition(".")
+        specs.append({"id": component_id, "property": prop})
+    return specs
+
+
+def server_total_seconds(header: str | None) -> float | None:
+    """Return the ``total`` duration from a ``Server-Timing`` header, in seconds."""
+    if not header:
+        return None
+    match = _SERVER_TOTAL.search(header)
+    return float(match.group(1)) / 1000 if match else None
+
+
+@dataclass(frozen=True)
+class CallbackSpec:
+    """One server-side callback from ``/_dash-dependencies``."""
+
+    output: str
+    outputs: list[dict[str, str]]
+    inputs: list[dict[str, str]]
+    state: list[dict[str, str]]
+
+    @classmethod
+    def from_dependency(cls, dependency: dict[str, Any]) -> CallbackSpec:
+        return cls(
+            output=dependency["output"],
+            outputs=_split_output(dependency["output"]),
+            inputs=dependency["inputs"],
+            state=dependency["state"],
+        )
+
+    @property
+    def multi(self) -> bool:
+        return self.output.startswith("..")
+
+    def label(self, trigger: str) -> str:
+        """Report name: the triggering property and the first output component."""
+        return f"{trigger} -> {self.outputs[0]['id']}"
+
+
+def parse_callback_specs(dependencies: list[dict[str, Any]]) -> list[CallbackSpec]:
+    """Build specs from ``/_dash-dependencies``, skipping clientside and pattern-matching callbacks."""
+    specs = []
+    for dependency in dependencies:
+        if dependency.get("clientside_function") or "{" in dependency["output"]:
+            continue
+        if not all(isinstance(d["id"], str) for d in dependency["inputs"] + dependency["state"]):
+            continue
+        specs.append(CallbackSpec.from_dependency(dependency))
+    return specs
+
+
+class DashClient:
+    """One simulated browser session against a running UI."""
+
+    def __init__(
+        self,
+        base_url: str,
+        recorder: Recorder,
+        timeout: float = 120,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.store: dict[str, Any] = {}
+        self._by_input: dict[str, list[CallbackSpec]] = {}
+
+    def _index(self, specs: list[CallbackSpec]) -> None:
+        self._by_input = {}
+        for spec in specs:
+            for dependency in spec.inputs:
+                self._by_input.setdefault(_prop_id(dependency), []).append(spec)
+
+    def load_page(self) -> None:
+        """Fetch the page shell, layout and callback graph like a fresh browser tab."""
+        for path in ("/", "/_dash-layout"):
+            self._timed_get(path)
+        response = self._timed_get("/_dash-dependencies")
+        if response is not None and response.ok:
+            self._index(parse_callback_specs(response.json()))
+
+    def _timed_get(self, path: str) -> requests.Response | None:
+        started = time.perf_counter()
+        try:
+            response = self.session.get(f"{self.base_url}{path}", timeout=self.timeout)
+        except requests.RequestException:
+            self.recorder.record(f"GET {path}", time.perf_counter() - started, 0)
+            return None
+        self.recorder.record(
+            f"GET {path}",
+            time.perf_counter() - started,
+            response.status_code,
+            server_total_seconds(response.headers.get("Server-Timing")),
+        )
+        return response
+
+    def set(self, prop_id: str, value: Any) -> None:
+        """Set a property without firing callbacks (e.g. typing into an input)."""
+        self.store[prop_id] = value
+
+    def trigger(self, prop_id: str, value: Any, only: tuple[str, ...] = ()) -> int:
+        """Change *prop_id* and fire every callback that takes it as an input.
+
+        *only* restricts dispatch to callbacks whose first output component is
+        listed.  Returns the number of requests sent.
+        """
+        return self.update({prop_id: value}, only)
+
+    def update(self, changes: dict[str, Any], only: tuple[str, ...] = ()) -> int:
+        """Apply several property changes at once, firing each affected callback once.
+
+        This mirrors the renderer batching changes that land in the same
+        frame, such as the token, role and user stores being set by login.
+        """
+        self.store.update(changes)
+        specs: list[CallbackSpec] = []
+        for prop_id in changes:
+            for spec in self._by_input.get(prop_id, []):
+                if spec not in specs and (not only or spec.outputs[0]["id"] in only):
+                    specs.append(spec)
+        for spec in specs:
+            changed = [_prop_id(d) for d in spec.inputs if _prop_id(d) in changes]
+            self._dispatch(spec, changed)
+        return len(specs)
+
+    def _payload(self, spec: CallbackSpec, changed: list[str]) -> dict[str, Any]:
+        def with_values(dependencies):
+            return [
+                {**dependency, "value": self.store.get(_prop_id(dependency))}
+                for dependency in dependencies
+            ]
+
+        return {
+            "output": spec.output,
+            "outputs": spec.outputs if spec.multi else spec.outputs[0],
+            "inputs": with_values(spec.inputs),
+            "state": with_values(spec.state),
+            "changedPropIds": changed,
+        }
+
+    def _dispatch(self, spec: CallbackSpec, changed: list[str]) -> None:
+        label = spec.label(changed[0])
+        started = time.perf_counter()
+        try:
+            response = self.session.post(
+                f"{self.base_url}/_dash-update-component",
+                json=self._payload(spec, changed),
+                timeout=self.timeout,
+            )
+        except requests.RequestException:
+            self.recorder.record(label, time.perf_counter() - started, 0)
+            return
+        elapsed = time.perf_counter() - started
+        self.recorder.record(
+            label,
+            elapsed,
+            response.status_code,
+            server_total_seconds(response.headers.get("Server-Timing")),
+            len(response.content),
+        )
+        if response.status_code == 200:
+            self._apply(response.json())
+
+    def _apply(self, body: dict[str, Any]) -> None:
+        for component_id, props in body.get("response", {}).items():
+            for prop, value in props.items():
+                self.store[f"{component_id}.{_clean_property(prop)}"] = value
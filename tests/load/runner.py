@@ -0,0 +1,215 @@
+"""Drive load stages and, optionally, the processes under test.
+
+:func:`run_stage` starts one :class:`~tests.load.scenario.AdminSession`
+thread per simulated admin and returns a :class:`~tests.load.stats.StageReport`.
+:func:`start_mock_api` and :func:`start_gunicorn` launch the mock API and the
+UI under the repository's ``gunicorn.conf.py`` as subprocesses, and
+:class:`WorkerSampler` reads worker CPU time from ``/proc`` while a stage runs.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import random
+import runpy
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+from .client import DashClient
+from .scenario import AdminSession
+from .stats import Recorder, StageReport
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GUNICORN_CONF = REPO_ROOT / "gunicorn.conf.py"
+
+
+def wait_for(url: str, timeout: float = 60) -> None:
+    """Poll *url* until it answers (any status) or *timeout* seconds pass."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            requests.get(url, timeout=2)
+            return
+        except requests.RequestException:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout:.0f}s") from None
+            time.sleep(0.25)
+
+
+def start_mock_api(port: int, extra_args: list[str], log) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "tests.mock_api", "--port", str(port), *extra_args],
+        cwd=REPO_ROOT,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    wait_for(f"http://127.0.0.1:{port}/__mock__/config")
+    return process
+
+
+def start_gunicorn(
+    bind: str,
+    api_url: str,
+    log,
+    workers: int | None = None,
+    worker_class: str | None = None,
+    threads: int | None = None,
+) -> subprocess.Popen:
+    """Run ``trendsearth_ui.app:server`` under ``gunicorn.conf.py`` against *api_url*.
+
+    ``--workers``/``--worker-class``/``--threads`` override the config file
+    only when given, so the default run measures the deployed settings.
+    """
+    command = [sys.executable, "-m", "gunicorn", "-c", str(GUNICORN_CONF), "--bind", bind]
+    if workers is not None:
+        command += ["--workers", str(workers)]
+    if worker_class is not None:
+        command += ["--worker-class", worker_class]
+    if threads is not None:
+        command += ["--threads", str(threads)]
+    command.append("trendsearth_ui.app:server")
+
+    env = {
+        **os.environ,
+        "LOCAL_API_URL": api_url,
+        "FORCE_API_ENVIRONMENT": "local",
+        "SERVER_TIMING_ENABLED": "true",
+    }
+    process = subprocess.Popen(
+        command, cwd=REPO_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT
+    )
+    wait_for(f"http://{bind}/api-ui-health", timeout=120)
+    return process
+
+
+def gunicorn_worker_slots(workers: int | None, threads: int | None) -> int:
+    """Requests the server can run at once: workers × threads, from flags or the config."""
+    settings = runpy.run_path(str(GUNICORN_CONF))
+    workers = workers or settings.get("workers", 1)
+    threads = threads or settings.get("threads", 1)
+    return workers * threads
+
+
+class WorkerSampler:
+    """Sample per-worker CPU utilisation of a gunicorn master's children (Linux only)."""
+
+    def __init__(self, master_pid: int, interval: float = 1.0) -> None:
+        self.master_pid = master_pid
+        self.interval = interval
+        self.samples: dict[int, list[float]] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._ticks_per_second = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    @staticmethod
+    def available() -> bool:
+        return Path("/proc/self/stat").exists()
+
+    def _children(self) -> list[int]:
+        pids = []
+        for stat in Path("/proc").glob("[0-9]*/stat"):
+            try:
+                fields = stat.read_text().rsplit(")", 1)[1].split()
+            except OSError:
+                continue
+            if int(fields[1]) == self.master_pid:
+                pids.append(int(stat.parent.name))
+        return pids
+
+    def _cpu_seconds(self, pid: int) -> float | None:
+        try:
+            fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            return None
+        # utime and stime are fields 14 and 15 of /proc/<pid>/stat.
+        return (int(fields[11]) + int(fields[12])) / self._ticks_per_second
+
+    def _run(self) -> None:
+        previous: dict[int, float] = {}
+        while not self._stop.wait(self.interval):
+            for pid in self._children():
+                cpu = self._cpu_seconds(pid)
+                if cpu is None:
+                    continue
+                if pid in previous:
+                    utilisation = (cpu - previous[pid]) / self.interval * 100
+                    self.samples.setdefault(pid, []).append(utilisation)
+                previous[pid] = cpu
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> dict[int, tuple[float, float]]:
+        """Stop sampling; return ``{pid: (average %, peak %)}``."""
+        self._stop.set()
+        self._thread.join()
+        return {
+            pid: (sum(values) / len(values), max(values))
+            for pid, values in self.samples.items()
+            if values
+        }
+
+
+def run_stage(
+    base_url: str,
+    users: int,
+    duration: float,
+    worker_slots: int,
+    email: str,
+    password: str,
+    think_time: float = 8.0,
+    ramp_up: float = 5.0,
+    seed: int | None = None,
+    master_pid: int | None = None,
+) -> StageReport:
+    """Run *users* concurrent admin sessions for *duration* seconds after ramp-up.
+
+    Sessions start evenly over *ramp_up* seconds; only traffic after the
+    ramp-up counts towards the report.
+    """
+    recorder = Recorder()
+    rng = random.Random(seed)
+    started = time.monotonic()
+    measure_from = started + ramp_up
+    stop_at = measure_from + duration
+
+    sessions = [
+        AdminSession(
+            DashClient(base_url, recorder),
+            email,
+            password,
+            think_time=think_time,
+            rng=random.Random(rng.random()),
+        )
+        for _ in range(users)
+    ]
+    threads = []
+    for index, session in enumerate(sessions):
+        thread = threading.Thread(target=session.run, args=(stop_at,), daemon=True)
+        threads.append(thread)
+        delay = started + ramp_up * index / max(users, 1) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        thread.start()
+
+    sampler = None
+    time.sleep(max(0.0, measure_from - time.monotonic()))
+    if master_pid and WorkerSampler.available():
+        sampler = WorkerSampler(master_pid)
+        sampler.start()
+
+    for thread in threads:
+        thread.join()
+    ended = time.monotonic()
+
+    report = StageReport.build(
+        recorder.window(measure_from, ended), users, ended - measure_from, worker_slots
+    )
+    if sampler is not None:
+        report.worker_cpu = sampler.stop()
+    return report
@@ -0,0 +1,238 @@
+"""A simulated admin session: the callback traffic one open browser tab produces.
+
+Each :class:`AdminSession` logs in, renders the dashboard and then runs a
+small event loop mixing user actions with the timers the page itself runs:
+
+* user actions every ``think_time`` seconds on average – tab switches, grid
+  scrolling (one ``getRowsRequest`` per 50-row block), opening a log modal,
+  clicking the status refresh button;
+* ``dcc.Interval`` ticks while the relevant component is mounted – the 1s
+  countdowns, the 30s executions auto-refresh, the status auto-refresh and
+  the 10s log modal polling.
+
+The intervals come from ``trendsearth_ui.config`` so the traffic tracks the
+app's real settings.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import time
+
+from trendsearth_ui.config import (
+    EXECUTIONS_REFRESH_INTERVAL,
+    LOGS_REFRESH_INTERVAL,
+    STATUS_REFRESH_INTERVAL,
+)
+
+from .client import DashClient
+
+BLOCK_SIZE = 50
+GRID_TABLES = {"executions": "executions-table", "users": "users-table", "scripts": "scripts-table"}
+TABS = ["executions", "users", "scripts", "status"]
+
+# (action, relative weight) for the user-driven half of the traffic.
+ACTIONS = [
+    ("switch_tab", 3),
+    ("scroll_grid", 5),
+    ("open_logs", 2),
+    ("close_logs", 1),
+    ("refresh_status", 1),
+]
+
+# Timer name -> (period in seconds, property whose n_intervals it increments).
+TIMERS = {
+    "executions-countdown": (1.0, "executions-countdown-interval.n_intervals"),
+    "executions-auto-refresh": (
+        EXECUTIONS_REFRESH_INTERVAL / 1000,
+        "executions-auto-refresh-interval.n_intervals",
+    ),
+    "status-countdown": (1.0, "status-countdown-interval.n_intervals"),
+    "status-auto-refresh": (
+        STATUS_REFRESH_INTERVAL / 1000,
+        "status-auto-refresh-interval.n_intervals",
+    ),
+    "logs-countdown": (1.0, "logs-countdown-interval.n_intervals"),
+    "logs-poll": (LOGS_REFRESH_INTERVAL / 1000, "logs-refresh-interval.n_intervals"),
+}
+TAB_TIMERS = {
+    "executions": ("executions-countdown", "executions-auto-refresh"),
+    "status": ("status-countdown", "status-auto-refresh"),
+}
+MODAL_TIMERS = ("logs-countdown", "logs-poll")
+
+
+class AdminSession:
+    """One logged-in admin with the dashboard open until *stop_at* (monotonic)."""
+
+    def __init__(
+        self,
+        client: DashClient,
+        email: str,
+        password: str,
+        think_time: float = 8.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.client = client
+        self.email = email
+        self.password = password
+        self.think_time = think_time
+        self.rng = rng or random.Random()
+        self.tab = "executions"
+        self.modal_open = False
+        self._timers: list[tuple[float, int, str, int]] = []
+        self._order = itertools.count()
+        self._ticks: dict[str, int] = {}
+        self._generations: dict[str, int] = {}
+        self._clicks: dict[str, int] = {}
+
+    # -- timers -----------------------------------------------------------
+
+    def _schedule(self, name: str, delay: float) -> None:
+        generation = self._generations.get(name, 0)
+        heapq.heappush(
+            self._timers, (time.monotonic() + delay, next(self._order), name, generation)
+        )
+
+    def _active_timers(self) -> set[str]:
+        active = set(TAB_TIMERS.get(self.tab, ()))
+        if self.modal_open:
+            active.update(MODAL_TIMERS)
+        return active
+
+    def _start_timers(self, names) -> None:
+        # Timers restart from zero when their component is remounted; bumping
+        # the generation drops ticks still queued from the previous mount.
+        for name in names:
+            self._ticks[name] = 0
+            self._generations[name] = self._generations.get(name, 0) + 1
+            self._schedule(name, TIMERS[name][0])
+
+    def _tick(self, name: str, generation: int) -> None:
+        if name not in self._active_timers() or generation != self._generations[name]:
+            return
+        period, prop_id = TIMERS[name]
+        self._ticks[name] += 1
+        self.client.trigger(prop_id, self._ticks[name])
+        self._schedule(name, period)
+
+    def _click(self, component_id: str) -> None:
+        self._clicks[component_id] = self._clicks.get(component_id, 0) + 1
+        self.client.trigger(f"{component_id}.n_clicks", self._clicks[component_id])
+
+    # -- scripted steps ---------------------------------------------------
+
+    def login(self) -> bool:
+        """Load the page and sign in; returns False if no token came back."""
+        client = self.client
+        client.load_page()
+        client.set("url.pathname", "/")
+        client.set("url.search", "")
+        client.set("user-timezone-store.data", "UTC")
+        client.set("login-email.value", self.email)
+        client.set("login-password.value", self.password)
+        client.set("remember-me-checkbox.value", [])
+        self._click("login-btn")
+        if not client.store.get("token-store.data"):
+            return False
+        client.update(
+            {
+                "token-store.data": client.store["token-store.data"],
+                "role-store.data": client.store.get("role-store.data"),
+                "user-store.data": client.store.get("user-store.data"),
+            }
+        )
+        self.show_tab("executions")
+        return True
+
+    def show_tab(self, tab: str) -> None:
+        self.tab = tab
+        self._click(f"{tab}-tab-btn")
+        self.client.trigger("active-tab-store.data", self.client.store.get("active-tab-store.data"))
+        if tab in GRID_TABLES:
+            self.request_block(GRID_TABLES[tab], 0)
+        elif tab == "status":
+            self.client.update(
+                {
+                    "status-time-tabs-store.data": "day",
+                    "status-auto-refresh-interval.n_intervals": 0,
+                    "status-countdown-interval.n_intervals": 0,
+                }
+            )
+        self._start_timers(TAB_TIMERS.get(tab, ()))
+
+    def request_block(self, table_id: str, block: int) -> None:
+        self.client.trigger(
+            f"{table_id}.getRowsRequest",
+            {
+                "startRow": block * BLOCK_SIZE,
+                "endRow": (block + 1) * BLOCK_SIZE,
+                "sortModel": [],
+                "filterModel": {},
+            },
+        )
+
+    # -- user actions -----------------------------------------------------
+
+    def switch_tab(self) -> None:
+        self.modal_open = False
+        self.show_tab(self.rng.choice([tab for tab in TABS if tab != self.tab]))
+
+    def scroll_grid(self) -> None:
+        if self.tab not in GRID_TABLES:
+            self.switch_tab()
+            return
+        # Mostly the first few blocks, occasionally a deep scroll.
+        block = min(int(self.rng.expovariate(0.5)), 200)
+        self.request_block(GRID_TABLES[self.tab], block)
+
+    def open_logs(self) -> None:
+        if self.tab != "executions" or self.modal_open:
+            self.scroll_grid()
+            return
+        response = self.client.store.get("executions-table.getRowsResponse") or {}
+        rows = response.get("rowData") or []
+        if not rows:
+            return
+        row_index = self.rng.randrange(len(rows))
+        self.client.trigger(
+            "executions-table.cellClicked",
+            {"colId": "logs", "rowIndex": row_index, "value": "Logs", "data": rows[row_index]},
+        )
+        if self.client.store.get("json-modal.is_open"):
+            self.modal_open = True
+            self.client.trigger("json-modal.is_open", True)
+            self._start_timers(MODAL_TIMERS)
+
+    def close_logs(self) -> None:
+        if not self.modal_open:
+            self.scroll_grid()
+            return
+        self.modal_open = False
+        self.client.trigger("json-modal.is_open", False)
+
+    def refresh_status(self) -> None:
+        if self.tab != "status":
+            self.show_tab("status")
+            return
+        self._click("refresh-status-btn")
+
+    # -- main loop --------------------------------------------------------
+
+    def run(self, stop_at: float) -> None:
+        if not self.login():
+            return
+        names, weights = zip(*ACTIONS, strict=True)
+        self._schedule("action", self.rng.expovariate(1 / self.think_time))
+        while self._timers:
+            due, _, name, generation = heapq.heappop(self._timers)
+            if due >= stop_at:
+                return
+            time.sleep(max(0.0, due - time.monotonic()))
+            if name == "action":
+                getattr(self, self.rng.choices(names, weights)[0])()
+                self._schedule("action", self.rng.expovariate(1 / self.think_time))
+            else:
+                self._tick(name, generation)
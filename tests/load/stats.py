@@ -0,0 +1,191 @@
+"""Latency samples and the per-callback report for load runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from threading import Lock
+import time
+
+
+@dataclass
+class Sample:
+    label: str
+    finished: float
+    latency: float
+    status: int
+    server_seconds: float | None = None
+    response_bytes: int = 0
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of *values* (which must be sorted)."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+class Recorder:
+    """Thread-safe collector shared by every simulated session in a run."""
+
+    def __init__(self) -> None:
+        self.samples: list[Sample] = []
+        self._lock = Lock()
+
+    def record(
+        self,
+        label: str,
+        latency: float,
+        status: int,
+        server_seconds: float | None = None,
+        response_bytes: int = 0,
+    ) -> None:
+        sample = Sample(label, time.monotonic(), latency, status, server_seconds, response_bytes)
+        with self._lock:
+            self.samples.append(sample)
+
+    def window(self, started: float, ended: float) -> list[Sample]:
+        """Samples whose response arrived between *started* and *ended* (monotonic)."""
+        with self._lock:
+            return [s for s in self.samples if started <= s.finished <= ended]
+
+
+@dataclass
+class CallbackStats:
+    label: str
+    count: int
+    errors: int
+    per_second: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    avg_kb: float
+
+
+@dataclass
+class StageReport:
+    """Aggregate numbers for one load stage (a fixed number of concurrent users)."""
+
+    users: int
+    duration: float
+    worker_slots: int
+    callbacks: list[CallbackStats] = field(default_factory=list)
+    total: int = 0
+    errors: int = 0
+    per_second: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    busy_fraction: float | None = None
+    queue_p95: float | None = None
+    worker_cpu: dict[int, tuple[float, float]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, samples: list[Sample], users: int, duration: float, worker_slots: int
+    ) -> StageReport:
+        report = cls(users=users, duration=duration, worker_slots=worker_slots)
+        callbacks = [s for s in samples if not s.label.startswith("GET ")]
+        by_label: dict[str, list[Sample]] = {}
+        for sample in callbacks:
+            by_label.setdefault(sample.label, []).append(sample)
+
+        for label, group in by_label.items():
+            latencies = sorted(s.latency for s in group)
+            report.callbacks.append(
+                CallbackStats(
+                    label=label,
+                    count=len(group),
+                    errors=sum(1 for s in group if s.status not in (200, 204)),
+                    per_second=len(group) / duration,
+                    p50=percentile(latencies, 50),
+                    p95=percentile(latencies, 95),
+                    p99=percentile(latencies, 99),
+                    max=latencies[-1],
+                    avg_kb=sum(s.response_bytes for s in group) / len(group) / 1024,
+                )
+            )
+        report.callbacks.sort(key=lambda stats: stats.count * stats.p50, reverse=True)
+
+        latencies = sorted(s.latency for s in callbacks)
+        report.total = len(callbacks)
+        report.errors = sum(stats.errors for stats in report.callbacks)
+        report.per_second = len(callbacks) / duration
+        report.p50 = percentile(latencies, 50)
+        report.p95 = percentile(latencies, 95)
+        report.p99 = percentile(latencies, 99)
+
+        # Server-Timing "total" is time spent inside Flask; the rest of the
+        # client-observed latency is mostly waiting for a free worker.
+        timed = [s for s in samples if s.server_seconds is not None]
+        if timed:
+            busy = sum(s.server_seconds for s in timed)
+            report.busy_fraction = busy / (duration * worker_slots)
+            report.queue_p95 = percentile(
+                sorted(max(0.0, s.latency - s.server_seconds) for s in timed), 95
+            )
+        return report
+
+    def format(self) -> str:
+        lines = [
+            f"=== {self.users} concurrent users, {self.duration:.0f}s ===",
+            f"{'callback':<72} {'calls':>6} {'/s':>6} {'p50ms':>7} {'p95ms':>7} "
+            f"{'p99ms':>7} {'maxms':>7} {'err':>4} {'KB':>7}",
+        ]
+        for stats in self.callbacks:
+            lines.append(
+                f"{stats.label[:72]:<72} {stats.count:>6} {stats.per_second:>6.2f} "
+                f"{stats.p50 * 1000:>7.0f} {stats.p95 * 1000:>7.0f} {stats.p99 * 1000:>7.0f} "
+                f"{stats.max * 1000:>7.0f} {stats.errors:>4} {stats.avg_kb:>7.1f}"
+            )
+        lines.append(
+            f"all callbacks: {self.total} calls, {self.per_second:.2f}/s, "
+            f"p50 {self.p50 * 1000:.0f} ms, p95 {self.p95 * 1000:.0f} ms, "
+            f"p99 {self.p99 * 1000:.0f} ms, {self.errors} errors"
+        )
+        lines.append(self.saturation_line())
+        return "\n".join(lines)
+
+    def saturation_line(self) -> str:
+        parts = []
+        if self.busy_fraction is not None:
+            parts.append(
+                f"worker busy {self.busy_fraction:.0%} of {self.worker_slots} slot(s), "
+                f"queue wait p95 {self.queue_p95 * 1000:.0f} ms"
+            )
+        else:
+            parts.append("worker busy n/a (Server-Timing disabled)")
+        for pid, (avg, peak) in sorted(self.worker_cpu.items()):
+            parts.append(f"pid {pid} cpu avg {avg:.0f}% peak {peak:.0f}%")
+        return "saturation: " + "; ".join(parts)
+
+    def summary_row(self) -> str:
+        busy = f"{self.busy_fraction:.0%}" if self.busy_fraction is not None else "n/a"
+        queue = f"{self.queue_p95 * 1000:.0f}" if self.queue_p95 is not None else "n/a"
+        return (
+            f"{self.users:>6} {self.per_second:>8.2f} {self.p50 * 1000:>7.0f} "
+            f"{self.p95 * 1000:>7.0f} {self.p99 * 1000:>7.0f} {self.errors:>6} "
+            f"{busy:>6} {queue:>9}"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "users": self.users,
+            "duration": self.duration,
+            "worker_slots": self.worker_slots,
+            "total": self.total,
+            "errors": self.errors,
+            "per_second": self.per_second,
+            "p50": self.p50,
+            "p95": self.p95,
+            "p99": self.p99,
+            "busy_fraction": self.busy_fraction,
+            "queue_p95": self.queue_p95,
+            "worker_cpu": {str(pid): list(cpu) for pid, cpu in self.worker_cpu.items()},
+            "callbacks": [vars(stats) for stats in self.callbacks],
+        }
+
+
+SUMMARY_HEADER = f"{'users':>6} {'cb/s':>8} {'p50ms':>7} {'p95ms':>7} {'p99ms':>7} {'errors':>6} {'busy':>6} {'queue95ms':>9}"
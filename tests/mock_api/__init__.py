@@ -0,0 +1,8 @@
+"""Standalone mock of the Trends.Earth API for load and latency testing.
+
+Run it with ``python -m tests.mock_api --help``.
+"""
+
+from .server import FAMILIES, LatencyModel, MockAPIConfig, create_app
+
+__all__ = ["FAMILIES", "LatencyModel", "MockAPIConfig", "create_app"]
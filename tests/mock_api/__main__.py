@@ -0,0 +1,65 @@
+"""Command line entry point: ``python -m tests.mock_api``."""
+
+import argparse
+
+from werkzeug.serving import run_simple
+
+from .server import FAMILIES, LatencyModel, MockAPIConfig, create_app
+
+
+def _latency_override(value: str) -> tuple[str, LatencyModel]:
+    family, _, spec = value.partition("=")
+    if family not in FAMILIES or not spec:
+        raise argparse.ArgumentTypeError(f"expected FAMILY=SPEC with FAMILY in {FAMILIES}")
+    return family, LatencyModel(spec)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--executions", type=int, default=MockAPIConfig.executions)
+    parser.add_argument("--users", type=int, default=MockAPIConfig.users)
+    parser.add_argument("--scripts", type=int, default=MockAPIConfig.scripts)
+    parser.add_argument("--log-lines", type=int, default=MockAPIConfig.log_lines)
+    parser.add_argument("--seed", type=int, default=MockAPIConfig.seed)
+    parser.add_argument(
+        "--latency",
+        type=LatencyModel,
+        default=LatencyModel(),
+        help="default latency, e.g. 'lognormal:80,0.6' or 'uniform:20,200' (ms)",
+    )
+    parser.add_argument(
+        "--family-latency",
+        type=_latency_override,
+        action="append",
+        default=[],
+        metavar="FAMILY=SPEC",
+        help="per endpoint family latency, e.g. 'stats=normal:900,200' (repeatable)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-seconds", type=float, default=MockAPIConfig.timeout_seconds)
+    args = parser.parse_args(argv)
+
+    config = MockAPIConfig(
+        executions=args.executions,
+        users=args.users,
+        scripts=args.scripts,
+        log_lines=args.log_lines,
+        seed=args.seed,
+        latency=dict(args.family_latency),
+        default_latency=args.latency,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds,
+    )
+    print(
+        f"Mock Trends.Earth API on http://{args.host}:{args.port} - point the UI at it with\n"
+        f"  LOCAL_API_URL=http://{args.host}:{args.port} FORCE_API_ENVIRONMENT=local"
+    )
+    run_simple(args.host, args.port, create_app(config), threaded=True)
+
+
+if __name__ == "__main__":
+    main()
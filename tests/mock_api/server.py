@@ -0,0 +1,528 @@
+"""Flask stand-in for the Trends.Earth API used for load and latency testing.
+
+The app serves the endpoints the UI calls (auth, ``/execution``, ``/user``,
+``/script``, ``/status``, ``/stats/*``, execution/script logs and
+``/data/boundaries``) from the generators in :mod:`tests.fixtures.mock_data`
+and :mod:`tests.fixtures.sample_data`.  Rows are derived from their index with
+a per-row seed, so tables of millions of executions cost nothing until a page
+is requested, and the same page is identical across requests.
+
+Latency and failures are configurable per endpoint family, at start-up or at
+runtime through ``/__mock__/config``:
+
+* latency specs: ``0``, ``fixed:50``, ``uniform:20,200``, ``normal:100,30``,
+  ``lognormal:80,0.6`` (median and sigma) – all in milliseconds;
+* ``error_rate`` – fraction of requests answered with one of ``error_statuses``;
+* ``timeout_rate`` – fraction of requests that stall for ``timeout_seconds``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+import json
+from pathlib import Path
+import random
+import threading
+import time
+from typing import Any
+import uuid
+
+from flask import Flask, abort, jsonify, request
+
+from tests.fixtures.mock_data import (
+    EXECUTION_STATUSES,
+    USER_COUNTRIES,
+    generate_mock_status_data,
+    mock_execution,
+    mock_script,
+    mock_user,
+)
+from tests.fixtures.sample_data import (
+    SAMPLE_ERROR_LOGS,
+    SAMPLE_EXECUTION,
+    SAMPLE_FINISHED_EXECUTION,
+    SAMPLE_LOGS,
+)
+
+API_PREFIX = "/api/v1"
+FAMILIES = ("auth", "execution", "user", "script", "status", "stats", "logs", "boundaries")
+MAX_PER_PAGE = 20_000
+
+PERIOD_SECONDS = {
+    "last_day": 86_400,
+    "last_week": 7 * 86_400,
+    "last_month": 30 * 86_400,
+    "last_year": 365 * 86_400,
+    "all": 5 * 365 * 86_400,
+}
+COUNTRIES = json.loads(
+    (Path(__file__).parents[2] / "trendsearth_ui" / "data" / "countries_fallback.json").read_text(
+        encoding="utf-8"
+    )
+)
+
+GROUP_BY_SECONDS = {"hour": 3_600, "day": 86_400, "week": 7 * 86_400, "month": 30 * 86_400}
+
+
+class LatencyModel:
+    """Samples a response delay, in seconds, from a distribution spec."""
+
+    KINDS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, spec: str | float | int = 0) -> None:
+        self.spec = str(spec)
+        kind, _, raw_args = self.spec.partition(":")
+        if not raw_args:
+            kind, raw_args = "fixed", kind
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution {kind!r} in {self.spec!r}")
+        self.kind = kind
+        self.args = [float(value) for value in raw_args.split(",") if value]
+        expected = 1 if kind == "fixed" else 2
+        if len(self.args) != expected:
+            raise ValueError(f"{kind} latency takes {expected} value(s), got {self.spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        a = self.args[0]
+        if self.kind == "fixed":
+            millis = a
+        elif self.kind == "uniform":
+            millis = rng.uniform(a, self.args[1])
+        elif self.kind == "normal":
+            millis = rng.gauss(a, self.args[1])
+        else:
+            millis = rng.lognormvariate(0, self.args[1]) * a
+        return max(millis, 0.0) / 1000
+
+    def __str__(self) -> str:
+        return self.spec
+
+
+@dataclass
+class MockAPIConfig:
+    """Data volumes and fault injection for the mock API."""
+
+    executions: int = 100_000
+    users: int = 5_000
+    scripts: int = 200
+    log_lines: int = 200
+    status_interval_seconds: int = 60
+    seed: int = 1
+    latency: dict[str, LatencyModel] = field(default_factory=dict)
+    default_latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (500, 502, 503, 504)
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 30.0
+
+    def latency_for(self, family: str) -> LatencyModel:
+        return self.latency.get(family, self.default_latency)
+
+    def update(self, values: dict[str, Any]) -> None:
+        """Apply a partial update such as the JSON body of ``POST /__mock__/config``."""
+        for key, value in values.items():
+            if key == "latency":
+                for family, spec in value.items():
+                    if family == "default":
+                        self.default_latency = LatencyModel(spec)
+                    elif family in FAMILIES:
+                        self.latency[family] = LatencyModel(spec)
+                    else:
+                        raise ValueError(f"Unknown endpoint family {family!r}")
+            elif key == "error_statuses":
+                self.error_statuses = tuple(int(status) for status in value)
+            elif key in self.__dataclass_fields__:
+                setattr(self, key, type(getattr(self, key))(value))
+            else:
+                raise ValueError(f"Unknown setting {key!r}")
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["latency"] = {family: str(model) for family, model in self.latency.items()}
+        data["latency"]["default"] = str(self.default_latency)
+        data.pop("default_latency")
+        return data
+
+
+def _row_rng(seed: int, kind: str, index: int) -> random.Random:
+    return random.Random(f"{seed}:{kind}:{index}")
+
+
+def _paginate() -> tuple[int, int]:
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", 20, type=int), 1), MAX_PER_PAGE)
+    return page, per_page
+
+
+def _page_response(build, total: int) -> dict[str, Any]:
+    """Build one page of an index-addressed table, honouring ``-field`` sort order."""
+    page, per_page = _paginate()
+    first = (page - 1) * per_page
+    indices = range(first, min(first + per_page, total))
+    if request.args.get("sort", "").startswith("-"):
+        indices = [total - 1 - i for i in indices]
+    return {"data": [build(i) for i in indices], "total": total, "page": page, "per_page": per_page}
+
+
+def _status_filter(raw: str | None) -> list[str] | None:
+    """Statuses requested through ``status=`` or a ``filter=status='X'`` clause."""
+    if raw:
+        return [status for status in raw.upper().split(",") if status in EXECUTION_STATUSES]
+    clause = request.args.get("filter", "")
+    selected = [status for status in EXECUTION_STATUSES if f"status='{status}'" in clause]
+    return selected or None
+
+
+def _status_record(moment: datetime, seed: int) -> dict[str, Any]:
+    rng = random.Random(f"{seed}:status:{int(moment.timestamp())}")
+    running = rng.randint(0, 120)
+    ready = rng.randint(0, 40)
+    pending = rng.randint(0, 30)
+    return {
+        "id": int(moment.timestamp()),
+        "timestamp": moment.isoformat(),
+        "executions_active": running + ready + pending,
+        "executions_running": running,
+        "executions_ready": ready,
+        "executions_pending": pending,
+        "executions_finished": rng.randint(0, 400),
+        "executions_failed": rng.randint(0, 40),
+        "executions_cancelled": rng.randint(0, 10),
+        "executions_count": 1_000_000 + int(moment.timestamp()) // 60,
+        "users_count": 50_000 + int(moment.timestamp()) // 3_600,
+        "scripts_count": 180,
+    }
+
+
+def _parse_time(value: str | None, default: datetime) -> datetime:
+    if not value:
+        return default
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def create_app(config: MockAPIConfig | None = None) -> Flask:
+    """Create the mock API app; ``app.config["MOCK_API"]`` holds the live config."""
+    config = config or MockAPIConfig()
+    app = Flask(__name__)
+    app.config["MOCK_API"] = config
+    fault_rng = random.Random(config.seed)
+    fault_lock = threading.Lock()
+
+    def family_of(path: str) -> str | None:
+        if path.startswith("/auth"):
+            return "auth"
+        if not path.startswith(API_PREFIX):
+            return None
+        parts = path[len(API_PREFIX) :].strip("/").split("/")
+        if parts[-1] in ("log", "docker-logs", "batch-logs"):
+            return "logs"
+        if parts[0] == "data":
+            return "boundaries"
+        return parts[0] if parts[0] in FAMILIES else None
+
+    @app.before_request
+    def inject_faults():
+        family = family_of(request.path)
+        if family is None:
+            return None
+        with fault_lock:
+            delay = config.latency_for(family).sample(fault_rng)
+            roll = fault_rng.random()
+            error_status = fault_rng.choice(config.error_statuses or (500,))
+        if roll < config.timeout_rate:
+            delay = max(delay, config.timeout_seconds)
+        if delay:
+            time.sleep(delay)
+        if config.timeout_rate <= roll < config.timeout_rate + config.error_rate:
+            return jsonify({"error": "Injected failure", "status": error_status}), error_status
+        if family != "auth" and not request.headers.get("Authorization", "").startswith("Bearer "):
+            return jsonify({"msg": "Missing Authorization Header"}), 401
+        return None
+
+    # -- Mock control -------------------------------------------------------
+
+    @app.route("/__mock__/config", methods=["GET", "POST"])
+    def mock_config():
+        if request.method == "POST":
+            try:
+                config.update(request.get_json(force=True) or {})
+            except (TypeError, ValueError) as exc:
+                return jsonify({"error": str(exc)}), 400
+        return jsonify(config.to_dict())
+
+    # -- Auth ---------------------------------------------------------------
+
+    def _tokens() -> dict[str, Any]:
+        return {
+            "access_token": f"mock-access-{uuid.uuid4().hex}",
+            "refresh_token": f"mock-refresh-{uuid.uuid4().hex}",
+            "expires_in": 3600,
+            "token_type": "Bearer",
+        }
+
+    @app.post("/auth")
+    def login():
+        body = request.get_json(silent=True) or {}
+        if not body.get("email") or not body.get("password"):
+            return jsonify({"msg": "Bad username or password"}), 401
+        return jsonify(_tokens())
+
+    @app.post("/auth/refresh")
+    def refresh():
+        body = request.get_json(silent=True) or {}
+        if not str(body.get("refresh_token", "")).startswith("mock-refresh-"):
+            return jsonify({"msg": "Invalid refresh token"}), 401
+        return jsonify(_tokens())
+
+    @app.post("/auth/logout")
+    @app.post("/auth/logout-all")
+    def logout():
+        return jsonify({"message": "Successfully logged out", "success": True})
+
+    # -- Users and scripts --------------------------------------------------
+
+    @app.get(f"{API_PREFIX}/user/me")
+    def user_me():
+        user = mock_user(0, _row_rng(config.seed, "user", 0))
+        user.update({"id": "user-me", "role": "SUPERADMIN", "email": "loadtest@example.com"})
+        return jsonify({"data": user})
+
+    @app.get(f"{API_PREFIX}/user")
+    def list_users():
+        return jsonify(
+            _page_response(lambda i: mock_user(i, _row_rng(config.seed, "user", i)), config.users)
+        )
+
+    @app.get(f"{API_PREFIX}/user/<user_id>")
+    def get_user(user_id):
+        index = _index_from_id(user_id, "user-", config.users)
+        return jsonify({"data": mock_user(index, _row_rng(config.seed, "user", index))})
+
+    @app.get(f"{API_PREFIX}/script")
+    def list_scripts():
+        return jsonify(
+            _page_response(
+                lambda i: mock_script(i, _row_rng(config.seed, "script", i)), config.scripts
+            )
+        )
+
+    @app.get(f"{API_PREFIX}/script/<script_id>")
+    def get_script(script_id):
+        index = _index_from_id(script_id, "script-", config.scripts)
+        return jsonify({"data": mock_script(index, _row_rng(config.seed, "script", index))})
+
+    # -- Executions ---------------------------------------------------------
+
+    def build_execution(index: int) -> dict[str, Any]:
+        # Status is a function of the index so filtered pages can be addressed
+        # directly: the n-th row with status S is the n-th index in S's residue class.
+        status = EXECUTION_STATUSES[index % len(EXECUTION_STATUSES)]
+        return mock_execution(
+            index, _row_rng(config.seed, "execution", index), status=status, spacing_minutes=1
+        )
+
+    @app.get(f"{API_PREFIX}/execution")
+    def list_executions():
+        statuses = _status_filter(request.args.get("status"))
+        if not statuses:
+            return jsonify(_page_response(build_execution, config.executions))
+
+        residues = sorted(EXECUTION_STATUSES.index(status) for status in statuses)
+        cycle = len(EXECUTION_STATUSES)
+        full_cycles, remainder = divmod(config.executions, cycle)
+        total = full_cycles * len(residues) + sum(1 for r in residues if r < remainder)
+
+        def nth_matching(n: int) -> dict[str, Any]:
+            block, offset = divmod(n, len(residues))
+            return build_execution(block * cycle + residues[offset])
+
+        return jsonify(_page_response(nth_matching, total))
+
+    @app.get(f"{API_PREFIX}/execution/<execution_id>")
+    def get_execution(execution_id):
+        index = _index_from_id(execution_id, "exec-", config.executions)
+        execution = build_execution(index)
+        execution["params"] = SAMPLE_EXECUTION["params"]
+        if execution["status"] == "FINISHED":
+            execution["results"] = SAMPLE_FINISHED_EXECUTION["results"]
+        return jsonify({"data": execution})
+
+    @app.get(f"{API_PREFIX}/execution/<execution_id>/log")
+    @app.get(f"{API_PREFIX}/execution/<execution_id>/docker-logs")
+    @app.get(f"{API_PREFIX}/execution/<execution_id>/batch-logs")
+    @app.get(f"{API_PREFIX}/script/<execution_id>/log")
+    def get_logs(execution_id):
+        templates = SAMPLE_LOGS + SAMPLE_ERROR_LOGS
+        start = datetime(2025, 6, 21, 8, tzinfo=UTC)
+        logs = []
+        for i in range(config.log_lines):
+            template = templates[i % len(templates)]
+            moment = (start + timedelta(seconds=15 * i)).isoformat()
+            logs.append(
+                {
+                    "id": f"log-{i + 1}",
+                    "execution_id": execution_id,
+                    "register_date": moment,
+                    "created_at": moment,
+                    "level": template["level"],
+                    "text": template["text"],
+                }
+            )
+        return jsonify({"data": logs})
+
+    # -- Status and stats ---------------------------------------------------
+
+    @app.get(f"{API_PREFIX}/status")
+    def status():
+        now = datetime.now(UTC).replace(second=0, microsecond=0)
+        if request.args.get("aggregate") == "true":
+            step = GROUP_BY_SECONDS.get(request.args.get("group_by", "hour"), 3_600)
+            start = now - timedelta(seconds=PERIOD_SECONDS.get(request.args.get("period"), 86_400))
+        else:
+            step = config.status_interval_seconds
+            start = _parse_time(request.args.get("start_date"), now - timedelta(days=1))
+        end = _parse_time(request.args.get("end_date"), now)
+        per_page = min(request.args.get("per_page", 100, type=int), MAX_PER_PAGE)
+
+        span = max(int((end - start).total_seconds()) // step, 0) + 1
+        newest_first = request.args.get("sort", "-timestamp").startswith("-")
+        offsets = range(span - 1, -1, -1) if newest_first else range(span)
+        records = [
+            _status_record(start + timedelta(seconds=offset * step), config.seed)
+            for offset in list(offsets)[:per_page]
+        ]
+        return jsonify({"data": records, "total": span, "page": 1, "per_page": per_page})
+
+    @app.get(f"{API_PREFIX}/status/cluster")
+    def cluster_status():
+        return jsonify({"data": generate_mock_status_data()["data"]})
+
+    @app.get(f"{API_PREFIX}/stats/dashboard")
+    def stats_dashboard():
+        rng = random.Random(f"{config.seed}:dashboard:{request.query_string}")
+        return jsonify(
+            {
+                "data": {
+                    "summary": {
+                        "total_executions": config.executions,
+                        "total_executions_finished": config.executions * 7 // 10,
+                        "total_executions_failed": config.executions // 10,
+                        "total_executions_cancelled": config.executions // 50,
+                        "total_users": config.users,
+                        "active_users": rng.randint(1, max(config.users, 1)),
+                    }
+                }
+            }
+        )
+
+    def _series(period: str, group_by: str) -> list[datetime]:
+        step = GROUP_BY_SECONDS.get(group_by, 86_400)
+        span = PERIOD_SECONDS.get(period, PERIOD_SECONDS["last_month"])
+        end = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        return [end - timedelta(seconds=offset) for offset in range(span, -1, -step)]
+
+    @app.get(f"{API_PREFIX}/stats/executions")
+    def stats_executions():
+        period = request.args.get("period", "last_month")
+        rng = random.Random(f"{config.seed}:stats-executions:{period}")
+        moments = _series(period, request.args.get("group_by", "day"))
+        return jsonify(
+            {
+                "data": {
+                    "time_series": [
+                        {
+                            "timestamp": moment.isoformat(),
+                            "by_status": {s: rng.randint(0, 300) for s in EXECUTION_STATUSES},
+                        }
+                        for moment in moments
+                    ],
+                    "task_performance": [
+                        {
+                            "task": mock_script(t, rng)["name"],
+                            "total_executions": rng.randint(100, 10_000),
+                            "avg_duration_minutes": round(rng.uniform(1, 90), 1),
+                            "versions": [
+                                {
+                                    "version": f"2.{v}.{t}",
+                                    "total_executions": rng.randint(10, 1_000),
+                                    "success_rate": round(rng.uniform(50, 100), 1),
+                                }
+                                for v in range(3)
+                            ],
+                        }
+                        for t in range(min(config.scripts, 25))
+                    ],
+                    "top_users": [
+                        {
+                            "name": user["name"],
+                            "email": user["email"],
+                            "execution_count": 5_000 - 40 * u,
+                        }
+                        for u, user in enumerate(
+                            mock_user(u, _row_rng(config.seed, "user", u)) for u in range(20)
+                        )
+                    ],
+                }
+            }
+        )
+
+    @app.get(f"{API_PREFIX}/stats/users")
+    def stats_users():
+        period = request.args.get("period", "last_month")
+        rng = random.Random(f"{config.seed}:stats-users:{period}")
+        moments = _series(period, request.args.get("group_by", "day"))
+        return jsonify(
+            {
+                "data": {
+                    "time_series": [
+                        {"date": moment.isoformat(), "new_users": rng.randint(0, 60)}
+                        for moment in moments
+                    ],
+                    "geographic_distribution": {
+                        "countries": {c: rng.randint(1, 5_000) for c in USER_COUNTRIES}
+                    },
+                    "activity_stats": {
+                        "active_users_in_period": rng.randint(100, max(config.users, 100)),
+                        "active_users_countries": len(USER_COUNTRIES),
+                    },
+                }
+            }
+        )
+
+    # -- Boundaries ---------------------------------------------------------
+
+    def _boundaries() -> list[dict[str, str]]:
+        return [
+            {
+                "boundaryISO": country["code"],
+                "boundaryName": country["name"],
+                "boundaryType": "ADM0",
+            }
+            for country in COUNTRIES
+        ]
+
+    @app.get(f"{API_PREFIX}/data/boundaries/list")
+    def boundaries_list():
+        return jsonify({"boundaries": _boundaries(), "last_updated": "2025-01-01T00:00:00Z"})
+
+    @app.get(f"{API_PREFIX}/data/boundaries")
+    def boundaries():
+        return jsonify({"data": _boundaries(), "total": len(COUNTRIES)})
+
+    return app
+
+
+def _index_from_id(raw_id: str, prefix: str, total: int) -> int:
+    """Map ``exec-42`` style identifiers back to their 0-based row index."""
+    try:
+        index = int(raw_id.removeprefix(prefix)) - 1
+    except ValueError:
+        abort(404)
+    if not 0 <= index < total:
+        abort(404)
+    return index
+
+
+__all__ = ["FAMILIES", "LatencyModel", "MockAPIConfig", "create_app"]
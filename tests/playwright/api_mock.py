@@ -10,10 +10,11 @@ from urllib.parse import parse_qs, urlparse
 
 from playwright.sync_api import Route
 
-from .conftest import (
+from tests.fixtures.mock_data import (
     generate_mock_executions_data,
     generate_mock_scripts_data,
     generate_mock_status_data,
+    generate_mock_time_series_data,
     generate_mock_users_data,
 )
 
@@ -74,40 +75,6 @@ def create_mock_logout_response() -> dict[str, Any]:
     }
 
 
-def generate_mock_time_series_data(num_points: int = 24) -> list[dict[str, Any]]:
-    """
-    Generate mock time series status data for charts.
-
-    Args:
-        num_points: Number of time series data points to generate
-
-    Returns:
-        List of time series status records
-    """
-    import random
-
-    time_series = []
-    base_time = datetime.now() - timedelta(hours=num_points)
-
-    for i in range(num_points):
-        timestamp = base_time + timedelta(hours=i)
-        time_series.append(
-            {
-                "timestamp": timestamp.isoformat() + "Z",
-                "executions_active": random.randint(5, 25),
-                "executions_finished": random.randint(50, 150),
-                "executions_failed": random.randint(2, 15),
-                "executions_queued": random.randint(0, 10),
-                "executions_total": random.randint(100, 250),
-                "users_active": random.randint(10, 50),
-                "users_total": random.randint(80, 200),
-                "scripts_count": random.randint(15, 45),
-            }
-        )
-
-    return time_series
-
-
 class APIRouteHandler:
     """Handles API route mocking for Playwright tests."""
 
@@ -0,0 +1,209 @@
+"""Tests for the AG-Grid block cache."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from trendsearth_ui.utils import aggrid
+from trendsearth_ui.utils.aggrid import (
+    fetch_aggrid_page,
+    invalidate_aggrid_blocks,
+    prefetch_next_block,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_page_caches():
+    aggrid._block_cache.clear()
+    aggrid._counts.clear()
+    aggrid._prefetch_budgets.clear()
+    yield
+    aggrid._block_cache.clear()
+    aggrid._counts.clear()
+    aggrid._prefetch_budgets.clear()
+    aggrid._last_good_pages.clear()
+
+
+def _response(rows, total):
+    response = Mock(status_code=200)
+    response.json.return_value = {"data": rows, "total": total}
+    return response
+
+
+def _upper_names(rows):
+    return [{**row, "name": row["name"].upper()} for row in rows]
+
+
+def test_revisited_block_is_served_from_cache_and_reformatted():
+    with patch.object(
+        aggrid, "make_authenticated_request", return_value=_response([{"name": "a"}], 1)
+    ) as request:
+        first = fetch_aggrid_page("/execution", "token", {"page": 1}, _upper_names)
+        again = fetch_aggrid_page("/execution", "token", {"page": 1}, _upper_names)
+        raw = fetch_aggrid_page("/execution", "token", {"page": 1}, lambda rows: rows)
+        fetch_aggrid_page("/execution", "token", {"page": 2}, _upper_names)
+        fetch_aggrid_page("/execution", "other-token", {"page": 1}, _upper_names)
+
+    assert first == again == ([{"name": "A"}], 1)
+    assert raw == ([{"name": "a"}], 1)  # the cached payload is not the formatted rows
+    assert request.call_count == 3
+
+
+def test_refresh_bypasses_and_replaces_cached_block():
+    with patch.object(
+        aggrid,
+        "make_authenticated_request",
+        side_effect=[_response([{"name": "a"}], 1), _response([{"name": "b"}], 1)],
+    ):
+        fetch_aggrid_page("/script", "token", {"page": 1}, _upper_names)
+        refreshed = fetch_aggrid_page(
+            "/script", "token", {"page": 1}, _upper_names, use_cache=False
+        )
+        cached = fetch_aggrid_page("/script", "token", {"page": 1}, _upper_names)
+
+    assert refreshed == cached == ([{"name": "B"}], 1)
+
+
+def test_mutations_invalidate_blocks_of_the_endpoint_for_every_user():
+    with patch.object(
+        aggrid, "make_authenticated_request", return_value=_response([{"name": "a"}], 1)
+    ) as request:
+        for token in ("admin", "user"):
+            fetch_aggrid_page("/execution", token, {"page": 1}, _upper_names)
+        fetch_aggrid_page("/user", "admin", {"page": 1}, _upper_names)
+
+        assert invalidate_aggrid_blocks("/execution") == 2
+        fetch_aggrid_page("/execution", "admin", {"page": 1}, _upper_names)
+        fetch_aggrid_page("/user", "admin", {"page": 1}, _upper_names)
+
+    assert request.call_count == 4
+
+
+def test_delete_script_invalidates_script_and_execution_blocks():
+    from trendsearth_ui.callbacks.edit import register_callbacks
+
+    callbacks = {}
+    app = Mock()
+    app.callback = lambda *_args, **_kwargs: lambda func: callbacks.setdefault(func.__name__, func)
+    register_callbacks(app)
+
+    with (
+        patch(
+            "trendsearth_ui.callbacks.edit.make_authenticated_request",
+            return_value=Mock(status_code=204),
+        ),
+        patch("trendsearth_ui.callbacks.edit.invalidate_aggrid_blocks") as invalidate,
+    ):
+        result = callbacks["delete_script"](1, {"id": "s1"}, "token", "ADMIN", 3)
+
+    assert result == (False, False, 4)
+    invalidate.assert_called_once_with("/script", "/execution")
+
+
+def test_next_block_is_prefetched_with_the_same_params():
+    params = {"page": 1, "per_page": 50, "sort": "start_date desc"}
+    with patch.object(
+        aggrid, "make_authenticated_request", return_value=_response([{"name": "b"}], 120)
+    ) as request:
+        prefetch_next_block("/execution", "token", params, 120).result(5)
+        served = fetch_aggrid_page("/execution", "token", {**params, "page": 2}, _upper_names)
+
+    assert served == ([{"name": "B"}], 120)
+    request.assert_called_once()
+    url, token = request.call_args.args
+    assert url.endswith("/execution")
+    assert token == "token"
+    assert request.call_args.kwargs["params"] == {**params, "page": 2}
+    # Nothing is prefetched past the last row or for a block already cached.
+    assert prefetch_next_block("/execution", "token", {**params, "page": 3}, 120) is None
+    assert prefetch_next_block("/execution", "token", params, 120) is None
+
+
+def test_prefetch_uses_the_requesting_environment_session():
+    """The background thread has no request host, so the environment is passed along."""
+    session = Mock()
+    session.get.return_value = _response([{"name": "b"}], 120)
+    with (
+        patch.object(aggrid, "get_current_api_environment", return_value="staging"),
+        patch("trendsearth_ui.utils.helpers.get_session", return_value=session) as get_session,
+    ):
+        prefetch_next_block("/execution", "token", {"page": 1, "per_page": 50}, 120).result(5)
+
+    get_session.assert_called_once_with("staging")
+    assert session.get.call_args.args[0] == aggrid.get_api_base("staging") + "/execution"
+
+
+def test_prefetch_budget_is_per_session():
+    with (
+        patch.object(aggrid, "AGGRID_PREFETCH_BUDGET", 2),
+        patch.object(aggrid, "make_authenticated_request", return_value=_response([], 1000)),
+    ):
+        scheduled = [
+            prefetch_next_block("/user", "token", {"page": page, "per_page": 50}, 1000)
+            for page in range(1, 5)
+        ]
+        other = prefetch_next_block("/user", "other-token", {"page": 1, "per_page": 50}, 1000)
+
+    assert [future is not None for future in scheduled] == [True, True, False, False]
+    assert other is not None
+
+
+def test_prefetch_started_before_a_mutation_is_discarded():
+    release = threading.Event()
+
+    def slow_response(*_args, **_kwargs):
+        release.wait(5)
+        return _response([{"name": "old"}], 100)
+
+    with patch.object(aggrid, "make_authenticated_request", side_effect=slow_response):
+        future = prefetch_next_block("/script", "token", {"page": 1, "per_page": 50}, 100)
+        invalidate_aggrid_blocks("/script")
+        release.set()
+        future.result(5)
+
+    assert len(aggrid._block_cache) == 0
+
+
+def test_later_blocks_reuse_the_cached_total_and_skip_the_count():
+    filtered = {"per_page": 50, "sort": "id asc", "filter": "status='FAILED'"}
+    with (
+        patch.object(aggrid, "AGGRID_SKIP_COUNT_PARAM", "count=false"),
+        patch.object(
+            aggrid,
+            "make_authenticated_request",
+            side_effect=[
+                _response([{"name": "a"}], 120),
+                _response([{"name": "b"}], None),
+                _response([{"name": "c"}], 7),
+            ],
+        ) as request,
+    ):
+        first = fetch_aggrid_page("/execution", "token", {**filtered, "page": 1}, _upper_names)
+        second = fetch_aggrid_page(
+            "/execution", "token", {**filtered, "page": 2, "sort": "id desc"}, _upper_names
+        )
+        other_filter = fetch_aggrid_page(
+            "/execution", "token", {**filtered, "page": 2, "filter": "status='READY'"}, _upper_names
+        )
+
+    assert (first[1], second[1], other_filter[1]) == (120, 120, 7)
+    sent = [call.kwargs["params"] for call in request.call_args_list]
+    assert "count" not in sent[0]
+    assert sent[1]["count"] == "false"
+    assert "count" not in sent[2]
+
+
+def test_refresh_and_mutations_recount():
+    params = {"page": 2, "per_page": 50}
+    aggrid._counts[aggrid._count_key("/user", "token", params)] = 10
+    with patch.object(
+        aggrid, "make_authenticated_request", return_value=_response([{"name": "a"}], 11)
+    ):
+        assert fetch_aggrid_page("/user", "token", params, _upper_names)[1] == 10
+        assert fetch_aggrid_page("/user", "token", params, _upper_names, use_cache=False)[1] == 11
+        fetch_aggrid_page("/user", "token", {**params, "page": 1}, _upper_names)
+
+    assert len(aggrid._counts) == 1
+    invalidate_aggrid_blocks("/user")
+    assert len(aggrid._counts) == 0
@@ -0,0 +1,109 @@
+"""Tests for keyset (cursor) pagination of AG-Grid blocks."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from trendsearth_ui.utils import aggrid
+from trendsearth_ui.utils.aggrid import fetch_aggrid_page, prefetch_next_block
+
+KEYSET = ("start_date", "id")
+BASE = {"sort": "start_date desc", "filter": "status='FINISHED'"}
+
+
+@pytest.fixture(autouse=True)
+def clean_page_caches():
+    caches = (
+        aggrid._block_cache,
+        aggrid._counts,
+        aggrid._cursors,
+        aggrid._prefetch_budgets,
+        aggrid._last_good_pages,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+def _rows(*pairs):
+    return [{"id": row_id, "start_date": start} for row_id, start in pairs]
+
+
+def _response(rows, total):
+    response = Mock(status_code=200)
+    response.json.return_value = {"data": rows, "total": total}
+    return response
+
+
+def _fetch(page, per_page=3, use_cache=True, **params):
+    return fetch_aggrid_page(
+        "/execution",
+        "token",
+        {**BASE, **params, "page": page, "per_page": per_page},
+        lambda data: data,
+        use_cache=use_cache,
+        keyset_columns=KEYSET,
+    )
+
+
+def test_next_block_seeks_after_the_last_served_row():
+    first = _rows(("e1", "2026-01-03"), ("e2", "2026-01-02"), ("e3", "2026-01-02"))
+    # The seek response repeats the two rows that share the cursor value.
+    second = _rows(("e3", "2026-01-02"), ("e2", "2026-01-02"), ("e4", "2026-01-01"))
+
+    with patch.object(
+        aggrid,
+        "make_authenticated_request",
+        side_effect=[_response(first, 10), _response(second, 9), _response(second, 8)],
+    ) as request:
+        assert _fetch(1) == (first, 10)
+        rows, total = _fetch(2)
+        seek_params = request.call_args.kwargs["params"]
+        aggrid._counts.clear()
+        _block_rows, derived_total = _fetch(2, use_cache=False)
+
+    assert rows == _rows(("e4", "2026-01-01"))
+    assert total == 10  # the first block's cached count
+    assert derived_total == 3 + 8 - 2  # rows served + rows after the cursor - ties
+    assert seek_params == {
+        "sort": "start_date desc",
+        "filter": "status='FINISHED',start_date<='2026-01-02'",
+        "page": 1,
+        "per_page": 5,
+    }
+
+
+def test_other_sorts_and_unvisited_blocks_use_page_numbers():
+    with patch.object(
+        aggrid, "make_authenticated_request", return_value=_response(_rows(("e1", "x")), 10)
+    ) as request:
+        _fetch(1, sort="script_name asc")
+        _fetch(2, sort="script_name asc")
+        _fetch(4)
+
+    pages = [call.kwargs["params"]["page"] for call in request.call_args_list]
+    assert pages == [1, 2, 4]
+    assert all(
+        "start_date<=" not in call.kwargs["params"]["filter"] for call in request.call_args_list
+    )
+
+
+def test_prefetch_requests_the_next_block_by_cursor():
+    first = _rows(("e1", "2026-01-03"), ("e2", "2026-01-02"), ("e3", "2026-01-01"))
+    with patch.object(aggrid, "make_authenticated_request", return_value=_response(first, 10)):
+        _fetch(1)
+    with patch.object(
+        aggrid,
+        "make_authenticated_request",
+        return_value=_response(_rows(("e3", "2026-01-01"), ("e4", "2026-01-01")), 8),
+    ) as request:
+        prefetch_next_block(
+            "/execution", "token", {**BASE, "page": 1, "per_page": 3}, 10, keyset_columns=KEYSET
+        ).result(5)
+        rows, _total = _fetch(2)
+
+    request.assert_called_once()
+    assert request.call_args.kwargs["params"]["filter"].endswith("start_date<='2026-01-01'")
+    assert rows == _rows(("e4", "2026-01-01"))
@@ -0,0 +1,204 @@
+"""Tests for the cross-process cache backends."""
+
+import os
+import sqlite3
+import stat
+import subprocess
+import sys
+from unittest.mock import patch
+
+from cachetools import LRUCache
+import pytest
+
+from trendsearth_ui.utils import cache_backend
+from trendsearth_ui.utils.cache_backend import (
+    CacheBackend,
+    SharedTTLCache,
+    SQLiteCacheBackend,
+    shared_cache,
+)
+from trendsearth_ui.utils.metrics import InstrumentedTTLCache
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+
+
+def test_workers_share_entries(backend):
+    """Two caches over the same file (as in two workers) see each other's writes."""
+    first = SharedTTLCache("status_data", backend, maxsize=10, ttl=60)
+    second = SharedTTLCache("status_data", SQLiteCacheBackend(backend.path), maxsize=10, ttl=60)
+
+    first[("token", "production", "day")] = {"summary": "SUCCESS", "rows": [1, 2]}
+
+    assert second.get(("token", "production", "day")) == {"summary": "SUCCESS", "rows": [1, 2]}
+    assert ("token", "production", "week") not in second
+    assert (second.hits, second.misses) == (1, 0)
+    assert len(second) == 1
+    assert stat.S_IMODE(os.stat(backend.path).st_mode) == 0o600
+
+
+def test_entries_survive_process_restart(backend):
+    """A value written by another process is readable here."""
+    script = (
+        "from trendsearth_ui.utils.cache_backend import SQLiteCacheBackend, SharedTTLCache\n"
+        f"cache = SharedTTLCache('stats_data', SQLiteCacheBackend({str(backend.path)!r}), 10, 60)\n"
+        "cache['consolidated_stats_period=last_day'] = {'total_users_all_time': 42}\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    cache = SharedTTLCache("stats_data", backend, maxsize=10, ttl=60)
+    assert cache["consolidated_stats_period=last_day"] == {"total_users_all_time": 42}
+
+
+def test_expiry_and_eviction(backend):
+    """Expired entries read as misses; the oldest entries go once maxsize is exceeded."""
+    cache = SharedTTLCache("status_request", backend, maxsize=2, ttl=10)
+    with patch.object(cache_backend.time, "time", return_value=1000.0):
+        cache["a"] = 1
+    with patch.object(cache_backend.time, "time", return_value=1011.0):
+        assert cache.get("a") is None
+        cache["b"] = 2
+    for offset, key in enumerate("cd", start=1):
+        with patch.object(cache_backend.time, "time", return_value=1011.0 + offset):
+            cache[key] = offset
+
+    assert cache.expirations == 1
+    assert cache.evictions == 1
+    with patch.object(cache_backend.time, "time", return_value=1013.0):
+        assert [cache.get(key) for key in "bcd"] == [None, 1, 2]
+
+
+def test_namespaces_are_isolated(backend):
+    """Clearing one cache leaves the others on the same backend alone."""
+    options = SharedTTLCache("country_options", backend, maxsize=4, ttl=60)
+    resolver = SharedTTLCache("boundaries_resolver", backend, maxsize=4, ttl=60)
+    options["production"] = [{"label": "Kenya", "value": "KEN"}]
+    resolver["production"] = "resolver"
+    assert list(options) == ["production"]
+
+    options.clear()
+
+    assert "production" not in options
+    assert resolver["production"] == "resolver"
+    assert resolver.pop("production") == "resolver"
+    assert resolver.pop("production", None) is None
+
+
+def test_iteration_reads_keys_without_loading_values(backend):
+    """Listing keys (for tag invalidation) never unpickles the cached payloads."""
+    cache = SharedTTLCache("aggrid_last_good", backend, maxsize=10, ttl=60)
+    cache[("production", "/execution")] = {"rows": [1, 2]}
+    cache["plain"] = "value"
+    connection = sqlite3.connect(backend.path)
+    with connection:
+        connection.execute("UPDATE cache_entries SET value = x'00'")
+    connection.close()
+
+    assert sorted(cache, key=str) == [("production", "/execution"), "plain"]
+    assert cache.get("plain") is None
+
+
+def test_add_only_stores_missing_or_expired_keys(backend):
+    cache = SharedTTLCache("status_warmer_leases", backend, maxsize=4, ttl=10)
+    with patch.object(cache_backend.time, "time", return_value=1000.0):
+        assert cache.add("status:production:-", 1) is True
+        assert cache.add("status:production:-", 2) is False
+    with patch.object(cache_backend.time, "time", return_value=1011.0):
+        assert cache.add("status:production:-", 3) is True
+        assert cache["status:production:-"] == 3
+
+
+def test_entry_counts_are_tracked_without_scanning(backend):
+    """cache_counts follows inserts, replacements, deletes, sweeps and evictions."""
+    cache = SharedTTLCache("aggrid_blocks", backend, maxsize=3, ttl=10)
+
+    def stored():
+        connection = sqlite3.connect(backend.path)
+        try:
+            (counted,) = connection.execute(
+                "SELECT entries FROM cache_counts WHERE namespace = 'aggrid_blocks'"
+            ).fetchone()
+            (rows,) = connection.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = 'aggrid_blocks'"
+            ).fetchone()
+        finally:
+            connection.close()
+        assert counted == rows
+        return counted
+
+    with patch.object(cache_backend.time, "time", return_value=1000.0):
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 3
+        assert stored() == 2
+        del cache["b"]
+        assert stored() == 1
+    with patch.object(cache_backend.time, "time", return_value=1011.0):
+        # "a" has expired but is only swept once the namespace overflows.
+        cache["c"] = 4
+        cache["d"] = 5
+        assert stored() == 3
+        cache["e"] = 6
+        assert stored() == 3
+        assert cache.expirations == 1
+        cache["f"] = 7
+        assert stored() == 3
+        assert cache.evictions == 1
+    cache.clear()
+    assert backend.count("aggrid_blocks") == 0
+
+
+def test_storage_writable_by_others_is_refused(tmp_path):
+    """Values are unpickled, so a directory other users can write to is not used."""
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    shared_dir.chmod(0o777)
+    cache = SharedTTLCache(
+        "stats_data", SQLiteCacheBackend(shared_dir / "cache.sqlite3"), maxsize=4, ttl=60
+    )
+
+    cache["key"] = "value"
+
+    assert cache.get("key") is None
+    assert not (shared_dir / "cache.sqlite3").exists()
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_backend_errors_are_treated_as_misses(tmp_path):
+    """An unusable store degrades to cache misses rather than failing the callback."""
+    broken = SharedTTLCache("stats_data", SQLiteCacheBackend(tmp_path), maxsize=4, ttl=60)
+
+    broken["key"] = "value"
+
+    assert broken.get("key") is None
+    assert len(broken) == 0
+
+
+def test_shared_cache_defaults_to_process_memory():
+    """Without a shared backend the existing in-process cache types are used."""
+    with patch.object(cache_backend, "get_cache_backend", return_value=None):
+        assert isinstance(shared_cache("test_ttl", maxsize=2, ttl=5), InstrumentedTTLCache)
+        assert isinstance(shared_cache("test_lru", maxsize=2), LRUCache)
+
+
+def test_shared_cache_uses_configured_backend(backend):
+    with patch.object(cache_backend, "get_cache_backend", return_value=backend):
+        cache = shared_cache("test_shared", maxsize=2, ttl=5)
+    assert isinstance(cache, SharedTTLCache)
+    assert cache.backend is backend
+
+
+@pytest.mark.skipif(cache_backend.redis is not None, reason="redis package is installed")
+def test_redis_without_client_library_falls_back_to_memory():
+    with (
+        patch.object(cache_backend, "CACHE_BACKEND", "redis"),
+        patch.object(cache_backend, "_backend_resolved", False),
+        patch.object(cache_backend, "_backend", None),
+    ):
+        assert cache_backend.get_cache_backend() is None
@@ -0,0 +1,182 @@
+"""Tests for the namespaced cache manager."""
+
+import pickle
+import time
+from unittest.mock import patch
+
+import pytest
+
+from trendsearth_ui.utils import cache_backend
+from trendsearth_ui.utils.cache_backend import SQLiteCacheBackend
+from trendsearth_ui.utils.cache_manager import CacheKey, CacheManager, cache_manager
+from trendsearth_ui.utils.metrics import render_metrics
+
+
+@pytest.fixture
+def manager():
+    """A private manager whose namespaces stay out of the /metrics registry."""
+    with patch(
+        "trendsearth_ui.utils.cache_manager.register_cache",
+        side_effect=lambda _name, cache: cache,
+    ):
+        yield CacheManager(memory_budget=None)
+
+
+def test_cache_key_is_a_string_with_tags():
+    key = CacheKey("consolidated_stats", period="last_day", api_environment="production", role=None)
+
+    assert key == "consolidated_stats_api_environment=production_period=last_day"
+    assert {key: 1}["consolidated_stats_api_environment=production_period=last_day"] == 1
+    assert key.tags == {"kind=consolidated_stats", "api_environment=production", "period=last_day"}
+    restored = pickle.loads(pickle.dumps(key))
+    assert restored == key
+    assert restored.tags == key.tags
+
+
+def test_invalidate_by_namespace_and_tags(manager):
+    pages = manager.namespace("pages", maxsize=10, ttl=60)
+    status = manager.namespace("status", maxsize=10, ttl=60)
+    for environment in ("production", "staging"):
+        pages[CacheKey("page", endpoint="/execution", api_environment=environment)] = [1]
+        pages[CacheKey("page", endpoint="/user", api_environment=environment)] = [2]
+        status[CacheKey("status", api_environment=environment)] = {}
+    status["legacy-key"] = {}
+
+    assert manager.invalidate("pages:endpoint=/execution,api_environment=production") == 1
+    assert manager.invalidate("api_environment=staging") == 3
+    assert sorted(pages) == ["page_api_environment=production_endpoint=/user"]
+    assert manager.invalidate("status") == 2
+    assert len(status) == 0
+    assert manager.invalidate("unknown") == 0
+
+
+def test_stats_and_budget_eviction(manager):
+    """Past the budget the oldest writes go first, whichever namespace holds them."""
+    manager.memory_budget = 3000
+    first = manager.namespace("first", maxsize=10, ttl=60)
+    second = manager.namespace("second", maxsize=10, ttl=60)
+
+    first["old"] = "x" * 1000
+    second["middle"] = "y" * 1000
+    first.get("old")
+    first.get("missing")
+    second["new"] = "z" * 1500
+
+    assert "old" not in first
+    assert list(second) == ["middle", "new"]
+    assert manager.total_bytes <= 3000
+    stats = manager.stats()
+    assert (stats["first"]["hits"], stats["first"]["misses"]) == (1, 1)
+    assert stats["first"]["evictions"] == 1
+    assert stats["first"]["bytes"] == 0
+    assert stats["second"]["entries"] == 2
+    assert stats["second"]["bytes"] > 2500
+
+    del second["middle"]
+    second.clear()
+    assert manager.total_bytes == 0
+
+
+def test_entries_evicted_by_their_store_are_not_counted(manager):
+    manager.memory_budget = 2500
+    small = manager.namespace("small", maxsize=1, ttl=60)
+    other = manager.namespace("other", maxsize=10, ttl=60)
+
+    small["a"] = "a" * 1000
+    small["b"] = "b" * 1000  # the store evicts "a" by itself
+    other["c"] = "c" * 1000
+
+    assert small.get("b") is not None
+    assert other.get("c") is not None
+    assert manager.stats()["small"]["bytes"] < 1100
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"ttl": 60}, {"ttl": None}, {"ttl": 60, "max_bytes": 10_000}],
+    ids=["ttl", "lru", "size-aware"],
+)
+def test_bytes_follow_store_evictions(manager, options):
+    namespace = manager.namespace("bounded", maxsize=3, **options)
+    for index in range(50):
+        namespace[f"key-{index}"] = "v" * 1000
+
+    assert len(namespace) == 3
+    assert 3000 < manager.total_bytes < 3500
+    assert len(manager._sizes) == 3
+
+
+def test_bytes_follow_expiry(manager):
+    namespace = manager.namespace("short", maxsize=10, ttl=0.05)
+    namespace["a"] = "a" * 1000
+    time.sleep(0.1)
+
+    assert manager.stats()["short"]["bytes"] == 0
+    assert manager.total_bytes == 0
+
+
+def test_writes_reconcile_only_their_namespace(manager):
+    """A write drains its own namespace's removals; the others wait for stats()."""
+    small = manager.namespace("small", maxsize=1, ttl=60)
+    other = manager.namespace("other", maxsize=10, ttl=60)
+    small["a"] = "a" * 1000
+    small["b"] = "b" * 1000  # the store evicts "a" by itself
+    assert manager._namespace_bytes["small"] < 1100
+
+    small._removed.append("b")  # as if the store had just expired "b"
+    del small.store["b"]
+    other["c"] = 1
+
+    assert list(small._removed) == ["b"]
+    assert manager.stats()["small"]["bytes"] == 0
+    assert not small._removed
+
+
+def test_scalar_values_are_not_pickled(manager):
+    namespace = manager.namespace("row_ids", maxsize=10, ttl=60)
+
+    with patch("trendsearth_ui.utils.metrics.pickle.dumps") as dumps:
+        namespace["row"] = 12345
+        namespace["other"] = "execution-id"
+
+    dumps.assert_not_called()
+    assert manager.stats()["row_ids"]["bytes"] > 0
+
+
+def test_shared_backend_namespaces_skip_byte_accounting(manager, tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+    with patch.object(cache_backend, "get_cache_backend", return_value=backend):
+        namespace = manager.namespace("shared", maxsize=10, ttl=60)
+    namespace[CacheKey("page", api_environment="production")] = [1, 2]
+
+    assert manager.stats()["shared"]["bytes"] == 0
+    assert manager.invalidate("shared:api_environment=production") == 1
+
+
+def test_local_namespace_never_uses_the_shared_backend(manager, tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+    with patch.object(cache_backend, "get_cache_backend", return_value=backend):
+        secrets = manager.namespace("secrets", maxsize=10, ttl=60, shared=False)
+    secrets["refresh"] = ("access-token", 3600, "refresh-token")
+
+    assert not isinstance(secrets.store, cache_backend.SharedTTLCache)
+    assert backend.get("secrets", "refresh") is None
+
+
+def test_module_caches_are_registered():
+    import trendsearth_ui.callbacks.status  # noqa: F401 - declares status_request
+    import trendsearth_ui.utils.aggrid  # noqa: F401
+    import trendsearth_ui.utils.status_data_manager  # noqa: F401
+
+    for name in (
+        "status_data",
+        "stats_data",
+        "status_last_good",
+        "status_request",
+        "aggrid_last_good",
+        "boundaries_resolver",
+        "country_options",
+        "token_refresh",
+    ):
+        assert name in cache_manager
+    assert 'trendsearth_ui_cache_bytes{cache="status_data"}' in render_metrics()
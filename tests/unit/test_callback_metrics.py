@@ -0,0 +1,167 @@
+"""Tests for the per-callback latency and payload-size instrumentation."""
+
+import contextvars
+import threading
+from unittest.mock import patch
+
+from dash import Input, Output, callback, no_update
+from dash import _callback as dash_callback
+from dash.exceptions import PreventUpdate
+import pytest
+
+from trendsearth_ui.utils import callback_metrics
+from trendsearth_ui.utils.callback_metrics import (
+    get_callback_summary,
+    instrument_callback,
+    instrumented_callbacks,
+    record_upstream_time,
+    reset_callback_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_callback_stats()
+    yield
+    reset_callback_stats()
+
+
+def _row(name):
+    return next(row for row in get_callback_summary() if row["callback"] == name)
+
+
+def test_outcomes_are_counted():
+    """Updates, no_update results, PreventUpdate and errors are told apart."""
+
+    def callback(mode):
+        if mode == "prevent":
+            raise PreventUpdate
+        if mode == "error":
+            raise ValueError(mode)
+        return no_update if mode == "skip" else mode
+
+    wrapped = instrument_callback(callback, "test.outcomes")
+    assert wrapped("value") == "value"
+    assert wrapped("skip") is no_update
+    with pytest.raises(PreventUpdate):
+        wrapped("prevent")
+    with pytest.raises(ValueError):
+        wrapped("error")
+
+    row = _row("test.outcomes")
+    assert (row["calls"], row["no_update"], row["errors"]) == (4, 2, 1)
+    assert row["no_update_rate"] == 0.5
+
+
+def test_upstream_time_is_attributed_to_running_callback():
+    """Time reported by the HTTP adapter accumulates on the current callback only."""
+
+    def callback():
+        record_upstream_time(0.25)
+        record_upstream_time(0.5)
+        return "done"
+
+    instrument_callback(callback, "test.upstream")()
+    record_upstream_time(10)  # outside any callback: ignored
+
+    assert _row("test.upstream")["avg_upstream_ms"] == pytest.approx(750)
+
+    def fan_out_callback():
+        # Fan-out threads run in copies of the callback's context.
+        def record_many():
+            for _ in range(2000):
+                record_upstream_time(0.001)
+
+        threads = [
+            threading.Thread(target=contextvars.copy_context().run, args=(record_many,))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return "done"
+
+    instrument_callback(fan_out_callback, "test.upstream_threads")()
+
+    assert _row("test.upstream_threads")["avg_upstream_ms"] == pytest.approx(16_000)
+
+
+def test_payload_sizes_recorded_when_sampled():
+    """Sampled calls record serialised input and output sizes."""
+    wrapped = instrument_callback(lambda value: [value] * 100, "test.payload")
+
+    with patch.object(callback_metrics, "CALLBACK_METRICS_SAMPLE_RATE", 1.0):
+        wrapped("x")
+    with patch.object(callback_metrics, "CALLBACK_METRICS_SAMPLE_RATE", 0.0):
+        wrapped("x")
+
+    row = _row("test.payload")
+    assert row["calls"] == 2
+    assert row["sampled"] == 1
+    assert row["avg_output_bytes"] > row["avg_input_bytes"] > 0
+
+
+def test_instrumented_callbacks_wraps_registration():
+    """Functions registered through app.callback inside the block are instrumented."""
+
+    class FakeApp:
+        def __init__(self):
+            self.registered = []
+
+        def callback(self, *_args, **_kwargs):
+            def decorator(func):
+                self.registered.append(func)
+                return func
+
+            return decorator
+
+    app = FakeApp()
+    original = app.callback
+
+    def update_table():
+        return "rows"
+
+    with instrumented_callbacks(app):
+        app.callback("output", "input")(update_table)
+
+    assert app.callback == original
+    assert app.registered[0]() == "rows"
+    assert _row("test_callback_metrics.update_table")["calls"] == 1
+
+
+def test_instrumented_callbacks_wraps_global_dash_callback():
+    """Functions registered through the global dash.callback are instrumented too."""
+
+    class FakeApp:
+        callback = None
+
+    original_register = dash_callback.register_callback
+    before = set(dash_callback.GLOBAL_CALLBACK_MAP)
+    try:
+        with instrumented_callbacks(FakeApp()):
+
+            @callback(Output("metrics-test-out", "children"), Input("metrics-test-in", "value"))
+            def update_label(value):
+                return value
+    finally:
+        for key in set(dash_callback.GLOBAL_CALLBACK_MAP) - before:
+            del dash_callback.GLOBAL_CALLBACK_MAP[key]
+        dash_callback.GLOBAL_CALLBACK_LIST[:] = [
+            entry
+            for entry in dash_callback.GLOBAL_CALLBACK_LIST
+            if "metrics-test-out" not in str(entry.get("output"))
+        ]
+
+    assert dash_callback.register_callback is original_register
+    assert update_label("hi") == "hi"
+    assert _row("test_callback_metrics.update_label")["calls"] == 1
+
+
+def test_summary_sorted_by_total_time():
+    """The slowest callbacks by total time come first and limit is honoured."""
+    with patch("trendsearth_ui.utils.callback_metrics.time.perf_counter", side_effect=[0, 1, 0, 3]):
+        instrument_callback(lambda: 1, "test.fast")()
+        instrument_callback(lambda: 1, "test.slow")()
+
+    assert [row["callback"] for row in get_callback_summary(limit=1)] == ["test.slow"]
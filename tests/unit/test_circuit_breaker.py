@@ -0,0 +1,189 @@
+"""Tests for the per-endpoint-family circuit breakers and stale-serve fallbacks."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from trendsearth_ui.utils import circuit_breaker
+from trendsearth_ui.utils.aggrid import fetch_aggrid_page
+from trendsearth_ui.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    endpoint_family,
+    get_breaker,
+)
+from trendsearth_ui.utils.http_client import PooledHTTPAdapter
+from trendsearth_ui.utils.status_data_manager import StatusDataManager
+
+
+@pytest.fixture(autouse=True)
+def _reset_breakers():
+    circuit_breaker.reset_breakers()
+    yield
+    circuit_breaker.reset_breakers()
+
+
+def _open_breaker(host="api.trends.earth", family="status"):
+    breaker = get_breaker(host, family)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_threshold_and_probes_when_half_open():
+    """The circuit opens at the threshold and lets one probe through after the timeout."""
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+    with patch("trendsearth_ui.utils.circuit_breaker.time.monotonic", return_value=1e12):
+        assert breaker.allow_request()
+        assert breaker.state == HALF_OPEN
+        # Only a single probe may be in flight
+        assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_circuit():
+    """A failing half-open probe re-opens the circuit immediately."""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+
+
+def test_endpoint_families():
+    """URLs map to the guarded endpoint families."""
+    base = "https://api.trends.earth/api/v1"
+    assert endpoint_family(f"{base}/status") == "status"
+    assert endpoint_family(f"{base}/stats/dashboard") == "stats"
+    assert endpoint_family(f"{base}/execution/abc/log") == "logs"
+    assert endpoint_family(f"{base}/execution") == "execution"
+    assert endpoint_family(f"{base}/data/boundaries/list") == "boundaries"
+    assert endpoint_family(f"{base}/user/me") is None
+
+
+def test_adapter_fails_fast_while_open():
+    """Requests to an open family raise CircuitOpenError without touching the network."""
+    _open_breaker()
+    session = requests.Session()
+    adapter = PooledHTTPAdapter()
+    session.mount("https://", adapter)
+
+    with (
+        patch.object(requests.adapters.HTTPAdapter, "send") as mock_send,
+        pytest.raises(CircuitOpenError),
+    ):
+        session.get("https://api.trends.earth/api/v1/status")
+
+    mock_send.assert_not_called()
+
+
+def test_adapter_counts_server_errors_as_failures():
+    """5xx responses count towards opening the circuit."""
+    adapter = PooledHTTPAdapter()
+    request = requests.Request("GET", "https://api.trends.earth/api/v1/stats/users").prepare()
+
+    with patch.object(requests.adapters.HTTPAdapter, "send", return_value=Mock(status_code=503)):
+        for _ in range(get_breaker("api.trends.earth", "stats").failure_threshold):
+            adapter.send(request)
+
+    assert get_breaker("api.trends.earth", "stats").state == OPEN
+
+
+def test_unexpected_error_only_releases_the_probe_it_holds():
+    """A request admitted while closed that raises does not free another request's probe."""
+    adapter = PooledHTTPAdapter()
+    request = requests.Request("GET", "https://api.trends.earth/api/v1/status").prepare()
+    breaker = get_breaker("api.trends.earth", "status")
+
+    def open_and_probe_then_fail(*_args, **_kwargs):
+        _open_breaker(family="status")
+        with patch("trendsearth_ui.utils.circuit_breaker.time.monotonic", return_value=1e12):
+            assert breaker.admit() == HALF_OPEN
+        raise ValueError("unexpected")
+
+    with (
+        patch.object(requests.adapters.HTTPAdapter, "send", side_effect=open_and_probe_then_fail),
+        pytest.raises(ValueError),
+    ):
+        adapter.send(request)
+
+    with patch("trendsearth_ui.utils.circuit_breaker.time.monotonic", return_value=1e12):
+        assert not breaker.allow_request()
+
+
+def test_status_data_served_stale_while_circuit_open():
+    """StatusDataManager returns the last good value, marked stale, while the circuit is open."""
+    StatusDataManager.invalidate_cache()
+    cache_key = StatusDataManager.get_cache_key(
+        "time_series_status", api_environment="production", period="day"
+    )
+    StatusDataManager.set_cached_data(cache_key, {"data": [1, 2]})
+    StatusDataManager.invalidate_cache("status_data:kind=time_series_status")
+    _open_breaker(family="status")
+
+    with patch("trendsearth_ui.utils.status_data_manager.get_session") as mock_get_session:
+        result = StatusDataManager.fetch_time_series_status_data(
+            "token", "production", "day", force_refresh=True
+        )
+
+    mock_get_session.assert_not_called()
+    assert result["data"] == [1, 2]
+    assert result["stale"] is True
+    assert result["stale_age_seconds"] >= 0
+
+
+def test_error_result_does_not_replace_last_good_value():
+    """A cached failure is not what gets served stale once the circuit opens."""
+    StatusDataManager.invalidate_cache()
+    cache_key = StatusDataManager.get_cache_key(
+        "time_series_status", api_environment="production", period="day"
+    )
+    StatusDataManager.set_cached_data(cache_key, {"data": [1, 2], "error": None})
+    StatusDataManager.set_cached_data(cache_key, {"data": [], "error": "down"})
+    StatusDataManager.invalidate_cache("status_data:kind=time_series_status")
+    _open_breaker(family="status")
+
+    result = StatusDataManager.fetch_time_series_status_data(
+        "token", "production", "day", force_refresh=True
+    )
+
+    assert result["data"] == [1, 2]
+    assert result["error"] is None
+    assert result["stale"] is True
+
+
+def test_aggrid_page_served_stale_while_circuit_open():
+    """The last good grid page is returned when the circuit is open."""
+    ok_response = Mock(status_code=200)
+    ok_response.json.return_value = {"data": [{"id": 1}], "total": 1}
+
+    with patch("trendsearth_ui.utils.aggrid.make_authenticated_request", return_value=ok_response):
+        fresh = fetch_aggrid_page("/execution", "token", {"page": 1}, lambda rows: rows)
+
+    with patch(
+        "trendsearth_ui.utils.aggrid.make_authenticated_request",
+        side_effect=CircuitOpenError("execution@api.trends.earth"),
+    ):
+        stale = fetch_aggrid_page(
+            "/execution", "token", {"page": 1}, lambda rows: rows, use_cache=False
+        )
+        with pytest.raises(CircuitOpenError):
+            fetch_aggrid_page("/execution", "other-token", {"page": 1}, lambda rows: rows)
+
+    assert stale == fresh == ([{"id": 1}], 1)
@@ -0,0 +1,70 @@
+"""Tests for the bounded fan-out helper."""
+
+import threading
+import time
+
+from trendsearth_ui.utils.fanout import run_fan_out
+
+
+def test_run_fan_out_runs_calls_concurrently():
+    """All calls start before any of them is allowed to finish."""
+    barrier = threading.Barrier(3, timeout=2)
+
+    def call(value):
+        barrier.wait()
+        return value
+
+    outcome = run_fan_out({name: (lambda n=name: call(n)) for name in ("a", "b", "c")}, timeout=5)
+
+    assert outcome.results == {"a": "a", "b": "b", "c": "c"}
+    assert outcome.errors == {}
+    assert set(outcome.timings) == {"a", "b", "c"}
+
+
+def test_run_fan_out_isolates_failures():
+    """A raising call is reported without affecting the others."""
+
+    def boom():
+        raise ValueError("upstream exploded")
+
+    outcome = run_fan_out({"good": lambda: 1, "bad": boom}, timeout=5)
+
+    assert outcome.ok("good")
+    assert not outcome.ok("bad")
+    assert outcome.errors["bad"] == "upstream exploded"
+    assert "bad" in outcome.timings
+
+
+def test_run_fan_out_deadline_leaves_slow_calls_pending():
+    """Calls that miss the deadline are returned as pending and can be collected later."""
+    release = threading.Event()
+
+    def slow():
+        release.wait(2)
+        return "late"
+
+    outcome = run_fan_out({"fast": lambda: "ok", "slow": slow}, timeout=0.1)
+
+    assert outcome.results == {"fast": "ok"}
+    assert list(outcome.pending) == ["slow"]
+    assert outcome.to_meta()["pending"] == ["slow"]
+
+    release.set()
+    outcome.pending["slow"].result(timeout=2)
+    assert outcome.collect() == ["slow"]
+    assert outcome.results["slow"] == "late"
+    assert outcome.pending == {}
+
+
+def test_fan_out_meta_reports_critical_path():
+    """The slowest call is reported as the critical path."""
+
+    def slow():
+        time.sleep(0.05)
+        return True
+
+    outcome = run_fan_out({"quick": lambda: True, "slow": slow}, timeout=5)
+    meta = outcome.to_meta()
+
+    assert meta["critical_path"] == "slow"
+    assert meta["timings_ms"]["slow"] >= meta["timings_ms"]["quick"]
@@ -0,0 +1,121 @@
+"""Tests for the conditional-request (ETag) cache adapter."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+import requests
+
+from trendsearth_ui.utils.http_cache import ConditionalCacheAdapter, EndpointCachePolicy
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Serves a fixed body with an ETag and honours If-None-Match."""
+
+    seen_requests: list[dict] = []
+
+    def do_GET(self):
+        _ETagHandler.seen_requests.append(
+            {"path": self.path, "if_none_match": self.headers.get("If-None-Match")}
+        )
+        etag = '"v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = b'{"data": [1, 2, 3]}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def etag_server():
+    _ETagHandler.seen_requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _session(adapter):
+    session = requests.Session()
+    session.mount("http://", adapter)
+    return session
+
+
+def test_not_modified_response_is_served_from_store(etag_server):
+    """The second poll sends If-None-Match and gets the stored body back."""
+    adapter = ConditionalCacheAdapter()
+    session = _session(adapter)
+    headers = {"Authorization": "Bearer a"}
+
+    first = session.get(f"{etag_server}/api/v1/execution", headers=headers)
+    second = session.get(f"{etag_server}/api/v1/execution", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == {"data": [1, 2, 3]}
+    assert getattr(second, "from_conditional_cache", False) is True
+    assert _ETagHandler.seen_requests[1]["if_none_match"] == '"v1"'
+    assert adapter.stats()["hits"] == 1
+
+
+def test_private_entries_are_not_shared_across_tokens(etag_server):
+    """A different token never receives validators stored for another token."""
+    adapter = ConditionalCacheAdapter()
+    session = _session(adapter)
+
+    session.get(f"{etag_server}/api/v1/execution", headers={"Authorization": "Bearer a"})
+    other = session.get(f"{etag_server}/api/v1/execution", headers={"Authorization": "Bearer b"})
+
+    assert other.status_code == 200
+    assert _ETagHandler.seen_requests[1]["if_none_match"] is None
+    assert adapter.stats()["hits"] == 0
+
+
+def test_public_entries_are_shared(etag_server):
+    """Endpoints marked public revalidate with validators from any caller."""
+    adapter = ConditionalCacheAdapter()
+    session = _session(adapter)
+
+    session.get(f"{etag_server}/api/v1/news", headers={"Authorization": "Bearer a"})
+    shared = session.get(f"{etag_server}/api/v1/news")
+
+    assert shared.json() == {"data": [1, 2, 3]}
+    assert adapter.stats()["hits"] == 1
+
+
+def test_endpoints_without_policy_are_not_cached(etag_server):
+    """GETs that match no policy pass straight through."""
+    adapter = ConditionalCacheAdapter()
+    session = _session(adapter)
+
+    session.get(f"{etag_server}/api/v1/user/me")
+    session.get(f"{etag_server}/api/v1/user/me")
+
+    assert all(seen["if_none_match"] is None for seen in _ETagHandler.seen_requests)
+    assert adapter.stats()["entries"] == 0
+
+
+def test_store_is_bounded(etag_server):
+    """The least recently used entry is evicted when the store is full."""
+    adapter = ConditionalCacheAdapter(
+        policies=(EndpointCachePolicy("any", r"/item/"),), max_entries=2
+    )
+    session = _session(adapter)
+
+    for item in range(3):
+        session.get(f"{etag_server}/item/{item}")
+
+    stats = adapter.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
@@ -1,9 +1,19 @@
 """Tests for HTTP helper utilities."""
 
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+import requests
+
+from trendsearth_ui.utils import http_client
 from trendsearth_ui.utils.http_client import (
     BROTLI_SUPPORTED,
     DEFAULT_ACCEPT_ENCODING,
     apply_default_headers,
+    build_retry,
+    get_pool_stats,
+    get_session,
 )
 
 
@@ -31,3 +41,87 @@ def test_apply_default_headers_preserves_existing_accept_encoding():
     assert headers["Accept-Encoding"] == "gzip"
     # Original dict should remain unchanged
     assert custom_headers["Accept-Encoding"] == "gzip"
+
+
+def test_get_session_returns_one_session_per_environment():
+    """Each API environment gets its own reusable session and connection pool."""
+    production = get_session("production")
+    staging = get_session("staging")
+
+    assert production is get_session("production")
+    assert production is not staging
+    assert production.get_adapter("https://") is not staging.get_adapter("https://")
+
+
+def test_build_retry_only_retries_idempotent_methods_with_jitter():
+    """Retries apply to idempotent methods and use jittered backoff."""
+    retry = build_retry()
+
+    assert "GET" in retry.allowed_methods
+    assert "POST" not in retry.allowed_methods
+    assert retry.backoff_jitter > 0
+    assert 503 in retry.status_forcelist
+    assert retry.raise_on_status is False
+    assert retry.read == 0
+
+
+def test_read_timeout_is_not_retried(monkeypatch):
+    """A GET that times out reading the response is sent once and raises ReadTimeout."""
+    received = []
+    release = threading.Event()
+
+    class _SlowHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append(self.path)
+            release.wait(5)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(http_client, "_sessions", {})
+    try:
+        session = get_session("read-timeout-test")
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            session.get(f"http://127.0.0.1:{server.server_address[1]}/slow", timeout=(5, 0.2))
+    finally:
+        release.set()
+        server.shutdown()
+        server.server_close()
+
+    assert received == ["/slow"]
+
+
+def test_get_pool_stats_reports_reuse(monkeypatch):
+    """Pool statistics count requests served over reused connections."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(http_client, "_sessions", {})
+    try:
+        session = get_session("pool-test")
+        for _ in range(3):
+            session.get(f"http://127.0.0.1:{server.server_address[1]}/ping", timeout=5)
+        stats = get_pool_stats()["pool-test"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    (host_stats,) = stats.values()
+    assert host_stats["requests"] == 3
+    assert host_stats["connections_created"] == 1
+    assert host_stats["in_use"] == 0
+    assert host_stats["reuse_rate"] == pytest.approx(0.667, abs=0.001)
@@ -0,0 +1,108 @@
+"""Tests for the Dash callback load-test harness."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from werkzeug.serving import make_server
+
+from tests.load.client import parse_callback_specs, server_total_seconds
+from tests.load.runner import run_stage
+from tests.load.stats import Sample, StageReport, percentile
+from tests.mock_api import MockAPIConfig, create_app
+
+
+def test_parse_callback_specs_splits_outputs_and_skips_clientside():
+    """Multi-output callbacks are split; clientside and pattern-matching ones are skipped."""
+    specs = parse_callback_specs(
+        [
+            {
+                "output": "..a.children...b.data@1f2e..",
+                "inputs": [{"id": "btn", "property": "n_clicks"}],
+                "state": [],
+            },
+            {
+                "output": "c.style",
+                "inputs": [{"id": "btn", "property": "n_clicks"}],
+                "state": [],
+                "clientside_function": {"namespace": "ns", "function_name": "f"},
+            },
+            {
+                "output": "d.children",
+                "inputs": [{"id": {"type": "row", "index": "ALL"}, "property": "value"}],
+                "state": [],
+            },
+        ]
+    )
+
+    assert len(specs) == 1
+    assert specs[0].multi
+    assert specs[0].outputs == [
+        {"id": "a", "property": "children"},
+        {"id": "b", "property": "data@1f2e"},
+    ]
+    assert specs[0].label("btn.n_clicks") == "btn.n_clicks -> a"
+
+
+def test_server_total_is_read_from_server_timing():
+    assert server_total_seconds('api;dur=12.0;desc="Upstream API", total;dur=40.5') == 0.0405
+    assert server_total_seconds(None) is None
+
+
+def test_stage_report_percentiles_and_saturation():
+    """Percentiles are per callback; busy time comes from the server-side totals."""
+    samples = [
+        Sample("grid", finished=0, latency=i / 100, status=200, server_seconds=i / 200)
+        for i in range(1, 101)
+    ]
+    samples.append(Sample("grid", finished=0, latency=2.0, status=500))
+
+    report = StageReport.build(samples, users=4, duration=10, worker_slots=1)
+
+    assert percentile(sorted(s.latency for s in samples[:100]), 95) == pytest.approx(0.95)
+    (grid,) = report.callbacks
+    assert (grid.count, grid.errors) == (101, 1)
+    assert report.busy_fraction == pytest.approx(sum(i / 200 for i in range(1, 101)) / 10)
+    assert "worker busy" in report.format()
+
+
+def _serve(app):
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_stage_replays_callbacks_against_live_ui():
+    """A short stage logs in, renders tabs and pages the grid without errors."""
+    from trendsearth_ui import app as app_module
+    from trendsearth_ui import config as ui_config
+
+    api = _serve(create_app(MockAPIConfig(executions=500)))
+    ui = _serve(app_module.server)
+    api_url = f"http://127.0.0.1:{api.server_port}"
+    environment = {"base": f"{api_url}/api/v1", "auth": f"{api_url}/auth"}
+    try:
+        with (
+            patch.dict(ui_config.API_ENVIRONMENTS, {"local": environment}),
+            patch.object(ui_config, "FORCE_API_ENVIRONMENT", "local"),
+        ):
+            report = run_stage(
+                f"http://127.0.0.1:{ui.server_port}",
+                users=2,
+                duration=2,
+                worker_slots=1,
+                email="loadtest@example.com",
+                password="loadtest",
+                think_time=0.3,
+                ramp_up=0,
+                seed=3,
+            )
+    finally:
+        ui.shutdown()
+        api.shutdown()
+
+    labels = {stats.label for stats in report.callbacks}
+    assert "login-btn.n_clicks -> token-store" in labels
+    assert "executions-table.getRowsRequest -> executions-table" in labels
+    assert report.errors == 0
+    assert report.busy_fraction is not None
@@ -0,0 +1,150 @@
+"""Tests for the Prometheus metrics surface."""
+
+from unittest.mock import Mock, patch
+
+import requests
+
+from trendsearth_ui.utils.http_client import PooledHTTPAdapter
+from trendsearth_ui.utils.metrics import (
+    UPSTREAM_IN_FLIGHT,
+    UPSTREAM_REQUEST_SECONDS,
+    Histogram,
+    InstrumentedTTLCache,
+    SizeAwareTTLCache,
+    endpoint_template,
+    estimate_size,
+    register_cache,
+    render_metrics,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Buckets are cumulative and include +Inf, sum and count."""
+    hist = Histogram("test_latency_seconds", "Test latency.", ("endpoint",), buckets=(0.1, 1.0))
+    hist.observe(0.05, endpoint="/status")
+    hist.observe(0.5, endpoint="/status")
+    hist.observe(5, endpoint="/status")
+
+    lines = hist.collect()
+
+    assert "# TYPE trendsearth_ui_test_latency_seconds histogram" in lines
+    assert 'trendsearth_ui_test_latency_seconds_bucket{endpoint="/status",le="0.1"} 1' in lines
+    assert 'trendsearth_ui_test_latency_seconds_bucket{endpoint="/status",le="1"} 2' in lines
+    assert 'trendsearth_ui_test_latency_seconds_bucket{endpoint="/status",le="+Inf"} 3' in lines
+    assert 'trendsearth_ui_test_latency_seconds_count{endpoint="/status"} 3' in lines
+
+
+def test_endpoint_template_collapses_identifiers():
+    """Identifier segments are replaced so label cardinality stays bounded."""
+    base = "https://api.trends.earth/api/v1"
+    assert endpoint_template(f"{base}/execution?page=2") == "/execution"
+    assert (
+        endpoint_template(f"{base}/execution/0b7e6c1c-3b5a-4a8e-9a65-5f1a3c2d4e6f/log")
+        == "/execution/{id}/log"
+    )
+    assert endpoint_template(f"{base}/user/someone@example.org") == "/user/{id}"
+    assert endpoint_template(f"{base}/script/42") == "/script/{id}"
+
+
+def test_instrumented_cache_counts_hits_misses_and_evictions():
+    """Lookups and evictions are counted and exported for registered caches."""
+    cache = register_cache("test_cache", InstrumentedTTLCache(maxsize=1, ttl=60))
+
+    assert cache.get("a") is None
+    cache["a"] = 1
+    assert cache.get("a") == 1
+    cache["b"] = 2
+
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+    output = render_metrics()
+    assert 'trendsearth_ui_cache_hits_total{cache="test_cache"} 1' in output
+    assert 'trendsearth_ui_cache_evictions_total{cache="test_cache"} 1' in output
+    assert 'trendsearth_ui_cache_entries{cache="test_cache"} 1' in output
+
+
+def test_size_aware_cache_evicts_large_cold_entries_first():
+    """Over the byte ceiling the largest of the least recently used entries goes first."""
+    small, large = "s" * 1_000, "L" * 20_000
+    cache = SizeAwareTTLCache(maxsize=3 * estimate_size(large), ttl=60)
+    cache["small-old"] = small
+    cache["large-cold"] = large
+    cache["large-hot"] = large
+    cache["small-new"] = small
+    assert cache.get("large-hot") == large  # now the most recently used
+
+    cache["large-new"] = large
+
+    assert "large-cold" not in cache
+    assert {"small-old", "small-new", "large-hot", "large-new"} <= set(cache)
+    assert cache.currsize <= cache.maxsize
+    assert cache.weight("large-new") == estimate_size(large)
+    assert cache.evictions == 1
+
+
+def test_size_aware_cache_limits():
+    cache = SizeAwareTTLCache(maxsize=estimate_size("x" * 500), ttl=60, max_entries=2)
+    cache["a"] = "a"
+    cache["b"] = "b"
+    cache["c"] = "c"
+    assert len(cache) == 2
+
+    cache["a"] = "x" * 10_000  # larger than the ceiling: not cached
+    cache["b"] = "x" * 10_000  # and the previous value for the key is dropped
+
+    assert "a" not in cache
+    assert "b" not in cache
+    assert cache.weight("b") == 0
+    cache.clear()
+    assert cache.currsize == 0
+
+
+def test_adapter_records_upstream_latency_and_in_flight():
+    """Outbound requests are timed by endpoint template and status code."""
+    adapter = PooledHTTPAdapter()
+    request = requests.Request("GET", "https://api.trends.earth/api/v1/script/7").prepare()
+    labels = {"method": "GET", "endpoint": "/script/{id}", "status": "200"}
+    before = UPSTREAM_REQUEST_SECONDS.count(**labels)
+
+    with patch.object(requests.adapters.HTTPAdapter, "send", return_value=Mock(status_code=200)):
+        adapter.send(request)
+
+    assert UPSTREAM_REQUEST_SECONDS.count(**labels) == before + 1
+    assert UPSTREAM_IN_FLIGHT.value(endpoint="/script/{id}") == 0
+
+
+def test_metrics_route_serves_prometheus_text():
+    """The /metrics route returns the text exposition format."""
+    from trendsearth_ui import app as app_module
+
+    client = app_module.server.test_client()
+    with patch.multiple(app_module, METRICS_ENABLED=True, METRICS_AUTH_TOKEN="secret"):
+        response = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert "# TYPE trendsearth_ui_upstream_request_duration_seconds histogram" in body
+    assert 'cache="status_data"' in body
+
+
+def test_metrics_route_requires_token_when_configured():
+    """Scrapes must present the configured bearer token."""
+    from trendsearth_ui import app as app_module
+
+    client = app_module.server.test_client()
+    with patch.multiple(app_module, METRICS_ENABLED=True, METRICS_AUTH_TOKEN="secret"):
+        assert client.get("/metrics").status_code == 401
+        wrong = client.get("/metrics", headers={"Authorization": "Bearer other"})
+        authorised = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+    assert wrong.status_code == 401
+    assert authorised.status_code == 200
+
+
+def test_metrics_route_is_off_by_default_and_without_a_token():
+    from trendsearth_ui import app as app_module
+
+    client = app_module.server.test_client()
+    assert client.get("/metrics").status_code == 404
+    with patch.multiple(app_module, METRICS_ENABLED=True, METRICS_AUTH_TOKEN=""):
+        assert client.get("/metrics").status_code == 404
@@ -0,0 +1,119 @@
+"""Tests for the standalone mock Trends.Earth API server."""
+
+import random
+import threading
+from unittest.mock import patch
+
+import pytest
+from werkzeug.serving import make_server
+
+from tests.mock_api import LatencyModel, MockAPIConfig, create_app
+
+AUTH = {"Authorization": "Bearer mock-access-token"}
+
+
+@pytest.fixture
+def client():
+    return create_app(MockAPIConfig(executions=2_000_000, users=50, log_lines=10)).test_client()
+
+
+def test_latency_specs():
+    """Latency specs parse into distributions that sample in seconds."""
+    rng = random.Random(0)
+    assert LatencyModel("0").sample(rng) == 0
+    assert LatencyModel("fixed:50").sample(rng) == pytest.approx(0.05)
+    assert 0.02 <= LatencyModel("uniform:20,200").sample(rng) <= 0.2
+    assert LatencyModel("lognormal:80,0.6").sample(rng) > 0
+    with pytest.raises(ValueError):
+        LatencyModel("gamma:1,2")
+
+
+def test_execution_pages_are_deterministic_at_scale(client):
+    """Any page of a multi-million row table is generated on demand and stable."""
+    params = {"page": 39_999, "per_page": 50, "sort": "-start_date"}
+    first = client.get("/api/v1/execution", query_string=params, headers=AUTH).get_json()
+    second = client.get("/api/v1/execution", query_string=params, headers=AUTH).get_json()
+
+    assert first == second
+    assert first["total"] == 2_000_000
+    assert len(first["data"]) == 50
+    dates = [row["start_date"] for row in first["data"]]
+    assert dates == sorted(dates, reverse=True)
+
+
+def test_execution_status_filter(client):
+    """AG-Grid style status filters return only matching rows with a matching total."""
+    response = client.get(
+        "/api/v1/execution",
+        query_string={"filter": "(status='FAILED' OR status='RUNNING')", "per_page": 20},
+        headers=AUTH,
+    ).get_json()
+
+    assert response["total"] == 800_000
+    assert {row["status"] for row in response["data"]} == {"FAILED", "RUNNING"}
+
+
+def test_requires_bearer_token(client):
+    """API routes reject requests without a bearer token; auth routes do not."""
+    assert client.get("/api/v1/user").status_code == 401
+    login = client.post("/auth", json={"email": "a@example.org", "password": "x"})
+    assert login.status_code == 200
+    tokens = login.get_json()
+    refreshed = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert refreshed.get_json()["access_token"] != tokens["access_token"]
+
+
+def test_status_stats_logs_and_boundaries(client):
+    """The status page endpoints answer in the shapes the UI reads."""
+    status = client.get(
+        "/api/v1/status", query_string={"per_page": 1, "sort": "-timestamp"}, headers=AUTH
+    ).get_json()
+    assert len(status["data"]) == 1
+    assert "executions_active" in status["data"][0]
+
+    executions = client.get("/api/v1/stats/executions", headers=AUTH).get_json()["data"]
+    assert executions["time_series"] and executions["top_users"]
+
+    logs = client.get("/api/v1/execution/exec-7/log", headers=AUTH).get_json()["data"]
+    assert len(logs) == 10
+
+    boundaries = client.get("/api/v1/data/boundaries/list", headers=AUTH).get_json()
+    assert {"boundaryISO": "KEN", "boundaryName": "Kenya", "boundaryType": "ADM0"} in boundaries[
+        "boundaries"
+    ]
+
+
+def test_error_injection_can_be_changed_at_runtime(client):
+    """Fault injection is driven by /__mock__/config."""
+    response = client.post(
+        "/__mock__/config", json={"error_rate": 1.0, "error_statuses": [503]}
+    ).get_json()
+    assert response["error_rate"] == 1.0
+
+    assert client.get("/api/v1/script", headers=AUTH).status_code == 503
+    assert client.post("/__mock__/config", json={"bogus": 1}).status_code == 400
+
+
+def test_ui_fetches_pages_from_mock_server():
+    """The UI's grid fetch path works end to end against a live mock server."""
+    from trendsearth_ui import config as ui_config
+    from trendsearth_ui.utils.aggrid import fetch_aggrid_page
+
+    server = make_server("127.0.0.1", 0, create_app(MockAPIConfig(executions=1_000)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        environment = {"base": f"{base}/api/v1", "auth": f"{base}/auth"}
+        with (
+            patch.dict(ui_config.API_ENVIRONMENTS, {"local": environment}),
+            patch.object(ui_config, "FORCE_API_ENVIRONMENT", "local"),
+        ):
+            rows, total = fetch_aggrid_page(
+                "/execution", "mock-access-token", {"page": 2, "per_page": 25}, lambda data: data
+            )
+    finally:
+        server.shutdown()
+
+    assert total == 1_000
+    assert [row["id"] for row in rows][:2] == ["exec-26", "exec-27"]
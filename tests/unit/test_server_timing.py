@@ -0,0 +1,104 @@
+"""Tests for the Server-Timing breakdown on Dash callback responses."""
+
+from unittest.mock import Mock, patch
+
+import flask
+import requests
+
+from trendsearth_ui.utils import server_timing
+from trendsearth_ui.utils.http_client import PooledHTTPAdapter
+from trendsearth_ui.utils.metrics import InstrumentedTTLCache
+from trendsearth_ui.utils.server_timing import RequestTimings, timed, timed_phase
+
+
+def test_header_lists_phases_in_order_with_total():
+    """Known phases are rendered in a fixed order with call counts and a total."""
+    timings = RequestTimings()
+    timings.add("figure", 0.002)
+    timings.add("api", 0.010)
+    timings.add("api", 0.005)
+
+    header = timings.header_value()
+
+    assert header.startswith('api;dur=15.0;desc="Upstream API (2 calls)", figure;dur=2.0;')
+    assert header.split(", ")[-1].startswith("total;dur=")
+
+
+def test_record_outside_request_is_noop():
+    """Timing helpers are safe to use outside a Flask request."""
+    with timed("format"):
+        pass
+    assert server_timing.current_timings() is None
+
+
+def test_phases_recorded_on_callback_request():
+    """Adapter, cache and decorated helpers report into the current request."""
+    from trendsearth_ui import app as app_module
+
+    cache = InstrumentedTTLCache(maxsize=4, ttl=60)
+    cache["key"] = "value"
+
+    @timed_phase("figure")
+    def build_figure():
+        return cache.get("key")
+
+    with app_module.server.test_request_context("/_dash-update-component", method="POST"):
+        app_module.start_server_timing()
+        adapter = PooledHTTPAdapter()
+        request = requests.Request("GET", "https://api.trends.earth/api/v1/script/7").prepare()
+        with patch.object(
+            requests.adapters.HTTPAdapter, "send", return_value=Mock(status_code=200)
+        ):
+            adapter.send(request)
+        assert build_figure() == "value"
+        server_timing.mark_callback_finished()
+
+        response = app_module.add_security_headers(flask.Response())
+
+    header = response.headers["Server-Timing"]
+    for phase in ("api", "cache", "figure", "serialize", "total"):
+        assert f"{phase};dur=" in header
+
+
+def test_serialize_recorded_with_callback_metrics_disabled():
+    """Callbacks still mark their end for Server-Timing when callback metrics are off."""
+    from trendsearth_ui import app as app_module
+    from trendsearth_ui.utils import callback_metrics
+
+    class FakeApp:
+        def __init__(self):
+            self.registered = []
+
+        def callback(self, *_args, **_kwargs):
+            def decorator(func):
+                self.registered.append(func)
+                return func
+
+            return decorator
+
+    fake_app = FakeApp()
+    with (
+        patch.object(callback_metrics, "CALLBACK_METRICS_ENABLED", False),
+        patch.object(callback_metrics, "SERVER_TIMING_ENABLED", True),
+        patch.object(callback_metrics, "_record") as record_metrics,
+    ):
+        with callback_metrics.instrumented_callbacks(fake_app):
+            fake_app.callback("output", "input")(lambda: "rows")
+
+        with app_module.server.test_request_context("/_dash-update-component", method="POST"):
+            app_module.start_server_timing()
+            assert fake_app.registered[0]() == "rows"
+            response = app_module.add_security_headers(flask.Response())
+
+    record_metrics.assert_not_called()
+    assert "serialize;dur=" in response.headers["Server-Timing"]
+
+
+def test_header_only_on_callback_requests():
+    """Page loads and other routes do not carry a Server-Timing header."""
+    from trendsearth_ui import app as app_module
+
+    client = app_module.server.test_client()
+    response = client.get("/api-ui-health")
+
+    assert "Server-Timing" not in response.headers
@@ -0,0 +1,139 @@
+"""Tests for single-flight request coalescing."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from trendsearth_ui.config import get_api_base
+from trendsearth_ui.utils import helpers
+from trendsearth_ui.utils.singleflight import SingleFlight
+
+
+def _run_concurrently(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+def test_single_flight_shares_in_flight_call():
+    """Callers arriving while a call is in flight receive its result."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return "value"
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", work)))
+    leader.start()
+    started.wait(2)
+
+    followers = [
+        threading.Thread(target=lambda: results.append(flight.do("key", work))) for _ in range(3)
+    ]
+    for follower in followers:
+        follower.start()
+    deadline = time.monotonic() + 2
+    while flight.stats()["coalesced"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    leader.join(timeout=5)
+    for follower in followers:
+        follower.join(timeout=5)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert all(value == "value" for value, _ in results)
+    assert flight.stats() == {"issued": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_single_flight_propagates_errors_and_does_not_cache():
+    """Errors reach the caller and the next call starts a fresh execution."""
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError("upstream failed")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", boom)
+
+    assert flight.do("key", lambda: 2) == (2, False)
+    assert flight.stats()["issued"] == 2
+
+
+def test_make_authenticated_request_coalesces_identical_gets():
+    """Identical concurrent GETs with the same token share one upstream request."""
+    barrier = threading.Barrier(4, timeout=2)
+    response = Mock(status_code=200, text="{}", content=b"{}")
+    session = Mock()
+
+    def slow_get(*_args, **_kwargs):
+        threading.Event().wait(0.2)
+        return response
+
+    session.get.side_effect = slow_get
+    helpers._get_single_flight.reset_stats()
+
+    def request():
+        barrier.wait()
+        helpers.make_authenticated_request(
+            "https://api.example.org/status", "token", coalesce=True, params={"page": 1}
+        )
+
+    with patch("trendsearth_ui.utils.helpers.get_session", return_value=session):
+        _run_concurrently(4, request)
+
+    stats = helpers.get_request_coalescing_stats()
+    assert session.get.call_count == stats["issued"]
+    assert stats["issued"] + stats["coalesced"] == 4
+    assert stats["coalesced"] >= 1
+
+
+def test_make_authenticated_request_does_not_coalesce_across_tokens():
+    """Different auth scopes never share a response."""
+    response = Mock(status_code=200, text="{}", content=b"{}")
+    session = Mock()
+    session.get.return_value = response
+
+    with patch("trendsearth_ui.utils.helpers.get_session", return_value=session):
+        helpers.make_authenticated_request("https://api.example.org/user", "a", coalesce=True)
+        helpers.make_authenticated_request("https://api.example.org/user", "b", coalesce=True)
+
+    assert helpers._build_coalescing_key(
+        "https://api.example.org/user", "a", {"headers": {}}
+    ) != helpers._build_coalescing_key("https://api.example.org/user", "b", {"headers": {}})
+    assert session.get.call_count == 2
+
+
+def test_make_authenticated_request_uses_the_given_environment():
+    session = Mock()
+    session.get.return_value = Mock(status_code=200, text="{}")
+    with patch("trendsearth_ui.utils.helpers.get_session", return_value=session) as get_session:
+        helpers.make_authenticated_request("/user", "token", api_environment="staging")
+
+    get_session.assert_called_once_with("staging")
+    assert session.get.call_args.args[0] == get_api_base("staging") + "/user"
+
+
+def test_make_authenticated_request_never_coalesces_writes():
+    """Non-GET methods always go straight to the session."""
+    session = Mock()
+    session.post.return_value = Mock(status_code=200, text="{}")
+    helpers._get_single_flight.reset_stats()
+
+    with patch("trendsearth_ui.utils.helpers.get_session", return_value=session):
+        helpers.make_authenticated_request(
+            "https://api.example.org/user", "token", method="POST", coalesce=True, json={}
+        )
+
+    assert session.post.call_count == 1
+    assert helpers.get_request_coalescing_stats()["issued"] == 0
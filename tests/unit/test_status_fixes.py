@@ -49,6 +49,8 @@ class TestDeploymentInfoFixes:
         assert "main" in result_str
         # UI info should NOT be present (removed as per requirement)
         assert "Trends.Earth UI" not in result_str
+        # The environment's own session is used, also from background threads.
+        mock_get_session.assert_called_once_with("production")
 
     @patch("trendsearth_ui.utils.status_helpers.get_session")
     def test_fetch_deployment_info_with_api_error(self, mock_get_session):
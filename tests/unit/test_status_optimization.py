@@ -1,9 +1,11 @@
 """Test status page optimization features."""
 
+import time
 from unittest.mock import Mock, call, patch
 
 import pytest
 
+from trendsearth_ui.utils import status_data_manager
 from trendsearth_ui.utils.status_data_manager import StatusDataManager
 
 
@@ -51,7 +53,7 @@ class TestStatusDataManager:
         StatusDataManager.set_cached_data("stats_test1", {"data": "3"}, cache_type="stats")
 
         # Test pattern-based invalidation
-        cleared_count = StatusDataManager.invalidate_cache("status")
+        cleared_count = StatusDataManager.invalidate_cache("status_data")
         assert cleared_count >= 2  # Should clear at least the two status entries (may have others)
 
         # Verify status cache was cleared but stats cache wasn't
@@ -113,6 +115,100 @@ class TestStatusDataManager:
             # Should have only made one API call due to caching
             assert mock_session.get.call_count == 1
 
+    @patch("trendsearth_ui.utils.status_data_manager.get_session")
+    def test_consolidated_status_degrades_failed_section_only(self, mock_get_session):
+        """A failing cluster call leaves the other sections intact and is reported in meta."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": [{"timestamp": "2023-01-01"}]}
+        mock_get_session.return_value.get.return_value = mock_response
+
+        with (
+            patch(
+                "trendsearth_ui.utils.status_data_manager.fetch_deployment_info",
+                return_value={"deployment": "info"},
+            ),
+            patch(
+                "trendsearth_ui.utils.status_data_manager.fetch_cluster_info",
+                side_effect=RuntimeError("cluster down"),
+            ),
+            patch(
+                "trendsearth_ui.utils.status_data_manager.is_status_endpoint_available",
+                return_value=True,
+            ),
+        ):
+            result = StatusDataManager.fetch_consolidated_status_data(
+                token="test_token", api_environment="degraded", force_refresh=True
+            )
+
+        assert result["summary"] == "SUCCESS"
+        assert result["deployment"] == {"deployment": "info"}
+        assert result["cluster"] is None
+        assert result["meta"]["errors"] == {"cluster": "cluster down"}
+        assert set(result["meta"]["timings_ms"]) == {
+            "deployment",
+            "cluster",
+            "status_endpoint",
+            "latest_status",
+        }
+
+    @patch("trendsearth_ui.utils.status_data_manager.get_session")
+    def test_hanging_probe_does_not_replace_last_good_status(self, mock_get_session):
+        """A probe still running at the deadline neither caches the fallback nor drops good data."""
+        import threading
+
+        StatusDataManager.invalidate_cache()
+        release = threading.Event()
+        cache_key = StatusDataManager.get_cache_key(
+            "consolidated_status", api_environment="hanging", timezone="UTC"
+        )
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": [{"timestamp": "2023-01-01"}]}
+        mock_get_session.return_value.get.return_value = mock_response
+
+        def hanging_probe(*_args, **_kwargs):
+            release.wait(5)
+            return True
+
+        def fetch():
+            return StatusDataManager.fetch_consolidated_status_data(
+                token="test_token", api_environment="hanging", force_refresh=True
+            )
+
+        try:
+            with (
+                patch("trendsearth_ui.utils.status_data_manager.STATUS_FANOUT_TIMEOUT", 0.2),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_deployment_info",
+                    return_value={"deployment": "info"},
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_cluster_info",
+                    return_value=({"cluster": "info"}, ""),
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.is_status_endpoint_available",
+                    side_effect=hanging_probe,
+                ),
+            ):
+                # Nothing good cached yet: the successful status call is used, uncached.
+                first = fetch()
+                assert first["summary"] == "SUCCESS"
+                assert first["meta"]["pending"] == ["status_endpoint"]
+                assert StatusDataManager.get_cached_data(cache_key) is None
+
+                good = {"summary": "SUCCESS", "latest_status": {"id": 1}}
+                StatusDataManager.set_cached_data(cache_key, good)
+                second = fetch()
+        finally:
+            release.set()
+
+        assert second["stale"] is True
+        assert second["latest_status"] == {"id": 1}
+        assert StatusDataManager.get_cached_data(cache_key) == good
+        assert status_data_manager._last_good_data[cache_key][1] == good
+
     def test_consolidated_stats_data_permission_check(self):
         """Test that stats data fetching checks for SUPERADMIN permissions."""
         # Test with non-SUPERADMIN role
@@ -246,10 +342,14 @@ class TestStatusDataManager:
             )
 
         mock_get_cached.assert_called_once()
-        assert mock_dashboard.call_args_list == [
-            call("test_token", "production", "last_day", include_sections=None),
-            call("test_token", "production", "all", include_sections=["summary"]),
-        ]
+        # Sections are fetched concurrently, so the call order is not deterministic
+        assert mock_dashboard.call_count == 2
+        assert call("test_token", "production", "last_day", include_sections=None) in (
+            mock_dashboard.call_args_list
+        )
+        assert call("test_token", "production", "all", include_sections=["summary"]) in (
+            mock_dashboard.call_args_list
+        )
         mock_user_stats.assert_called_once()
         mock_execution_stats.assert_called_once()
         mock_scripts_count.assert_called_once()
@@ -295,6 +395,192 @@ class TestStatusDataManager:
         mock_set_cached.assert_not_called()
         assert result["execution_stats"] == {"error": True, "status_code": 400}
 
+    def test_consolidated_stats_deadline_marks_sections_pending(self):
+        """Sections that miss the deadline are pending and filled in on a later call."""
+        import threading
+
+        StatusDataManager.invalidate_cache()
+        release = threading.Event()
+
+        def slow_execution_stats(*_args, **_kwargs):
+            release.wait(2)
+            return {"data": {"time_series": [1]}}
+
+        with (
+            patch("trendsearth_ui.utils.status_data_manager.STATS_FETCH_DEADLINE", 0.2),
+            patch(
+                "trendsearth_ui.utils.status_data_manager.fetch_dashboard_stats",
+                return_value={"data": {"summary": {"total_users": 7}}},
+            ),
+            patch(
+                "trendsearth_ui.utils.status_data_manager.fetch_user_stats",
+                return_value={"data": {}},
+            ),
+            patch(
+                "trendsearth_ui.utils.status_data_manager.fetch_execution_stats",
+                side_effect=slow_execution_stats,
+            ),
+            patch(
+                "trendsearth_ui.utils.status_data_manager.fetch_scripts_count",
+                return_value=3,
+            ),
+            patch(
+                "trendsearth_ui.utils.status_data_manager.get_country_iso_resolver",
+                return_value=None,
+            ),
+        ):
+            first = StatusDataManager.fetch_consolidated_stats_data(
+                token="test_token",
+                api_environment="deadline",
+                time_period="week",
+                role="SUPERADMIN",
+                force_refresh=True,
+            )
+
+            assert first["pending_sections"] == ["execution_stats"]
+            assert first["execution_stats"] is None
+            assert first["total_users_all_time"] == 7
+            assert first["scripts_count"] == 3
+
+            release.set()
+            time.sleep(0.1)
+            second = StatusDataManager.fetch_consolidated_stats_data(
+                token="test_token",
+                api_environment="deadline",
+                time_period="week",
+                role="SUPERADMIN",
+            )
+
+        assert second["pending_sections"] == []
+        assert second["execution_stats"] == {"data": {"time_series": [1]}}
+        # The finished fan-out is no longer tracked.
+        assert len(status_data_manager._pending_stats_fetches) == 0
+
+    @patch("trendsearth_ui.utils.status_data_manager.get_session")
+    def test_stalled_stats_calls_do_not_delay_status_fanout(self, mock_get_session):
+        """Stats calls left running past their deadline cannot starve the status fan-out."""
+        import threading
+
+        StatusDataManager.invalidate_cache()
+        release = threading.Event()
+
+        def stalled(*_args, **_kwargs):
+            release.wait(5)
+            return {"data": {}}
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": [{"timestamp": "2023-01-01"}]}
+        mock_get_session.return_value.get.return_value = mock_response
+
+        try:
+            with (
+                patch("trendsearth_ui.utils.status_data_manager.STATS_FETCH_DEADLINE", 0.1),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_dashboard_stats",
+                    side_effect=stalled,
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_user_stats",
+                    side_effect=stalled,
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_execution_stats",
+                    side_effect=stalled,
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_scripts_count",
+                    side_effect=stalled,
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.get_country_iso_resolver",
+                    side_effect=stalled,
+                ),
+            ):
+                # More stalled stats calls than the default fan-out pool has threads.
+                for period in ("day", "week", "month"):
+                    stats = StatusDataManager.fetch_consolidated_stats_data(
+                        token="test_token",
+                        api_environment="stalled",
+                        time_period=period,
+                        role="SUPERADMIN",
+                        force_refresh=True,
+                    )
+                    assert "dashboard_stats" in stats["pending_sections"]
+
+            with (
+                patch("trendsearth_ui.utils.status_data_manager.STATUS_FANOUT_TIMEOUT", 1),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_deployment_info",
+                    return_value={"deployment": "info"},
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.fetch_cluster_info",
+                    return_value=({"cluster": "info"}, ""),
+                ),
+                patch(
+                    "trendsearth_ui.utils.status_data_manager.is_status_endpoint_available",
+                    return_value=True,
+                ),
+            ):
+                status = StatusDataManager.fetch_consolidated_status_data(
+                    token="test_token", api_environment="stalled", force_refresh=True
+                )
+        finally:
+            # Cancel the queued stats calls before they can run unpatched.
+            for key in list(status_data_manager._pending_stats_fetches):
+                status_data_manager._drop_pending_stats_sections(key)
+            release.set()
+
+        assert status["meta"]["pending"] == []
+        assert status["meta"]["elapsed_ms"] < 1000
+        assert status["deployment"] == {"deployment": "info"}
+
+    def test_stale_stats_revalidation_drops_pending_fanout(self):
+        """Serving a stale stats entry cancels the sections it was still waiting on."""
+        from concurrent.futures import Future
+
+        from trendsearth_ui.utils.fanout import FanOutResult
+
+        StatusDataManager.invalidate_cache()
+        cache_key = StatusDataManager.get_cache_key(
+            "consolidated_stats", api_environment="stale", period="last_week"
+        )
+        queued = Future()
+        status_data_manager._pending_stats_fetches[cache_key] = FanOutResult(
+            pending={"execution_stats": queued}
+        )
+        with patch.object(
+            status_data_manager.time,
+            "time",
+            return_value=time.time() - status_data_manager.STATS_CACHE_TTL - 1,
+        ):
+            StatusDataManager.set_cached_data(
+                cache_key, {"pending_sections": ["execution_stats"]}, cache_type="stats"
+            )
+
+        with (
+            patch.object(
+                StatusDataManager,
+                "fetch_consolidated_stats_data",
+                wraps=StatusDataManager.fetch_consolidated_stats_data,
+            ) as fetch,
+            patch(
+                "trendsearth_ui.utils.status_data_manager.run_fan_out", return_value=FanOutResult()
+            ),
+        ):
+            stale = StatusDataManager.fetch_consolidated_stats_data(
+                token="test_token", api_environment="stale", time_period="week", role="SUPERADMIN"
+            )
+            deadline = time.time() + 2
+            while status_data_manager._revalidating and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert stale["stale"] is True
+        assert fetch.call_args.kwargs == {"force_refresh": True}
+        assert queued.cancelled()
+        assert cache_key not in status_data_manager._pending_stats_fetches
+
     @patch("trendsearth_ui.utils.status_data_manager.get_session")
     def test_time_series_data_fetching_with_caching(self, mock_get_session):
         """Test time series data fetching with caching."""
@@ -391,7 +677,7 @@ class TestStatusCallbackOptimization:
             )
 
             # Verify that cache invalidation was called
-            mock_invalidate.assert_called_once_with("status")
+            mock_invalidate.assert_called_once_with("status_data")
 
     def test_optimization_integration_in_callbacks(self):
         """Test that StatusDataManager is properly imported and available in callbacks."""
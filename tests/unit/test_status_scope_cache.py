@@ -0,0 +1,118 @@
+"""Tests for the role-scoped status request cache."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from trendsearth_ui.callbacks import status
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    status._request_cache.clear()
+    status._verified_roles.clear()
+    yield
+    status._request_cache.clear()
+    status._verified_roles.clear()
+
+
+def _fetch(token, role="SUPERADMIN"):
+    return status._fetch_comprehensive_data_with_cache(
+        token=token,
+        api_environment="production",
+        time_period="day",
+        role=role,
+        safe_timezone="UTC",
+        force_refresh=False,
+    )
+
+
+def _user_info(roles):
+    return lambda token, _api_base: {"role": roles[token]} if token in roles else None
+
+
+def test_admins_with_the_same_verified_role_share_one_fetch():
+    """Concurrent superadmins wait on one upstream fetch and then hit the shared entry."""
+    release = threading.Event()
+    tokens = [f"admin-{n}" for n in range(10)]
+
+    def fetch(**_kwargs):
+        release.wait(5)
+        return {"status_data": {"ok": True}, "meta": {}}
+
+    with (
+        patch.object(
+            status, "get_user_info", side_effect=_user_info(dict.fromkeys(tokens, "SUPERADMIN"))
+        ),
+        patch.object(
+            status.StatusDataManager, "fetch_comprehensive_status_page_data", side_effect=fetch
+        ) as upstream,
+    ):
+        threads = [threading.Thread(target=_fetch, args=(token,)) for token in tokens]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        later = _fetch("admin-0")
+
+    assert upstream.call_count == 1
+    assert later["meta"]["request_cache_hit"] is True
+    assert list(status._request_cache) == [
+        "comprehensive_api_environment=production_period=day_scope=SUPERADMIN_timezone=UTC"
+    ]
+
+
+def test_unverified_role_claim_is_not_served_shared_entries():
+    """A token whose real role differs from the role store gets its own per-token entry."""
+    roles = {"admin": "SUPERADMIN", "user": "USER"}
+    with (
+        patch.object(status, "get_user_info", side_effect=_user_info(roles)) as user_info,
+        patch.object(
+            status.StatusDataManager,
+            "fetch_comprehensive_status_page_data",
+            return_value={"meta": {}},
+        ) as upstream,
+    ):
+        _fetch("admin")
+        _fetch("admin")
+        claimed = _fetch("user", role="SUPERADMIN")
+        unknown = _fetch("expired")
+
+    assert upstream.call_count == 3
+    assert "request_cache_hit" not in claimed["meta"]
+    assert "request_cache_hit" not in unknown["meta"]
+    scopes = sorted(key.fields["scope"] for key in status._request_cache)
+    assert scopes[0] == "SUPERADMIN"
+    assert len(scopes) == 3
+    assert all(scope.startswith("token=") for scope in scopes[1:])
+    assert user_info.call_count == 3  # the admin's role is verified once, then cached
+
+
+def test_forged_superadmin_role_is_not_served_cached_stats():
+    """An ADMIN token whose role store says SUPERADMIN never sees superadmin stats."""
+    manager = status.StatusDataManager
+    manager.invalidate_cache()
+    roles = {"superadmin": "SUPERADMIN", "admin": "ADMIN"}
+    try:
+        with (
+            patch.object(status, "get_user_info", side_effect=_user_info(roles)),
+            patch.object(
+                manager,
+                "fetch_consolidated_status_data",
+                return_value={"deployment": {}, "cluster": {"info": {}}},
+            ),
+            patch.object(manager, "fetch_time_series_status_data", return_value={}),
+            patch.object(
+                manager, "fetch_consolidated_stats_data", return_value={"secret": "stats"}
+            ) as stats,
+        ):
+            assert _fetch("superadmin")["stats_data"] == {"secret": "stats"}
+            forged = _fetch("admin", role="SUPERADMIN")
+    finally:
+        manager.invalidate_cache()
+
+    assert forged["stats_data"] is None
+    assert "stats_skipped_for_non_superadmin" in forged["meta"]["optimizations_applied"]
+    assert stats.call_count == 1
@@ -0,0 +1,99 @@
+"""Tests for stale-while-revalidate on the status page caches."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from trendsearth_ui.callbacks.status import _build_data_age
+from trendsearth_ui.utils import status_data_manager
+from trendsearth_ui.utils.status_data_manager import STATUS_CACHE_TTL, StatusDataManager
+
+
+@pytest.fixture(autouse=True)
+def clean_status_caches():
+    StatusDataManager.invalidate_cache()
+    yield
+    StatusDataManager.invalidate_cache()
+
+
+def _time_series_key():
+    return StatusDataManager.get_cache_key(
+        "time_series_status", api_environment="production", period="day"
+    )
+
+
+def _store(key, data, age):
+    status_data_manager._status_data_cache[key] = (time.time() - age, data)
+
+
+def test_expired_entry_is_served_stale_while_one_refetch_runs():
+    """Readers get the stale value at once; a single background fetch replaces it."""
+    key = _time_series_key()
+    _store(key, {"data": [1], "error": None}, age=STATUS_CACHE_TTL + 30)
+    release = threading.Event()
+
+    def slow_get(*_args, **_kwargs):
+        release.wait(5)
+        response = MagicMock()
+        response.json.return_value = {"data": [{"timestamp": "2026-01-01T00:00:00"}]}
+        return response
+
+    session = MagicMock()
+    session.get.side_effect = slow_get
+    with patch.object(status_data_manager, "get_session", return_value=session):
+        results = [
+            StatusDataManager.fetch_time_series_status_data("token", "production", "day")
+            for _ in range(3)
+        ]
+        release.set()
+        deadline = time.time() + 5
+        while StatusDataManager.get_cached_data(key) is None and time.time() < deadline:
+            time.sleep(0.01)
+
+    assert [result["data"] for result in results] == [[1], [1], [1]]
+    assert all(result["stale"] for result in results)
+    assert results[0]["stale_age_seconds"] >= STATUS_CACHE_TTL + 30
+    assert session.get.call_count == 1
+    assert StatusDataManager.get_cached_data(key)["data"] == [{"timestamp": "2026-01-01T00:00:00"}]
+
+
+def test_fresh_entry_is_returned_unmarked_without_refetch():
+    key = _time_series_key()
+    _store(key, {"data": [1]}, age=10)
+    refetch = MagicMock()
+
+    assert StatusDataManager.get_cached_data(key) == {"data": [1]}
+    assert StatusDataManager.get_stale_while_revalidate(key, refetch) == {"data": [1]}
+    assert StatusDataManager.get_stale_while_revalidate("missing", refetch) is None
+    refetch.assert_not_called()
+
+
+def test_comprehensive_meta_reports_age_and_staleness():
+    now = time.time()
+    result = StatusDataManager.with_freshness(
+        {
+            "status_data": {"fetched_at": now - 40},
+            "stats_data": {"fetched_at": now - 250, "stale": True},
+            "time_series_data": {"fetched_at": now - 10},
+            "meta": {"stale_sections": ["stats_data"], "cache_hit": True},
+        }
+    )
+
+    assert 249 <= result["meta"]["age_seconds"] <= 251
+    assert result["meta"]["is_stale"] is True
+    assert result["meta"]["cache_hit"] is True
+    assert StatusDataManager.with_freshness({"meta": {}})["meta"] == {
+        "age_seconds": 0,
+        "is_stale": False,
+    }
+
+
+def test_data_age_label_payload():
+    payload = _build_data_age({"age_seconds": 90, "is_stale": True})
+
+    assert abs(time.time() - 90 - payload["updated_at"]) < 2
+    assert payload["is_stale"] is True
+    assert "{seconds}" in payload["label"]
+    assert _build_data_age(None) is None
@@ -0,0 +1,186 @@
+"""Tests for the refresh-ahead status cache warmer."""
+
+from concurrent.futures import wait
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from werkzeug.serving import make_server
+
+from tests.mock_api import MockAPIConfig, create_app
+from trendsearth_ui import config as ui_config
+from trendsearth_ui.utils import cache_backend, status_warmer
+from trendsearth_ui.utils.cache_backend import SQLiteCacheBackend
+from trendsearth_ui.utils.status_data_manager import StatusDataManager
+from trendsearth_ui.utils.status_warmer import StatusCacheWarmer, WarmTarget
+
+
+@pytest.fixture(autouse=True)
+def clean_status_caches():
+    StatusDataManager.invalidate_cache()
+    yield
+    StatusDataManager.invalidate_cache()
+
+
+@pytest.fixture
+def local_api():
+    server = make_server("127.0.0.1", 0, create_app(MockAPIConfig(executions=50)), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_port}"
+    environment = {"base": f"{api_url}/api/v1", "auth": f"{api_url}/auth"}
+    with patch.dict(ui_config.API_ENVIRONMENTS, {"local": environment}):
+        yield "local"
+    server.shutdown()
+
+
+def _warmer(**kwargs):
+    kwargs.setdefault("email", "warmer@example.com")
+    kwargs.setdefault("password", "secret")
+    return StatusCacheWarmer(["local"], ["day"], **kwargs)
+
+
+def test_warms_status_stats_and_time_series(local_api):
+    """After one cycle a user's status page load is served from the warmed entries."""
+    warmer = _warmer()
+    try:
+        outcomes = [future.result() for future in warmer.run_pending()]
+        second_cycle = warmer.run_pending()
+    finally:
+        warmer.stop()
+
+    assert outcomes == ["ok", "ok", "ok"]
+    assert second_cycle == []  # the leases are held until shortly before expiry
+    for data_type, cache_type, params in (
+        ("consolidated_status", "status", {"timezone": "UTC"}),
+        ("consolidated_stats", "stats", {"period": "last_day"}),
+        ("time_series_status", "status", {"period": "day"}),
+    ):
+        key = StatusDataManager.get_cache_key(data_type, api_environment=local_api, **params)
+        assert StatusDataManager.get_cached_data(key, cache_type=cache_type) is not None
+
+    with patch("trendsearth_ui.utils.status_data_manager.run_fan_out") as fan_out:
+        StatusDataManager.fetch_comprehensive_status_page_data(
+            token="user-token", api_environment=local_api, time_period="day", role="SUPERADMIN"
+        )
+    fan_out.assert_not_called()
+
+
+def test_failed_refresh_releases_lease_and_backs_off():
+    """A failed target is retried after the back-off; the others keep their leases."""
+    warmer = _warmer()
+    failing = WarmTarget("stats", "local", "day")
+    outcomes = iter(["error", "ok"])
+
+    def refresh(target):
+        return next(outcomes) if target == failing else "ok"
+
+    with patch.object(warmer, "refresh", side_effect=refresh) as mock_refresh:
+        wait(warmer.run_pending())
+        assert warmer.run_pending() == []
+
+        warmer._retry_at[failing] = 0  # back-off elapsed
+        assert [future.result() for future in warmer.run_pending()] == ["ok"]
+    warmer.stop()
+
+    assert [call.args[0] for call in mock_refresh.call_args_list].count(failing) == 2
+
+
+def test_concurrency_is_capped():
+    """No more than max_concurrency refreshes run at once."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_refresh(_target):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return "ok"
+
+    warmer = StatusCacheWarmer(["local"], ["day", "week", "month"], token="t", max_concurrency=2)
+    with patch.object(warmer, "refresh", side_effect=slow_refresh):
+        wait(warmer.run_pending())
+    warmer.stop()
+
+    assert len(warmer.targets) == 7
+    assert peak == 2
+
+
+def test_expiring_service_token_is_renewed(local_api):
+    warmer = _warmer()
+    session = warmer._service_session(local_api)
+    session.expires_at = time.time()
+
+    with patch.object(
+        status_warmer,
+        "coordinated_refresh_access_token",
+        return_value=("renewed-token", 3600, "next-refresh"),
+    ) as refresh:
+        renewed = warmer._service_session(local_api)
+    warmer.stop()
+
+    refresh.assert_called_once_with(session.refresh_token, local_api)
+    assert (renewed.access_token, renewed.role) == ("renewed-token", "SUPERADMIN")
+
+
+def test_status_is_warmed_per_timezone():
+    warmer = StatusCacheWarmer(
+        ["local"], [], timezones=["UTC", "Europe/London", "Not/AZone"], token="t"
+    )
+    assert [target.timezone for target in warmer.targets] == ["UTC", "Europe/London"]
+
+    with (
+        patch.object(warmer, "_service_session"),
+        patch.object(StatusDataManager, "fetch_consolidated_status_data", return_value={}) as fetch,
+    ):
+        assert [future.result() for future in warmer.run_pending()] == ["ok", "ok"]
+    warmer.stop()
+
+    assert sorted(call.kwargs["user_timezone"] for call in fetch.call_args_list) == [
+        "Europe/London",
+        "UTC",
+    ]
+
+
+def test_workers_sharing_a_backend_claim_each_lease_once(tmp_path):
+    """Warmers racing on one shared lease store refresh every target exactly once."""
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+    with patch.object(cache_backend, "get_cache_backend", return_value=backend):
+        warmers = [
+            StatusCacheWarmer(["local"], ["day", "week"], token="t", max_concurrency=4)
+            for _ in range(4)
+        ]
+    refreshed = []
+    start = threading.Barrier(len(warmers))
+
+    def run(warmer):
+        start.wait()
+        return warmer.run_pending()
+
+    with patch.object(StatusCacheWarmer, "refresh", autospec=True) as refresh:
+        refresh.side_effect = lambda _self, target: refreshed.append(target) or "ok"
+        threads = [threading.Thread(target=lambda w=warmer: wait(run(w))) for warmer in warmers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    for warmer in warmers:
+        warmer.stop()
+
+    assert sorted(target.lease_key for target in refreshed) == sorted(
+        target.lease_key for target in warmers[0].targets
+    )
+
+
+def test_not_started_without_credentials_or_periods():
+    with patch.multiple(status_warmer, STATUS_WARMER_TOKEN="", STATUS_WARMER_EMAIL=""):
+        assert status_warmer.start_status_warmer() is None
+    with patch.multiple(status_warmer, STATUS_WARMER_TOKEN="t", STATUS_WARMER_PERIODS=[]):
+        assert status_warmer.start_status_warmer() is None
+    assert WarmTarget("stats", "production", "day").lease_key == "stats:production:day"
+    assert WarmTarget("status", "production", timezone="UTC").lease_key == "status:production:-:UTC"
@@ -0,0 +1,116 @@
+"""Tests for resolving clicked grid rows through the row index."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from trendsearth_ui.callbacks import _table_helpers
+from trendsearth_ui.callbacks._table_helpers import (
+    RowResolutionError,
+    resolve_row_data,
+    resolve_row_id,
+)
+from trendsearth_ui.utils import aggrid
+from trendsearth_ui.utils.aggrid import fetch_aggrid_page, lookup_row_id
+
+SORTED = {"sort_sql": "start_date desc", "filter_sql": None}
+
+
+@pytest.fixture(autouse=True)
+def clean_page_caches():
+    for cache in (aggrid._block_cache, aggrid._row_index, aggrid._last_good_pages):
+        cache.clear()
+    yield
+    for cache in (aggrid._block_cache, aggrid._row_index, aggrid._last_good_pages):
+        cache.clear()
+
+
+def _response(payload, status_code=200):
+    response = Mock(status_code=status_code, text="")
+    response.json.return_value = payload
+    return response
+
+
+def _serve_block(page, ids, table_state=SORTED, token="token"):
+    rows = [{"id": row_id} for row_id in ids]
+    with patch.object(
+        aggrid, "make_authenticated_request", return_value=_response({"data": rows, "total": 500})
+    ):
+        fetch_aggrid_page(
+            "/execution",
+            token,
+            {"page": page, "per_page": 50, "sort": "start_date desc"},
+            lambda data: data,
+            table_state=table_state,
+        )
+
+
+def test_served_blocks_are_indexed_per_session_and_table_state():
+    _serve_block(1, [f"e{n}" for n in range(50)])
+    _serve_block(3, ["e100", "e101"])
+
+    assert lookup_row_id("/execution", "token", SORTED, 0) == "e0"
+    assert lookup_row_id("/execution", "token", SORTED, 101) == "e101"
+    assert lookup_row_id("/execution", "token", SORTED, 60) is None
+    assert lookup_row_id("/execution", "other-token", SORTED, 0) is None
+    assert lookup_row_id("/execution", "token", {"sort_sql": "id asc"}, 0) is None
+
+
+def test_indexed_row_resolves_without_a_page_request():
+    _serve_block(2, ["e50", "e51", "e52"])
+    cell = {"colId": "logs", "rowIndex": 52}
+
+    with patch.object(_table_helpers, "make_authenticated_request") as request:
+        assert resolve_row_id(cell, "token", SORTED, "/execution") == "e52"
+    request.assert_not_called()
+
+    with patch.object(
+        _table_helpers,
+        "make_authenticated_request",
+        return_value=_response({"data": {"id": "e52", "status": "FINISHED"}}),
+    ) as request:
+        record = resolve_row_data(cell, "token", SORTED, "/execution", include="script_name")
+
+    assert record == {"id": "e52", "status": "FINISHED"}
+    request.assert_called_once_with("/execution/e52", "token", params={"include": "script_name"})
+
+
+def test_unindexed_row_falls_back_to_the_page_request():
+    cell = {"colId": "edit", "rowIndex": 101}
+    page = {"data": [{"id": f"u{n}"} for n in range(100, 105)]}
+
+    with patch.object(
+        _table_helpers, "make_authenticated_request", return_value=_response(page)
+    ) as request:
+        assert resolve_row_id(cell, "token", SORTED, "/user") == "u101"
+
+    assert request.call_args.kwargs["params"] == {
+        "page": 2,
+        "per_page": 100,
+        "sort": "start_date desc",
+    }
+
+    _serve_block(1, ["e0"])
+    with (
+        patch.object(_table_helpers, "make_authenticated_request", return_value=_response({}, 404)),
+        pytest.raises(RowResolutionError),
+    ):
+        resolve_row_data({"rowIndex": 0}, "token", SORTED, "/execution")
+
+
+def test_concurrent_blocks_keep_every_row():
+    """Blocks indexed at once do not overwrite each other's rows."""
+    start = threading.Barrier(8)
+
+    def index_block(page):
+        rows = [{"id": f"e{(page - 1) * 50 + n}"} for n in range(50)]
+        start.wait()
+        aggrid.index_rows("/execution", "token", SORTED, {"page": page, "per_page": 50}, rows)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(index_block, range(1, 9)))
+    indexed = [lookup_row_id("/execution", "token", SORTED, row) for row in range(400)]
+
+    assert indexed == [f"e{row}" for row in range(400)]
@@ -0,0 +1,185 @@
+"""Stress tests for the state shared between threads of a gthread worker."""
+
+import logging
+import random
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+from werkzeug.serving import make_server
+from werkzeug.wrappers import Request, Response
+
+from tests.load.runner import run_stage
+from tests.mock_api import MockAPIConfig, create_app
+from trendsearth_ui.utils.cache_backend import SharedTTLCache, SQLiteCacheBackend
+from trendsearth_ui.utils.http_client import create_session
+from trendsearth_ui.utils.metrics import (
+    InstrumentedTTLCache,
+    SizeAwareTTLCache,
+    SynchronizedLRUCache,
+)
+
+THREADS = 16
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    """Make the interpreter switch threads as often as possible to expose races."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _discard(cache, key):
+    # ``del`` rather than ``pop``: ``Cache.pop`` reads the value, which counts as a hit.
+    try:
+        del cache[key]
+    except KeyError:
+        pass
+
+
+def _hammer(cache, operations=3000):
+    """Mix reads, writes, deletes and scans from many threads; return (gets, errors)."""
+    gets = [0] * THREADS
+    errors = []
+
+    def work(index):
+        rng = random.Random(index)
+        try:
+            for _ in range(operations):
+                key = rng.randrange(48)
+                roll = rng.random()
+                if roll < 0.5:
+                    cache.get(key)
+                    gets[index] += 1
+                elif roll < 0.85:
+                    cache[key] = {"writer": index}
+                elif roll < 0.95:
+                    _discard(cache, key)
+                else:
+                    for existing in cache:
+                        _discard(cache, existing)
+        except Exception as exc:  # pragma: no cover - only on a race
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(gets), errors
+
+
+def test_ttl_cache_survives_concurrent_access():
+    """Expiring, evicting and counting stay consistent under contention."""
+    cache = InstrumentedTTLCache(maxsize=16, ttl=0.002)
+
+    gets, errors = _hammer(cache)
+
+    assert errors == []
+    assert cache.hits + cache.misses == gets
+    assert cache.evictions > 0
+    assert len(cache) <= cache.maxsize
+    cache.expire(float("inf"))
+    assert len(cache) == 0
+    assert list(cache) == []
+
+
+def test_size_aware_cache_survives_concurrent_access():
+    """Weights stay in step with the entries however the threads interleave."""
+    cache = SizeAwareTTLCache(maxsize=400, ttl=0.002, max_entries=16)
+
+    gets, errors = _hammer(cache)
+
+    assert errors == []
+    assert cache.hits + cache.misses == gets
+    assert cache.currsize <= cache.maxsize
+    assert sum(cache.weight(key) for key in cache) <= cache.currsize
+    cache.expire(float("inf"))
+    assert (len(cache), cache.currsize) == (0, 0)
+
+
+def test_lru_cache_survives_concurrent_access():
+    cache = SynchronizedLRUCache(maxsize=16)
+
+    _, errors = _hammer(cache)
+
+    assert errors == []
+    assert len(cache) <= cache.maxsize
+    assert len(list(cache)) == len(cache)
+    assert all(cache[key]["writer"] in range(THREADS) for key in cache)
+
+
+def test_shared_cache_counters_are_exact(tmp_path):
+    """Each thread uses its own SQLite connection; no lookups are lost or double counted."""
+    cache = SharedTTLCache("status_data", SQLiteCacheBackend(tmp_path / "c.db"), 32, ttl=60)
+
+    gets, errors = _hammer(cache, operations=200)
+
+    assert errors == []
+    assert cache.hits + cache.misses == gets
+
+
+def _serve(app):
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_shared_session_refuses_cookies():
+    """A Set-Cookie from one user's response must not be sent with another user's request."""
+
+    @Request.application
+    def echo_cookies(request):
+        response = Response(request.headers.get("Cookie", ""))
+        response.set_cookie("session", "alice")
+        return response
+
+    server = _serve(echo_cookies)
+    session = create_session()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/"
+        session.get(url, timeout=5)
+        second = session.get(url, timeout=5)
+    finally:
+        server.shutdown()
+
+    assert second.text == ""
+    assert len(session.cookies) == 0
+
+
+def test_concurrent_callbacks_have_no_races(caplog):
+    """Many admins on one threaded server share every cache without errors."""
+    from trendsearth_ui import app as app_module
+    from trendsearth_ui import config as ui_config
+
+    api = _serve(create_app(MockAPIConfig(executions=300)))
+    ui = _serve(app_module.server)
+    api_url = f"http://127.0.0.1:{api.server_port}"
+    environment = {"base": f"{api_url}/api/v1", "auth": f"{api_url}/auth"}
+    caplog.set_level(logging.ERROR)
+    try:
+        with (
+            patch.dict(ui_config.API_ENVIRONMENTS, {"local": environment}),
+            patch.object(ui_config, "FORCE_API_ENVIRONMENT", "local"),
+        ):
+            report = run_stage(
+                f"http://127.0.0.1:{ui.server_port}",
+                users=THREADS,
+                duration=3,
+                worker_slots=THREADS,
+                email="loadtest@example.com",
+                password="loadtest",
+                think_time=0.05,
+                ramp_up=0,
+                seed=11,
+            )
+    finally:
+        ui.shutdown()
+        api.shutdown()
+
+    assert report.errors == 0
+    assert sum(stats.count for stats in report.callbacks) > THREADS * 10
+    assert [record.getMessage() for record in caplog.records if record.exc_info] == []
@@ -2,12 +2,15 @@
 
 from datetime import datetime
 import json
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
 from trendsearth_ui.config import API_BASE
 from trendsearth_ui.utils.helpers import (
+    coordinated_refresh_access_token,
     get_user_info,
     parse_date,
     safe_table_data,
@@ -143,3 +146,47 @@ class TestGetUserInfoFunction:
         result = get_user_info(token)
 
         assert result is None
+
+
+class TestCoordinatedRefreshAccessToken:
+    """Test deduplication of concurrent refreshes of the same refresh token."""
+
+    def test_concurrent_refreshes_share_one_request(self):
+        """Only the first caller refreshes; the others reuse its new tokens."""
+        barrier = threading.Barrier(5, timeout=2)
+        results = []
+
+        def slow_refresh(_refresh_token, _api_environment=None):
+            time.sleep(0.1)
+            return "new-access", 3600, "rotated-refresh"
+
+        def worker():
+            barrier.wait()
+            results.append(coordinated_refresh_access_token("refresh-concurrent", "production"))
+
+        with patch(
+            "trendsearth_ui.utils.helpers.refresh_access_token", side_effect=slow_refresh
+        ) as mock_refresh:
+            threads = [threading.Thread(target=worker) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+            # A late caller still holding the old refresh token reuses the result
+            late = coordinated_refresh_access_token("refresh-concurrent", "production")
+
+        assert mock_refresh.call_count == 1
+        assert results == [("new-access", 3600, "rotated-refresh")] * 5
+        assert late == ("new-access", 3600, "rotated-refresh")
+
+    def test_failed_refresh_is_not_reused(self):
+        """A failed refresh is retried by the next caller."""
+        with patch(
+            "trendsearth_ui.utils.helpers.refresh_access_token",
+            return_value=(None, None, None),
+        ) as mock_refresh:
+            assert coordinated_refresh_access_token("refresh-failing") == (None, None, None)
+            assert coordinated_refresh_access_token("refresh-failing") == (None, None, None)
+
+        assert mock_refresh.call_count == 2
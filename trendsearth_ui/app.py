@@ -1,4 +1,5 @@
 import base64
+import hmac
 import os
 import re
 
@@ -20,18 +21,35 @@ from .callbacks import register_all_callbacks  # noqa: E402
 from .components import create_main_layout  # noqa: E402
 
 # Import configuration
-from .config import APP_HOST, APP_PORT, APP_TITLE  # noqa: E402
+from .config import (  # noqa: E402
+    APP_HOST,
+    APP_PORT,
+    APP_TITLE,
+    METRICS_AUTH_TOKEN,
+    METRICS_ENABLED,
+    SERVER_TIMING_ENABLED,
+)
 
 # Import internationalization support
 from .i18n import SUPPORTED_LANGUAGES, get_current_language, init_i18n  # noqa: E402
 from .i18n.dash_i18n import register_language_callbacks  # noqa: E402
 
+# Import callback instrumentation
+from .utils.callback_metrics import instrumented_callbacks  # noqa: E402
+
 # Import deployment utilities
 from .utils.deployment_info import get_health_response  # noqa: E402
 
 # Import logging configuration
 from .utils.logging_config import is_rollbar_initialized, setup_logging  # noqa: E402
 
+# Import metrics export
+from .utils.metrics import render_metrics  # noqa: E402
+from .utils.server_timing import current_timings, start_request  # noqa: E402
+
+# Import the background cache warmer
+from .utils.status_warmer import start_status_warmer  # noqa: E402
+
 # Initialize logging with Rollbar if token is available
 rollbar_token = os.environ.get("ROLLBAR_ACCESS_TOKEN")
 logger = setup_logging(rollbar_token)
@@ -209,6 +227,22 @@ def health_check():
         return {"status": "error", "message": "Health check failed"}, 500
 
 
+if METRICS_ENABLED and not METRICS_AUTH_TOKEN:
+    logger.warning("METRICS_ENABLED is set without METRICS_AUTH_TOKEN; /metrics stays off")
+
+
+@server.route("/metrics")
+def metrics():
+    """Prometheus metrics for upstream API latency and cache effectiveness."""
+    if not METRICS_ENABLED or not METRICS_AUTH_TOKEN:
+        return {"status": "error", "message": "Not found"}, 404
+    if not hmac.compare_digest(
+        flask.request.headers.get("Authorization", ""), f"Bearer {METRICS_AUTH_TOKEN}"
+    ):
+        return {"status": "error", "message": "Unauthorized"}, 401
+    return flask.Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+
 @server.route("/favicon.ico")
 def favicon():
     return send_from_directory(assets_dir, "favicon.ico", mimetype="image/x-icon")
@@ -231,6 +265,13 @@ def set_csp_nonce() -> None:
     _get_csp_nonce()
 
 
+@server.before_request
+def start_server_timing() -> None:
+    """Start the per-request Server-Timing accumulator for Dash callbacks."""
+    if SERVER_TIMING_ENABLED and flask.request.path.endswith("_dash-update-component"):
+        start_request()
+
+
 # Add global error handlers
 _CSP_STYLE_SOURCES = [
     "'self'",
@@ -298,6 +339,10 @@ def add_security_headers(response):
             "Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload"
         )
 
+    timings = current_timings()
+    if timings is not None:
+        response.headers.setdefault("Server-Timing", timings.header_value())
+
     return response
 
 
@@ -459,7 +504,11 @@ def not_found(_error):
 register_all_callbacks(app)
 
 # Register language-related callbacks for i18n
-register_language_callbacks(app)
+with instrumented_callbacks(app):
+    register_language_callbacks(app)
+
+# Keep the status page caches warm (no-op unless STATUS_WARMER_* is configured)
+start_status_warmer()
 
 
 @server.route("/api/set-language/<lang>")
@@ -3,6 +3,7 @@
 import importlib
 import logging
 
+from ..utils.callback_metrics import instrumented_callbacks
 from ..utils.custom_filters import register_filter_callbacks
 from ..utils.mobile_utils import register_mobile_callbacks
 from . import status
@@ -11,7 +12,17 @@ logger = logging.getLogger(__name__)
 
 
 def register_all_callbacks(app):
-    """Register all callbacks with the Dash app."""
+    """Register all callbacks with the Dash app.
+
+    Server-side callbacks registered here are wrapped with per-callback
+    latency and payload-size instrumentation (see ``utils.callback_metrics``).
+    """
+    with instrumented_callbacks(app):
+        _register_callback_modules(app)
+
+
+def _register_callback_modules(app):
+    """Register the callbacks of every callback module."""
     # First register mobile detection callbacks
     register_mobile_callbacks()
 
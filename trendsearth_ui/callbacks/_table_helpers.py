@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from ..config import DEFAULT_PAGE_SIZE
+from ..utils.aggrid import lookup_row_id
 from ..utils.helpers import make_authenticated_request
 
 
@@ -35,8 +36,10 @@ def resolve_row_data(
     """Return row data for a clicked AG Grid cell.
 
     The grid sometimes omits ``data`` when virtualization or pagination kicks in. In that
-    situation we replicate the table request made by the frontend to retrieve the specific
-    record for the provided ``rowIndex``.
+    situation the record id is looked up in the row index filled as blocks were served
+    (see :func:`~trendsearth_ui.utils.aggrid.lookup_row_id`) and only that record is
+    fetched. If the row was never indexed, we replicate the table request made by the
+    frontend to retrieve the specific record for the provided ``rowIndex``.
 
     Args:
         cell: Dash cell payload with ``data`` and ``rowIndex`` keys.
@@ -63,20 +66,9 @@ def resolve_row_data(
     if isinstance(row_data, Mapping) and row_data.get(id_field) is not None:
         return row_data
 
-    if token is None:
-        raise RowResolutionError("Authentication token is required to resolve row data.")
-
-    row_index = cell.get("rowIndex") if isinstance(cell, Mapping) else None
-    if row_index is None:
-        raise RowResolutionError("Row index not provided in cell payload.")
-
-    if row_index < 0:
-        raise RowResolutionError(f"Invalid row index: {row_index}.")
-
-    page = (row_index // page_size) + 1
-    row_in_page = row_index % page_size
+    row_index = _checked_row_index(cell, token)
 
-    params: dict[str, Any] = {"page": page, "per_page": page_size}
+    params: dict[str, Any] = {}
     if include:
         params["include"] = include
     if exclude:
@@ -84,6 +76,14 @@ def resolve_row_data(
     if extra_params:
         params.update(extra_params)
 
+    record_id = lookup_row_id(endpoint, token, table_state, row_index)
+    if record_id is not None:
+        return _fetch_record(endpoint, token, record_id, params, id_field)
+
+    page = (row_index // page_size) + 1
+    row_in_page = row_index % page_size
+    params.update({"page": page, "per_page": page_size})
+
     if isinstance(table_state, Mapping):
         sort_sql = table_state.get("sort_sql")
         filter_sql = table_state.get("filter_sql")
@@ -114,3 +114,72 @@ def resolve_row_data(
         raise RowResolutionError("Resolved record is missing required identifier field.")
 
     return record
+
+
+def resolve_row_id(
+    cell: Mapping[str, Any] | None,
+    token: str | None,
+    table_state: Mapping[str, Any] | None,
+    endpoint: str,
+    *,
+    id_field: str = "id",
+    **kwargs: Any,
+) -> Any:
+    """Return the record id for a clicked AG Grid cell.
+
+    For callbacks that fetch the record themselves: the id comes from the cell
+    payload or the row index without any request, and only when both lack it
+    does this fall back to :func:`resolve_row_data` (with *kwargs*).
+
+    Raises:
+        RowResolutionError: When the row cannot be determined.
+    """
+    if not cell:
+        raise RowResolutionError("Cell payload is missing.")
+
+    row_data = cell.get("data") if isinstance(cell, Mapping) else None
+    if isinstance(row_data, Mapping) and row_data.get(id_field) is not None:
+        return row_data[id_field]
+
+    row_index = _checked_row_index(cell, token)
+    record_id = lookup_row_id(endpoint, token, table_state, row_index)
+    if record_id is not None:
+        return record_id
+    return resolve_row_data(cell, token, table_state, endpoint, id_field=id_field, **kwargs)[
+        id_field
+    ]
+
+
+def _checked_row_index(cell: Mapping[str, Any], token: str | None) -> int:
+    if token is None:
+        raise RowResolutionError("Authentication token is required to resolve row data.")
+
+    row_index = cell.get("rowIndex") if isinstance(cell, Mapping) else None
+    if row_index is None:
+        raise RowResolutionError("Row index not provided in cell payload.")
+
+    if row_index < 0:
+        raise RowResolutionError(f"Invalid row index: {row_index}.")
+    return row_index
+
+
+def _fetch_record(
+    endpoint: str, token: str, record_id: Any, params: Mapping[str, Any], id_field: str
+) -> Mapping[str, Any]:
+    """Fetch the single record *record_id* from ``{endpoint}/{record_id}``."""
+    response = make_authenticated_request(f"{endpoint}/{record_id}", token, params=dict(params))
+    if response.status_code != 200:
+        raise RowResolutionError(
+            f"Failed to fetch record {record_id} ({response.status_code}): {response.text[:200]}"
+        )
+
+    try:
+        payload = response.json()
+    except ValueError as exc:  # pragma: no cover - defensive
+        raise RowResolutionError(f"Invalid JSON payload: {exc}") from exc
+
+    record = payload.get("data", payload) if isinstance(payload, Mapping) else None
+    if not isinstance(record, Mapping) or record.get(id_field) is None:
+        raise RowResolutionError("Resolved record is missing required identifier field.")
+
+    return record
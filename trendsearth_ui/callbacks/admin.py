@@ -14,6 +14,7 @@ from requests.exceptions import Timeout as RequestsTimeout
 from ..config import DEFAULT_PAGE_SIZE
 from ..i18n import gettext as _
 from ..utils.aggrid import build_aggrid_request_params
+from ..utils.callback_metrics import get_callback_summary
 from ..utils.helpers import is_admin, is_superadmin, make_authenticated_request, parse_date
 
 logger = logging.getLogger(__name__)
@@ -494,6 +495,50 @@ def _query_rate_limit_breaches(
     return {"rowData": rows, "rowCount": total_rows}, table_state, total_rows
 
 
+def _build_callback_metrics_table(rows: list[dict[str, Any]]) -> Any:
+    """Render the per-callback performance summary as a compact table."""
+    if not rows:
+        return html.P(_("No callback metrics recorded yet."), className="text-muted")
+
+    def _kilobytes(value: float | None) -> str:
+        return "-" if value is None else f"{value / 1024:.1f}"
+
+    header = html.Thead(
+        html.Tr(
+            [
+                html.Th(_("Callback")),
+                html.Th(_("Calls")),
+                html.Th(_("Avg (ms)")),
+                html.Th(_("Max (ms)")),
+                html.Th(_("Avg API (ms)")),
+                html.Th(_("No update")),
+                html.Th(_("Errors")),
+                html.Th(_("Avg in (KB)")),
+                html.Th(_("Avg out (KB)")),
+            ]
+        )
+    )
+    body = html.Tbody(
+        [
+            html.Tr(
+                [
+                    html.Td(html.Code(row["callback"])),
+                    html.Td(row["calls"]),
+                    html.Td(f"{row['avg_ms']:.0f}"),
+                    html.Td(f"{row['max_ms']:.0f}"),
+                    html.Td(f"{row['avg_upstream_ms']:.0f}"),
+                    html.Td(f"{row['no_update_rate']:.0%}"),
+                    html.Td(row["errors"]),
+                    html.Td(_kilobytes(row["avg_input_bytes"])),
+                    html.Td(_kilobytes(row["avg_output_bytes"])),
+                ]
+            )
+            for row in rows
+        ]
+    )
+    return dbc.Table([header, body], striped=True, hover=True, size="sm", responsive=True)
+
+
 def register_callbacks(app):
     """Register admin-related callbacks."""
 
@@ -1545,3 +1590,14 @@ def register_callbacks(app):
                 no_update,
                 rate_limit_data,
             )
+
+    @app.callback(
+        Output("callback-metrics-table", "children"),
+        Input("refresh-callback-metrics-btn", "n_clicks"),
+        State("role-store", "data"),
+    )
+    def refresh_callback_metrics(_n_clicks, role):
+        """Show the slowest callbacks to superadmins."""
+        if not is_superadmin(role):
+            return no_update
+        return _build_callback_metrics_table(get_callback_summary(limit=25))
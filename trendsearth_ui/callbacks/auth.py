@@ -25,10 +25,10 @@ from ..config import detect_api_environment_from_host, get_api_base, get_auth_ur
 from ..i18n import force_locale
 from ..i18n import gettext as _
 from ..utils import (
+    coordinated_refresh_access_token,
     create_auth_cookie_data,
     get_user_info,
     logout_user,
-    refresh_access_token,
     should_refresh_token,
 )
 from ..utils.helpers import extract_api_error, is_admin
@@ -983,7 +983,7 @@ def register_callbacks(app):
             return no_update
 
         # Try to refresh the token using the stored API environment
-        new_access_token, expires_in, new_refresh_token = refresh_access_token(
+        new_access_token, expires_in, new_refresh_token = coordinated_refresh_access_token(
             refresh_token, api_environment or "production"
         )
         if new_access_token and new_access_token != current_token:
@@ -1080,7 +1080,7 @@ def register_callbacks(app):
             return no_update, no_update
 
         # Try to refresh the token proactively
-        new_access_token, expires_in, new_refresh_token = refresh_access_token(
+        new_access_token, expires_in, new_refresh_token = coordinated_refresh_access_token(
             refresh_token, api_environment or "production"
         )
         if new_access_token:
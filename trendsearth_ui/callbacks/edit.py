@@ -8,8 +8,12 @@ from dash import Input, Output, State, no_update
 from ..config import get_api_base
 from ..i18n import gettext as _
 from ..utils import get_user_info
+from ..utils.aggrid import invalidate_aggrid_blocks
 from ..utils.helpers import extract_api_error, make_authenticated_request
 from ._table_helpers import RowResolutionError, resolve_row_data
+from .executions import EXECUTION_ENDPOINT
+from .scripts import SCRIPT_ENDPOINT
+from .users import USER_ENDPOINT
 
 logger = logging.getLogger(__name__)
 
@@ -214,6 +218,8 @@ def register_callbacks(app):
 
         if resp.status_code == 200:
             logger.debug("User %s updated successfully", user_id)
+            # Execution rows show the user's name and email too
+            invalidate_aggrid_blocks(USER_ENDPOINT, EXECUTION_ENDPOINT)
             # Close modal and trigger table refresh
             return False, (current_refresh_clicks or 0) + 1
         else:
@@ -263,6 +269,8 @@ def register_callbacks(app):
 
         if resp.status_code == 200:
             logger.debug("Script %s updated successfully", script_id)
+            # Execution rows show the script's name too
+            invalidate_aggrid_blocks(SCRIPT_ENDPOINT, EXECUTION_ENDPOINT)
             # Close modal and trigger table refresh
             return False, (current_refresh_clicks or 0) + 1
         else:
@@ -344,6 +352,7 @@ def register_callbacks(app):
 
             if resp.status_code in [200, 204]:
                 logger.debug("User %s deleted successfully", user_id)
+                invalidate_aggrid_blocks(USER_ENDPOINT, EXECUTION_ENDPOINT)
                 # Close both modals and refresh users table
                 return False, False, (current_refresh_clicks or 0) + 1
             else:
@@ -419,6 +428,7 @@ def register_callbacks(app):
 
             if resp.status_code in [200, 204]:
                 logger.debug("Script %s deleted successfully", script_id)
+                invalidate_aggrid_blocks(SCRIPT_ENDPOINT, EXECUTION_ENDPOINT)
                 # Close both modals and refresh scripts table
                 return False, False, (current_refresh_clicks or 0) + 1
             else:
@@ -5,15 +5,18 @@ from typing import Any
 
 from dash import Input, Output, State, html, no_update
 
-from ..config import DEFAULT_PAGE_SIZE
+from ..config import DEFAULT_PAGE_SIZE, EXECUTIONS_KEYSET_PAGINATION
 from ..i18n import gettext as _
 from ..utils import format_duration, is_admin, make_authenticated_request, parse_date
 from ..utils.aggrid import (
     build_aggrid_request_params,
     build_refresh_request_params,
     fetch_aggrid_page,
+    invalidate_aggrid_blocks,
+    prefetch_next_block,
 )
 from ..utils.mobile_utils import get_executions_columns_for_role
+from ..utils.server_timing import timed
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,8 @@ EXECUTION_ALLOWED_FILTER_COLUMNS = {
     "user_email",
     "user_id",
 }
+# Never-null sort columns the grid can be paged by cursor on (EXECUTIONS_KEYSET_PAGINATION)
+EXECUTION_KEYSET_COLUMNS = ("start_date", "id")
 
 
 def _build_base_params(role: str | None, *, include_paging: bool = False) -> dict[str, Any]:
@@ -116,14 +121,28 @@ def _fetch_execution_page(
     *,
     role: str | None,
     user_timezone: str | None,
+    use_cache: bool = True,
+    prefetch: bool = False,
+    table_state: dict[str, Any] | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
-    """Fetch one page of executions from the API and format the rows."""
-    return fetch_aggrid_page(
+    """Fetch one page of executions from the API and format the rows.
+
+    With *prefetch*, the following page is then fetched in the background.
+    With *table_state*, the rows are indexed for cell-click resolution.
+    """
+    keyset_columns = EXECUTION_KEYSET_COLUMNS if EXECUTIONS_KEYSET_PAGINATION else None
+    rows, total = fetch_aggrid_page(
         EXECUTION_ENDPOINT,
         token,
         params,
         lambda data: process_execution_data(data, role, user_timezone),
+        use_cache=use_cache,
+        table_state=table_state,
+        keyset_columns=keyset_columns,
     )
+    if prefetch:
+        prefetch_next_block(EXECUTION_ENDPOINT, token, params, total, keyset_columns=keyset_columns)
+    return rows, total
 
 
 def register_callbacks(app):
@@ -176,7 +195,12 @@ def register_callbacks(app):
             )
 
             tabledata, total_rows = _fetch_execution_page(
-                token, params, role=role, user_timezone=user_timezone
+                token,
+                params,
+                role=role,
+                user_timezone=user_timezone,
+                prefetch=True,
+                table_state=table_state,
             )
 
             return {"rowData": tabledata, "rowCount": total_rows}, table_state, total_rows
@@ -219,7 +243,12 @@ def register_callbacks(app):
             )
 
             tabledata, total_rows = _fetch_execution_page(
-                token, params, role=role, user_timezone=user_timezone
+                token,
+                params,
+                role=role,
+                user_timezone=user_timezone,
+                use_cache=False,
+                table_state=table_state or {},
             )
 
             # Reset countdown timer to 0 when manually refreshed
@@ -277,7 +306,12 @@ def register_callbacks(app):
             )
 
             tabledata, total_rows = _fetch_execution_page(
-                token, params, role=role, user_timezone=user_timezone
+                token,
+                params,
+                role=role,
+                user_timezone=user_timezone,
+                use_cache=False,
+                table_state=table_state or {},
             )
 
             # Preserve table state from current state
@@ -530,6 +564,7 @@ def register_callbacks(app):
             )
 
             if resp.status_code in [200, 202]:
+                invalidate_aggrid_blocks(EXECUTION_ENDPOINT)
                 result = resp.json()
                 execution_info = result.get("data", {}).get("execution", {})
                 cancellation_details = result.get("data", {}).get("cancellation_details", {})
@@ -780,7 +815,8 @@ def register_callbacks(app):
                 total_rows = refresh_result.get("total", 0)
 
                 # Process execution data consistently
-                tabledata = process_execution_data(refresh_executions, role, user_timezone)
+                with timed("format"):
+                    tabledata = process_execution_data(refresh_executions, role, user_timezone)
 
                 table_response = {"rowData": tabledata, "rowCount": total_rows}
 
@@ -4,8 +4,8 @@ import logging
 
 from dash import MATCH, Input, Output, State, html, no_update
 
-from ..config import DEFAULT_PAGE_SIZE
 from ..utils.helpers import make_authenticated_request
+from ._table_helpers import resolve_row_id
 
 logger = logging.getLogger(__name__)
 
@@ -39,53 +39,18 @@ def register_callbacks(app):
         if row_data:
             execution_id = row_data.get("id")
 
-        # If we don't have execution_id from row data, fall back to pagination approach
+        # If we don't have execution_id from row data, use the row index (or pagination)
         if not execution_id:
-            row_index = cell_clicked.get("rowIndex")
-            if row_index is None:
-                return False, [], "Could not get row index from cell click event."
-
             try:
-                # Calculate which page this row is on
-                page_size = DEFAULT_PAGE_SIZE
-                page = (row_index // page_size) + 1
-                row_in_page = row_index % page_size
-
-                params = {
-                    "page": page,
-                    "per_page": page_size,
-                    "exclude": "results",  # We need params for map, so exclude only results
-                    "include": "script_name,user_name,user_email,user_id,duration",
-                }
-
-                # Apply the same sort and filter that the table is currently using
-                if table_state:
-                    if table_state.get("sort_sql"):
-                        params["sort"] = table_state["sort_sql"]
-                    if table_state.get("filter_sql"):
-                        params["filter"] = table_state["filter_sql"]
-
-                resp = make_authenticated_request("/execution", token, params=params)
-                if resp.status_code != 200:
-                    return (
-                        False,
-                        [],
-                        f"Failed to fetch execution data: {resp.status_code} - {resp.text}",
-                    )
-
-                result = resp.json()
-                executions = result.get("data", [])
-
-                if row_in_page >= len(executions):
-                    return (
-                        False,
-                        [],
-                        f"Row index {row_in_page} out of range for page {page} (found {len(executions)} executions)",
-                    )
-
-                execution = executions[row_in_page]
-                execution_id = execution.get("id")
-
+                execution_id = resolve_row_id(
+                    cell_clicked,
+                    token,
+                    table_state,
+                    "/execution",
+                    # We need params for map, so exclude only results
+                    exclude="results",
+                    include="script_name,user_name,user_email,user_id,duration",
+                )
             except Exception as e:
                 return False, [], f"Error fetching execution data: {str(e)}"
 
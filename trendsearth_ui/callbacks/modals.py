@@ -7,7 +7,7 @@ import dash_bootstrap_components as dbc
 
 from ..config import DEFAULT_PAGE_SIZE
 from ..utils import make_authenticated_request, parse_date, render_json_tree
-from ._table_helpers import RowResolutionError, resolve_row_data
+from ._table_helpers import RowResolutionError, resolve_row_data, resolve_row_id
 
 logger = logging.getLogger(__name__)
 
@@ -351,11 +351,11 @@ def register_callbacks(app):
         execution = row_data if isinstance(row_data, dict) else None
         execution_id = execution.get("id") if execution else None
 
-        # If we don't have execution_id from row data, fall back to pagination approach
+        # If we don't have execution_id from row data, use the row index (or pagination)
         if not execution_id:
             logger.debug("No execution_id from row_data, resolving via helper for column %s", col)
             try:
-                execution = resolve_row_data(
+                execution_id = resolve_row_id(
                     cell,
                     token,
                     table_state,
@@ -363,7 +363,6 @@ def register_callbacks(app):
                     include="script_name,user_name,user_email,user_id,duration",
                     exclude="params,results",
                 )
-                execution_id = execution.get("id") if execution else None
                 if execution_id:
                     logger.debug(
                         "Resolved execution_id %s with helper for column %s",
@@ -1143,18 +1142,17 @@ def register_callbacks(app):
         script = row_data if isinstance(row_data, dict) else None
         script_id = script.get("id") if script else None
 
-        # If we don't have row data or script_id, fall back to pagination approach
+        # If we don't have row data or script_id, use the row index (or pagination)
         if not script_id:
             logger.debug("No script_id from row_data, resolving via helper for script logs")
             try:
-                script = resolve_row_data(
+                script_id = resolve_row_id(
                     cell,
                     token,
                     table_state,
                     "/script",
                     include="user_name",
                 )
-                script_id = script.get("id") if script else None
                 if script_id:
                     logger.debug("Resolved script_id %s via helper for script logs", script_id)
             except RowResolutionError as exc:
@@ -34,7 +34,7 @@ def fetch_news_items(api_environment, platform="api-ui"):
             "Content-Type": "application/json",
         }
 
-        session = get_session()
+        session = get_session(api_environment)
         response = session.get(url, headers=headers, params=params, timeout=10)
 
         if response.status_code == 200:
@@ -11,6 +11,7 @@ from ..utils.aggrid import (
     build_aggrid_request_params,
     build_refresh_request_params,
     fetch_aggrid_page,
+    prefetch_next_block,
 )
 from ..utils.helpers import is_admin
 
@@ -93,13 +94,21 @@ def _fetch_scripts_page(
     *,
     is_admin: bool,
     user_timezone: str | None,
+    use_cache: bool = True,
+    prefetch: bool = False,
+    table_state: dict[str, Any] | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
-    return fetch_aggrid_page(
+    rows, total = fetch_aggrid_page(
         SCRIPT_ENDPOINT,
         token,
         params,
         lambda data: _format_scripts_rows(data, is_admin, user_timezone),
+        use_cache=use_cache,
+        table_state=table_state,
     )
+    if prefetch:
+        prefetch_next_block(SCRIPT_ENDPOINT, token, params, total)
+    return rows, total
 
 
 def register_callbacks(app):
@@ -141,6 +150,8 @@ def register_callbacks(app):
                 params,
                 is_admin=is_admin_user,
                 user_timezone=user_timezone,
+                prefetch=True,
+                table_state=table_state,
             )
 
             return {"rowData": tabledata, "rowCount": total_rows}, table_state, total_rows
@@ -188,6 +199,8 @@ def register_callbacks(app):
                 params,
                 is_admin=is_admin_user,
                 user_timezone=user_timezone,
+                use_cache=False,
+                table_state=table_state or {},
             )
 
             return {"rowData": tabledata, "rowCount": total_rows}, table_state or {}, total_rows
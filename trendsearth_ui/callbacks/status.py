@@ -1,15 +1,18 @@
 """Optimized status dashboard callbacks with reduced API calls and enhanced caching."""
 
 from datetime import UTC, datetime
+import hashlib
 import logging
 
-from cachetools import TTLCache
 from dash import Input, Output, State, callback_context, dcc, html, no_update
 import dash_bootstrap_components as dbc
 
-from ..config import STATUS_REFRESH_INTERVAL
+from ..config import STATUS_CACHE_MAX_MB, STATUS_REFRESH_INTERVAL, get_api_base
 from ..i18n import gettext as _
-from ..utils.helpers import is_admin
+from ..utils.cache_manager import CacheKey, cache_manager
+from ..utils.helpers import get_user_info, is_admin
+from ..utils.server_timing import timed_phase
+from ..utils.singleflight import SingleFlight
 from ..utils.stats_visualizations import (
     build_period_summary_cards,
     create_execution_statistics_chart,
@@ -29,8 +32,18 @@ from ..utils.timezone_utils import (
 
 logger = logging.getLogger(__name__)
 
-# Request-level cache for sharing data between callbacks
-_request_cache = TTLCache(maxsize=20, ttl=270)  # 4.5-minute TTL for request-level sharing
+# Request-level cache for sharing data between callbacks and between admins.
+# Entries are keyed by authorization scope (the verified role), not by token.
+_request_cache = cache_manager.namespace(
+    "status_request", maxsize=20, ttl=270, max_bytes=STATUS_CACHE_MAX_MB * 1024 * 1024
+)  # 4.5-minute TTL for request-level sharing
+
+# The role the API reports for each token (hashed), so scope-keyed entries are
+# only served to callers whose role has been confirmed.
+_verified_roles = cache_manager.namespace("status_verified_roles", maxsize=512, ttl=300)
+
+# Concurrent admins asking for the same scope share one upstream fetch.
+_comprehensive_flight = SingleFlight()
 
 _REFRESH_INTERVAL_SECONDS = max(STATUS_REFRESH_INTERVAL // 1000, 1)
 
@@ -99,28 +112,53 @@ def _format_display_time(value, safe_timezone, *, include_seconds=True):
         return None
 
 
+def _token_hash(token: str | None) -> str:
+    # Hash the token to avoid storing the full sensitive value in cache keys
+    return hashlib.sha256((token or "").encode()).hexdigest()[:16]
+
+
 def _build_request_cache_key(
-    token: str,
+    scope: str,
     api_environment: str,
     time_period: str,
-    role: str,
     safe_timezone: str,
-) -> tuple:
-    """Create a request-level cache key for comprehensive status data."""
-    import hashlib
-
-    # Hash the token to avoid storing the full sensitive value in the cache key
-    token_hash = hashlib.sha256((token or "").encode()).hexdigest()[:16]
-
-    return (
-        token_hash,
-        api_environment or "",
-        time_period or "",
-        role or "",
-        safe_timezone or "",
+) -> CacheKey:
+    """Create a request-level cache key for comprehensive status data.
+
+    *scope* is the caller's verified role, or ``token=<hash>`` when the role
+    could not be verified, so such a caller only shares entries with itself.
+    """
+    return CacheKey(
+        "comprehensive",
+        scope=scope,
+        api_environment=api_environment or "",
+        period=time_period or "",
+        timezone=safe_timezone or "",
     )
 
 
+def _verified_scope(token: str, api_environment: str, claimed_role: str) -> str | None:
+    """Return *claimed_role* if the API confirms the token holds it, else ``None``.
+
+    The role store is client-side state, so it is checked against
+    ``/user/me`` (cached per token for five minutes) before entries shared by
+    everyone with that role are read or written.
+    """
+    key = CacheKey("role", token=_token_hash(token), api_environment=api_environment)
+    role = _verified_roles.get(key)
+    if role is None:
+        user = get_user_info(token, get_api_base(api_environment))
+        role = (user or {}).get("role")
+        if not role:
+            logger.debug("Could not verify the caller's role; not using shared status entries")
+            return None
+        _verified_roles[key] = role
+    if role != claimed_role:
+        logger.warning("Role store says %s but the token belongs to a %s", claimed_role, role)
+        return None
+    return role
+
+
 def _fetch_comprehensive_data_with_cache(
     *,
     token: str,
@@ -130,28 +168,48 @@ def _fetch_comprehensive_data_with_cache(
     safe_timezone: str,
     force_refresh: bool,
 ):
-    """Fetch comprehensive status data with an additional request-level cache layer."""
-
-    cache_key = _build_request_cache_key(token, api_environment, time_period, role, safe_timezone)
+    """Fetch comprehensive status data with an additional request-level cache layer.
+
+    Entries are shared by every caller with the same verified role, so ten
+    superadmins on the status page cost one fetch rather than ten. Only the
+    verified role reaches :class:`StatusDataManager`; an unverified caller is
+    treated as a non-superadmin, so superadmin stats are neither fetched nor
+    read from cache for them.
+    """
+
+    scope = _verified_scope(token, api_environment, role)
+    cache_key = _build_request_cache_key(
+        scope or f"token={_token_hash(token)}", api_environment, time_period, safe_timezone
+    )
 
     if not force_refresh:
         cached_result = _request_cache.get(cache_key)
         if cached_result is not None:
-            cached_result.setdefault("meta", {})["request_cache_hit"] = True
-            return cached_result
-
-    comprehensive_data = StatusDataManager.fetch_comprehensive_status_page_data(
-        token=token,
-        api_environment=api_environment,
-        time_period=time_period,
-        role=role,
-        force_refresh=force_refresh,
-        user_timezone=safe_timezone,
-    )
-
-    if not comprehensive_data.get("error"):
-        _request_cache[cache_key] = comprehensive_data
-
+            # Copy rather than tag the cached dict, which other threads may be reading.
+            meta = {**(cached_result.get("meta") or {}), "request_cache_hit": True}
+            return StatusDataManager.with_freshness({**cached_result, "meta": meta})
+
+    def fetch():
+        comprehensive_data = StatusDataManager.fetch_comprehensive_status_page_data(
+            token=token,
+            api_environment=api_environment,
+            time_period=time_period,
+            role=scope or "USER",
+            force_refresh=force_refresh,
+            user_timezone=safe_timezone,
+        )
+        meta = comprehensive_data.get("meta") or {}
+        if (
+            not comprehensive_data.get("error")
+            and not meta.get("pending_sections")
+            and not meta.get("stale_sections")
+        ):
+            _request_cache[cache_key] = comprehensive_data
+        return comprehensive_data
+
+    comprehensive_data, shared = _comprehensive_flight.do((cache_key, force_refresh), fetch)
+    if shared:
+        logger.debug("Shared an in-flight comprehensive status fetch for %s", cache_key)
     return comprehensive_data
 
 
@@ -165,6 +223,7 @@ def register_callbacks(app):
             Output("deployment-info-summary", "children"),
             Output("cluster-info-summary", "children"),
             Output("cluster-status-title", "children"),
+            Output("status-data-updated-store", "data"),
         ],
         [
             Input("status-auto-refresh-interval", "n_intervals"),
@@ -196,11 +255,11 @@ def register_callbacks(app):
         """
         # Guard: Skip if not logged in
         if not token or not is_admin(role):
-            return (no_update, no_update, no_update, no_update, no_update)
+            return (no_update, no_update, no_update, no_update, no_update, no_update)
 
         # Only update when status tab is active
         if active_tab != "status":
-            return (no_update, no_update, no_update, no_update, no_update)
+            return (no_update, no_update, no_update, no_update, no_update, no_update)
 
         # Get safe timezone
         safe_timezone = get_safe_timezone(user_timezone)
@@ -213,7 +272,7 @@ def register_callbacks(app):
 
         # If manual refresh, invalidate status cache
         if is_manual_refresh:
-            StatusDataManager.invalidate_cache("status")
+            StatusDataManager.invalidate_cache("status_data")
             _request_cache.clear()
 
         try:
@@ -270,6 +329,7 @@ def register_callbacks(app):
                 deployment_info,
                 cluster_info,
                 cluster_title,
+                _build_data_age(meta),
             )
 
         except Exception as e:
@@ -284,6 +344,7 @@ def register_callbacks(app):
                 error_msg,
                 error_msg,
                 html.H5(_("Error")),
+                None,
             )
 
     @app.callback(
@@ -348,7 +409,7 @@ def register_callbacks(app):
 
         # If manual refresh, invalidate status cache
         if is_manual_refresh:
-            StatusDataManager.invalidate_cache("status")
+            StatusDataManager.invalidate_cache("status_data")
             _request_cache.clear()
 
         safe_timezone = get_safe_timezone(user_timezone)
@@ -423,6 +484,22 @@ def register_callbacks(app):
     _register_additional_status_callbacks(app)
 
 
+def _build_data_age(meta):
+    """Describe how old the displayed status data is for the "updated N seconds ago" label.
+
+    Stale data (served while a background refresh runs) is flagged so the
+    label can say it is being refreshed instead of showing a spinner.
+    """
+    if not isinstance(meta, dict):
+        return None
+    return {
+        "updated_at": datetime.now(UTC).timestamp() - meta.get("age_seconds", 0),
+        "is_stale": bool(meta.get("is_stale")),
+        "label": _("Updated {seconds}s ago"),
+        "refreshing_label": _("(refreshing…)"),
+    }
+
+
 def _format_count(value):
     """Format numeric values with thousands separators."""
 
@@ -560,6 +637,7 @@ def _build_status_summary(status_data, safe_timezone):
     return summary_component, last_updated_label
 
 
+@timed_phase("figure")
 def _build_stats_components(
     stats_data,
     status_data,
@@ -625,9 +703,18 @@ def _build_stats_components(
         )
     )
 
+    if stats_data.get("pending_sections"):
+        additional_charts = [
+            html.Div(
+                _("Some statistics are still loading and will appear on the next refresh."),
+                className="text-muted small text-center mb-3",
+            )
+        ] + additional_charts
+
     return stats_cards, user_map, additional_charts
 
 
+@timed_phase("figure")
 def _build_status_charts(time_series_data, safe_timezone, _time_tab):
     """Build status charts from time series data (simplified version)."""
     import pandas as pd
@@ -740,6 +827,23 @@ def _register_additional_status_callbacks(app):
             active_period,
         )
 
+    # Tick the "updated N seconds ago" label in the browser between refreshes
+    app.clientside_callback(
+        """
+        function(n_intervals, updated) {
+            if (!updated || !updated.updated_at) {
+                return "";
+            }
+            const seconds = Math.max(Math.round(Date.now() / 1000 - updated.updated_at), 0);
+            const label = updated.label.replace("{seconds}", seconds);
+            return updated.is_stale ? label + " " + updated.refreshing_label : label;
+        }
+        """,
+        Output("status-data-age", "children"),
+        Input("status-countdown-interval", "n_intervals"),
+        Input("status-data-updated-store", "data"),
+    )
+
     @app.callback(
         Output("status-countdown", "children"),
         [
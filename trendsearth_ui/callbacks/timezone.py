@@ -34,16 +34,6 @@ def register_callbacks(app):
     )
     def update_timezone_status(timezone_data):
         """Update the timezone detection status."""
-        if timezone_data and timezone_data != "UTC":
-            # Clear status cache when timezone changes so status updates immediately
-            try:
-                from . import status
-
-                if hasattr(status, "_request_cache"):
-                    status._request_cache.clear()
-            except ImportError:
-                pass  # Status module may not be available
-
         if timezone_data:
             return html.Div(
                 [
@@ -12,6 +12,7 @@ from ..utils.aggrid import (
     build_aggrid_request_params,
     build_refresh_request_params,
     fetch_aggrid_page,
+    prefetch_next_block,
 )
 from ..utils.helpers import extract_api_error, is_admin, make_authenticated_request
 
@@ -123,15 +124,27 @@ def _fetch_users_page(
     *,
     current_user_role: str | None,
     user_timezone: str | None,
+    use_cache: bool = True,
+    prefetch: bool = False,
+    table_state: dict[str, Any] | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
-    """Fetch a page of users from the API and format the rows."""
+    """Fetch a page of users from the API and format the rows.
+
+    With *prefetch*, the following page is then fetched in the background.
+    With *table_state*, the rows are indexed for cell-click resolution.
+    """
     fetch_params = {**params, "include": "openeo_credentials,gee_credentials"}
-    return fetch_aggrid_page(
+    rows, total = fetch_aggrid_page(
         USER_ENDPOINT,
         token,
         fetch_params,
         lambda data: _format_user_rows(data, current_user_role, user_timezone),
+        use_cache=use_cache,
+        table_state=table_state,
     )
+    if prefetch:
+        prefetch_next_block(USER_ENDPOINT, token, fetch_params, total)
+    return rows, total
 
 
 def register_callbacks(app):
@@ -179,6 +192,8 @@ def register_callbacks(app):
                 params,
                 current_user_role=role,
                 user_timezone=user_timezone,
+                prefetch=True,
+                table_state=table_state,
             )
 
             return {"rowData": tabledata, "rowCount": total_rows}, table_state, total_rows
@@ -226,6 +241,8 @@ def register_callbacks(app):
                 params,
                 current_user_role=role,
                 user_timezone=user_timezone,
+                use_cache=False,
+                table_state=table_state or {},
             )
 
             return {"rowData": tabledata, "rowCount": total_rows}, table_state or {}, total_rows
@@ -9,6 +9,11 @@ from ..i18n import gettext as _
 from ..utils.mobile_utils import get_mobile_column_config
 from .layout import get_gender_options, get_purpose_options, get_sector_options
 
+# Status loaders only appear after this long, so cached (or stale-while-revalidate)
+# responses render without a spinner flash; the "updated N seconds ago" label
+# tells the user how old the data is instead.
+STATUS_LOADING_DELAY_MS = 1000
+
 
 def _create_translation_tab_content(lang_code: str):
     """Create the content for a translation tab with title, message, and link_text fields.
@@ -2072,9 +2077,11 @@ def status_tab_content(is_admin, role=None):
                                         children=f"{STATUS_REFRESH_INTERVAL // 1000}s",
                                         className="badge bg-secondary",
                                     ),
+                                    html.Small(id="status-data-age", className="text-muted ms-3"),
                                 ],
                                 className="d-flex align-items-center",
-                            )
+                            ),
+                            dcc.Store(id="status-data-updated-store"),
                         ],
                         width="auto",
                     ),
@@ -2147,6 +2154,7 @@ def status_tab_content(is_admin, role=None):
                                 ],
                                 type="default",
                                 color="#007bff",
+                                delay_show=STATUS_LOADING_DELAY_MS,
                             ),
                             html.Hr(),
                             html.H5(_("Deployment Information"), className="card-title mt-4"),
@@ -2155,6 +2163,7 @@ def status_tab_content(is_admin, role=None):
                                 children=[html.Div(id="deployment-info-summary")],
                                 type="default",
                                 color="#007bff",
+                                delay_show=STATUS_LOADING_DELAY_MS,
                             ),
                             html.Hr(),
                             html.Div(id="cluster-status-title"),
@@ -2163,6 +2172,7 @@ def status_tab_content(is_admin, role=None):
                                 children=[html.Div(id="cluster-info-summary")],
                                 type="default",
                                 color="#007bff",
+                                delay_show=STATUS_LOADING_DELAY_MS,
                             ),
                         ]
                     ),
@@ -2258,6 +2268,7 @@ def status_tab_content(is_admin, role=None):
                                                 ],
                                                 type="default",
                                                 color="#007bff",
+                                                delay_show=STATUS_LOADING_DELAY_MS,
                                             ),
                                         ],
                                         className="mb-4",
@@ -2273,6 +2284,7 @@ def status_tab_content(is_admin, role=None):
                                                 children=[html.Div(id="stats-user-map")],
                                                 type="default",
                                                 color="#007bff",
+                                                delay_show=STATUS_LOADING_DELAY_MS,
                                             ),
                                         ],
                                         className="mb-4",
@@ -2573,6 +2585,47 @@ def admin_tab_content(role, is_admin):
                 if role in ("ADMIN", "SUPERADMIN")
                 else []
             ),
+            # Callback Performance Section (SUPERADMIN only)
+            *(
+                [
+                    dbc.Card(
+                        [
+                            dbc.CardHeader(
+                                html.H4(
+                                    [
+                                        html.I(className="fas fa-stopwatch me-2"),
+                                        _("Callback Performance"),
+                                    ]
+                                )
+                            ),
+                            dbc.CardBody(
+                                [
+                                    html.P(
+                                        _(
+                                            "Server-side callback timings for this worker since it "
+                                            "started. Payload sizes are sampled."
+                                        ),
+                                        className="text-muted",
+                                    ),
+                                    dbc.Button(
+                                        [
+                                            html.I(className="fas fa-sync-alt me-2"),
+                                            _("Refresh Metrics"),
+                                        ],
+                                        id="refresh-callback-metrics-btn",
+                                        color="primary",
+                                        className="mb-3",
+                                    ),
+                                    html.Div(id="callback-metrics-table"),
+                                ]
+                            ),
+                        ],
+                        className="mb-4",
+                    ),
+                ]
+                if role == "SUPERADMIN"
+                else []
+            ),
             # News Management Section (ADMIN and SUPERADMIN)
             *(
                 [
@@ -26,6 +26,17 @@ API_ENVIRONMENTS = {
     },
 }
 
+# Optional local API (e.g. the mock server in tests/mock_api) for load testing.
+# Select it with LOCAL_API_URL=http://127.0.0.1:5055 FORCE_API_ENVIRONMENT=local
+LOCAL_API_URL = os.environ.get("LOCAL_API_URL", "").rstrip("/")
+if LOCAL_API_URL:
+    API_ENVIRONMENTS["local"] = {
+        "base": f"{LOCAL_API_URL}/api/v1",
+        "auth": f"{LOCAL_API_URL}/auth",
+        "display_name": f"Local ({LOCAL_API_URL})",
+        "host_pattern": None,
+    }
+
 
 def detect_api_environment_from_host():
     """
@@ -122,6 +133,166 @@ EXECUTIONS_REFRESH_INTERVAL = 30 * 1000  # 30 seconds in milliseconds
 LOGS_REFRESH_INTERVAL = 10 * 1000  # 10 seconds in milliseconds
 STATUS_REFRESH_INTERVAL = 5 * 60 * 1000  # 5 minutes in milliseconds for status auto-refresh
 
+# Concurrency for independent upstream API calls (status page fan-out).
+# Set API_FANOUT_MAX_WORKERS=1 to run the calls sequentially; that mode has no
+# deadline, so STATUS_FANOUT_TIMEOUT and STATS_FETCH_DEADLINE do not apply.
+API_FANOUT_MAX_WORKERS = int(os.environ.get("API_FANOUT_MAX_WORKERS", "8"))
+STATUS_FANOUT_TIMEOUT = 10  # seconds to wait for the consolidated status calls
+# Seconds the stats fan-out waits; slower sections are filled in on a later
+# refresh.  Kept below the 10-15s per-call timeouts so it bounds the page.
+STATS_FETCH_DEADLINE = 8
+# Stats calls that miss the deadline keep running, so they get their own pool
+# and cannot hold the threads the status fan-out needs.
+STATS_FANOUT_MAX_WORKERS = int(os.environ.get("STATS_FANOUT_MAX_WORKERS", "6"))
+
+# Share one upstream request between identical concurrent GETs made through
+# make_authenticated_request (only useful with threaded gunicorn workers).
+API_REQUEST_COALESCING = os.environ.get("API_REQUEST_COALESCING", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Outbound HTTP connection pools (one requests.Session per API environment).
+HTTP_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", "10"))  # hosts per session
+HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "20"))  # connections kept per host
+HTTP_TCP_KEEPALIVE = os.environ.get("HTTP_TCP_KEEPALIVE", "true").lower() in ("1", "true", "yes")
+
+# Retries for idempotent methods on connection errors and 502/503/504 responses.
+HTTP_RETRY_TOTAL = int(os.environ.get("HTTP_RETRY_TOTAL", "2"))
+HTTP_RETRY_BACKOFF_FACTOR = 0.3  # seconds; doubles on each retry
+HTTP_RETRY_BACKOFF_JITTER = 0.3  # seconds of random jitter added to each backoff
+HTTP_RETRY_STATUS_FORCELIST = (502, 503, 504)
+
+# Default (connect, read) timeouts in seconds for API requests.
+API_CONNECT_TIMEOUT = float(os.environ.get("API_CONNECT_TIMEOUT", "3"))
+API_READ_TIMEOUT = float(os.environ.get("API_READ_TIMEOUT", "20"))
+API_FAST_READ_TIMEOUT = float(os.environ.get("API_FAST_READ_TIMEOUT", "10"))
+
+# Prometheus metrics served at /metrics.  Off by default; when enabled,
+# scrapers must send METRICS_AUTH_TOKEN as "Authorization: Bearer <token>",
+# and the route stays off until that token is set.
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+METRICS_AUTH_TOKEN = os.environ.get("METRICS_AUTH_TOKEN", "")
+
+# Per-callback instrumentation.  Payload sizes need JSON serialisation, so
+# they are only measured for this fraction of callback calls.
+CALLBACK_METRICS_ENABLED = os.environ.get("CALLBACK_METRICS_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+CALLBACK_METRICS_SAMPLE_RATE = float(os.environ.get("CALLBACK_METRICS_SAMPLE_RATE", "0.05"))
+
+# Attach a Server-Timing header (upstream API, cache, formatting, figure and
+# serialisation time) to Dash callback responses.
+SERVER_TIMING_ENABLED = os.environ.get("SERVER_TIMING_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Circuit breakers per API endpoint family (status, stats, execution, logs, boundaries).
+CIRCUIT_BREAKER_ENABLED = os.environ.get("CIRCUIT_BREAKER_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # consecutive failures before the circuit opens
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30  # seconds before a half-open probe is allowed
+
+# Seconds a refreshed access token is reused by other callers presenting the
+# same (already rotated) refresh token.
+TOKEN_REFRESH_REUSE_SECONDS = 60
+
+# Storage for the status, stats, boundaries and table caches.  "memory" keeps
+# them in each worker process; "sqlite" (one file per host) or "redis" share
+# them between gunicorn workers and across max_requests restarts.  The SQLite
+# file defaults to a private per-user cache directory rather than the
+# world-writable temp directory, since cached values are unpickled from it.
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory").lower()
+CACHE_SQLITE_PATH = os.environ.get(
+    "CACHE_SQLITE_PATH",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "trendsearth_ui",
+        "cache.sqlite3",
+    ),
+)
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0")
+# Total estimated size the in-process caches may hold; the oldest entries are
+# evicted beyond it.  0 disables the budget (each cache keeps its entry limit).
+CACHE_MEMORY_BUDGET_MB = int(os.environ.get("CACHE_MEMORY_BUDGET_MB", "256"))
+
+# Stale-while-revalidate for the status page caches: once an entry is older than
+# its TTL it is still served, marked stale, for this many more seconds while a
+# single background refetch replaces it.  0 restores blocking refetches.
+STATUS_CACHE_STALE_SECONDS = int(os.environ.get("STATUS_CACHE_STALE_SECONDS", "600"))
+STATUS_REVALIDATE_MAX_WORKERS = 2  # background refetches running at once per worker
+# Memory ceiling for each in-process status page cache (status, stats and the
+# request cache).  Comprehensive stats payloads can be megabytes each, so these
+# caches are bounded by estimated size as well as entry count.  0 disables.
+STATUS_CACHE_MAX_MB = int(os.environ.get("STATUS_CACHE_MAX_MB", "32"))
+# Seconds an AG-Grid block (one page of executions, users or scripts) is reused
+# when the grid asks for it again: scrolling back, re-sorting to an earlier
+# order or re-entering a tab.  Edits made through the UI drop the affected
+# blocks at once.  0 disables.
+AGGRID_BLOCK_CACHE_TTL = int(os.environ.get("AGGRID_BLOCK_CACHE_TTL", "30"))
+# After serving a block the server fetches the next one into the block cache so
+# continuous scrolling does not wait on the API.  Each session may prefetch this
+# many blocks per minute; 0 disables prefetching.
+AGGRID_PREFETCH_BUDGET = int(os.environ.get("AGGRID_PREFETCH_BUDGET", "20"))
+AGGRID_PREFETCH_MAX_WORKERS = 2  # background block fetches running at once per worker
+# Seconds a table's total row count (per filter and session) is reused.  Blocks
+# after the first take their total from it, so the grid's row count and the
+# total shown above it stay steady while the user scrolls.  0 disables.
+AGGRID_COUNT_CACHE_TTL = int(os.environ.get("AGGRID_COUNT_CACHE_TTL", "60"))
+# Query parameter, as name=value, that makes the API skip (or estimate) the
+# total of a list request.  Sent on blocks whose total is already cached; empty
+# sends nothing.
+AGGRID_SKIP_COUNT_PARAM = os.environ.get("AGGRID_SKIP_COUNT_PARAM", "")
+# Keyset ("seek after") pagination for the executions grid.  When it is sorted
+# by start date or id alone, each block after the first is requested as the
+# rows beyond the last one served instead of by page number, so deep scrolling
+# avoids large OFFSET queries upstream and rows do not shift as new executions
+# arrive.  Other sorts, and jumps to an unvisited block, use page numbers.
+EXECUTIONS_KEYSET_PAGINATION = os.environ.get("EXECUTIONS_KEYSET_PAGINATION", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Refresh-ahead warmer for the status page caches.  Each worker re-fetches the
+# status, stats and time-series data for these environments and periods shortly
+# before the cached entries expire, signed in as a service account (a SUPERADMIN
+# for the stats sections).  Give either a bearer token or an email and password;
+# without credentials, or with STATUS_WARMER_PERIODS empty, nothing is warmed.
+STATUS_WARMER_TOKEN = os.environ.get("STATUS_WARMER_TOKEN", "")
+STATUS_WARMER_EMAIL = os.environ.get("STATUS_WARMER_EMAIL", "")
+STATUS_WARMER_PASSWORD = os.environ.get("STATUS_WARMER_PASSWORD", "")
+STATUS_WARMER_ENVIRONMENTS = [
+    env.strip().lower()
+    for env in os.environ.get("STATUS_WARMER_ENVIRONMENTS", "").split(",")
+    if env.strip()
+]  # empty: the forced or default environment
+STATUS_WARMER_PERIODS = [
+    period.strip().lower()
+    for period in os.environ.get("STATUS_WARMER_PERIODS", "day").split(",")
+    if period.strip()
+]
+# The status entry is cached per display timezone; list the ones users view the
+# page in (IANA names).
+STATUS_WARMER_TIMEZONES = [
+    tz.strip() for tz in os.environ.get("STATUS_WARMER_TIMEZONES", "").split(",") if tz.strip()
+]  # empty: the default timezone (UTC)
+STATUS_WARMER_MAX_CONCURRENCY = int(os.environ.get("STATUS_WARMER_MAX_CONCURRENCY", "2"))
+STATUS_WARMER_LEAD_SECONDS = 30  # refresh this long before the cached entries expire
+
+# Conditional-request (ETag / Last-Modified) cache on the shared HTTP session.
+HTTP_CACHE_ENABLED = os.environ.get("HTTP_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+HTTP_CACHE_MAX_ENTRIES = int(os.environ.get("HTTP_CACHE_MAX_ENTRIES", "256"))
+HTTP_CACHE_MAX_BODY_BYTES = 5 * 1024 * 1024  # larger bodies are not stored
+
 # UI Constants
 LOGO_URL = "/assets/trends_earth_logo_from_CI.png"
 LOGO_HEIGHT = "auto"
@@ -15,6 +15,7 @@ from .geojson import (
 )
 from .helpers import (
     ADMIN_ROLES,
+    coordinated_refresh_access_token,
     extract_api_error,
     format_duration,
     get_user_info,
@@ -46,6 +47,7 @@ __all__ = [
     "safe_table_data",
     "get_user_info",
     "refresh_access_token",
+    "coordinated_refresh_access_token",
     "logout_user",
     "logout_all_devices",
     "make_authenticated_request",
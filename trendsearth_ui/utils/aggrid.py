@@ -3,11 +3,75 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Mapping, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
 import copy
+import hashlib
+import json
+import logging
+from threading import Lock
+import time
 from typing import Any
 
-from ..config import DEFAULT_PAGE_SIZE
+from ..config import (
+    AGGRID_BLOCK_CACHE_TTL,
+    AGGRID_COUNT_CACHE_TTL,
+    AGGRID_PREFETCH_BUDGET,
+    AGGRID_PREFETCH_MAX_WORKERS,
+    AGGRID_SKIP_COUNT_PARAM,
+    DEFAULT_PAGE_SIZE,
+    get_api_base,
+    get_current_api_environment,
+)
+from .cache_manager import CacheKey, cache_manager
+from .circuit_breaker import CircuitOpenError
 from .helpers import make_authenticated_request
+from .server_timing import timed
+
+logger = logging.getLogger(__name__)
+
+# Last good page per (endpoint, params, token), served while the API circuit
+# for the endpoint is open.  Pages and blocks hold API records as returned,
+# including user credential details, so they never leave the worker's memory.
+_last_good_pages = cache_manager.namespace("aggrid_last_good", maxsize=200, shared=False)
+
+# Raw API payloads of recently fetched blocks, keyed like the last good pages,
+# so a block the grid asks for again within the TTL skips the round trip.
+# Rows are formatted on every read since the timezone can change meanwhile;
+# the formatters copy each row, leaving the cached payload untouched.
+_block_cache = cache_manager.namespace(
+    "aggrid_blocks", maxsize=500, ttl=max(AGGRID_BLOCK_CACHE_TTL, 1), shared=False
+)
+
+# Record the id of each row served to each session, per table and sort/filter
+# state and row index, so a cell click whose payload lacks ``data`` can be
+# resolved without re-fetching the page.  One entry per row means concurrent
+# blocks never overwrite each other's rows.  Kept in-process: a shared backend
+# would turn every served block into one write per row, and a click handled by
+# another worker just falls back to re-fetching the page.  Mutations leave it
+# alone: it maps what the session was shown, which is what the user clicked.
+_row_index = cache_manager.namespace("aggrid_row_index", maxsize=50_000, ttl=3600, shared=False)
+
+# Total row count per session and filter (not sort or page), so later blocks of
+# the same table state need not have the API count again.
+_counts = cache_manager.namespace("aggrid_counts", maxsize=1000, ttl=max(AGGRID_COUNT_CACHE_TTL, 1))
+# Params that do not change which rows match, and so not the count either.
+_COUNT_INDEPENDENT_PARAMS = frozenset({"page", "per_page", "sort", "include", "exclude"})
+
+# Keyset cursors: the sort key of the last row served before each block start,
+# per session, table query and row -> (column, value, ids of rows sharing it).
+_cursors = cache_manager.namespace("aggrid_cursors", maxsize=2000, ttl=3600)
+
+# Prefetches per session (token hash) in the current window: (window_start, used).
+PREFETCH_WINDOW_SECONDS = 60
+_prefetch_budgets = cache_manager.namespace(
+    "aggrid_prefetch_budget", maxsize=1000, ttl=PREFETCH_WINDOW_SECONDS
+)
+_prefetching: set[str] = set()
+# Bumped per endpoint by invalidate_aggrid_blocks, so a prefetch that started
+# before a mutation does not store the rows the mutation changed.
+_block_generations: dict[str, int] = {}
+_prefetch_lock = Lock()
+_prefetch_executor: ThreadPoolExecutor | None = None
 
 FilterModel = Mapping[str, Any]
 RequestData = Mapping[str, Any]
@@ -383,6 +447,10 @@ def fetch_aggrid_page(
     token: str,
     params: Mapping[str, Any],
     format_rows: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+    *,
+    use_cache: bool = True,
+    table_state: Mapping[str, Any] | None = None,
+    keyset_columns: Iterable[str] | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
     """Fetch one AG-Grid server-side row model page from the API.
 
@@ -390,14 +458,385 @@ def fetch_aggrid_page(
     ``data`` list and ``total`` count from the JSON payload, and applies
     *format_rows* to the raw row list.
 
+    A block fetched with the same parameters and token in the last
+    ``AGGRID_BLOCK_CACHE_TTL`` seconds is reused unless *use_cache* is false,
+    as it is for refresh buttons and auto-refresh.  Fetched blocks are
+    stored either way; :func:`invalidate_aggrid_blocks` drops them after edits.
+
+    When *table_state* is given, the ids of the served rows are recorded for
+    :func:`lookup_row_id` under that state.
+
+    With *keyset_columns*, a grid sorted by one of those columns alone is
+    paged by cursor: the block after one already served is requested as the
+    rows that sort after its last row (see :func:`_keyset_params`).
+
+    The total is cached per filter for ``AGGRID_COUNT_CACHE_TTL`` seconds.
+    Blocks after the first report the cached total, and ask the API to skip
+    counting when ``AGGRID_SKIP_COUNT_PARAM`` is set; the first block and
+    requests with *use_cache* false count afresh.
+
+    While the circuit breaker for the endpoint is open, the last page
+    successfully fetched with the same parameters and token is returned
+    instead.
+
     Returns:
         ``(formatted_rows, total_count)`` — returns ``([], 0)`` on non-200 responses.
     """
-    resp = make_authenticated_request(endpoint, token, params=dict(params))
-    if resp.status_code != 200:
-        return [], 0
-    payload = resp.json()
-    return format_rows(payload.get("data", [])), payload.get("total", 0)
+    api_environment = get_current_api_environment()
+    request_params, cursor, known_total = _request_params(
+        endpoint, token, params, keyset_columns, use_counts=use_cache
+    )
+    page_key = _page_key(endpoint, token, request_params, api_environment)
+
+    block = _block_cache.get(page_key) if use_cache and AGGRID_BLOCK_CACHE_TTL > 0 else None
+    fetched = block is None
+    if fetched:
+        try:
+            resp = make_authenticated_request(
+                endpoint, token, api_environment=api_environment, params=dict(request_params)
+            )
+        except CircuitOpenError:
+            stale_page = _last_good_pages.get(page_key)
+            if stale_page is None:
+                raise
+            logger.warning("API circuit is open; serving stale %s page", endpoint)
+            return stale_page
+        if resp.status_code != 200:
+            return [], 0
+        payload = resp.json()
+        block = (payload.get("data", []), payload.get("total", 0))
+        if AGGRID_BLOCK_CACHE_TTL > 0:
+            _block_cache[page_key] = block
+
+    data, total = block
+    if cursor is not None:
+        data, total = _apply_cursor(data, total, params, cursor)
+    if known_total is not None:
+        total = known_total
+    elif cursor is None and total is not None and AGGRID_COUNT_CACHE_TTL > 0:
+        _counts[_count_key(endpoint, token, params)] = total
+    if keyset_columns:
+        _remember_cursor(endpoint, token, params, data, keyset_columns, cursor)
+    if table_state is not None:
+        index_rows(endpoint, token, table_state, params, data)
+    with timed("format"):
+        rows = format_rows(data)
+    page = (rows, total)
+    if fetched:
+        _last_good_pages[page_key] = page
+    return page
+
+
+def _request_params(
+    endpoint: str,
+    token: str,
+    params: Mapping[str, Any],
+    keyset_columns: Iterable[str] | None,
+    *,
+    use_counts: bool = True,
+) -> tuple[Mapping[str, Any], tuple[str, Any, tuple[Any, ...]] | None, int | None]:
+    """Return the params to send for a block, the keyset cursor used and the cached total.
+
+    The cached total is only used for blocks after the first, whose request
+    then carries ``AGGRID_SKIP_COUNT_PARAM``.
+    """
+    request_params: Mapping[str, Any] = params
+    cursor = None
+    if keyset_columns:
+        request_params, cursor = _keyset_params(endpoint, token, params, keyset_columns)
+
+    known_total = None
+    block = _block_start(params)
+    if use_counts and AGGRID_COUNT_CACHE_TTL > 0 and block is not None and block[0] > 0:
+        known_total = _counts.get(_count_key(endpoint, token, params))
+    if known_total is not None and AGGRID_SKIP_COUNT_PARAM:
+        name, _, value = AGGRID_SKIP_COUNT_PARAM.partition("=")
+        request_params = {**request_params, name: value or "true"}
+    return request_params, cursor, known_total
+
+
+def _count_key(endpoint: str, token: str, params: Mapping[str, Any]) -> CacheKey:
+    query = {key: value for key, value in params.items() if key not in _COUNT_INDEPENDENT_PARAMS}
+    return CacheKey(
+        "count",
+        endpoint=endpoint,
+        api_environment=get_current_api_environment(),
+        query=json.dumps(query, sort_keys=True, default=str),
+        token=_token_hash(token),
+    )
+
+
+# -- keyset pagination --------------------------------------------------------
+#
+# The API pages by number only, so a cursor is expressed through its filter
+# language: for ``start_date desc`` the block after a row with start date X is
+# ``start_date<='X'``.  The comparison is inclusive so rows sharing X are not
+# lost; the ids of those already served ("ties") are requested in addition to
+# the block size and dropped from the response.
+
+
+def _block_start(params: Mapping[str, Any]) -> tuple[int, int] | None:
+    """Return ``(start_row, per_page)`` for page-addressed *params*."""
+    try:
+        per_page = int(params["per_page"])
+        return (int(params["page"]) - 1) * per_page, per_page
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _keyset_column(params: Mapping[str, Any], keyset_columns: Iterable[str]) -> tuple[str, str]:
+    """Return ``(column, direction)`` when *params* sort by one keyset column, else ``("", "")``."""
+    parts = str(params.get("sort") or "").split()
+    if len(parts) == 2 and "," not in parts[0] and parts[0] in set(keyset_columns):
+        return parts[0], parts[1].lower()
+    return "", ""
+
+
+def _cursor_key(endpoint: str, token: str, params: Mapping[str, Any], start_row: int) -> CacheKey:
+    query = {key: value for key, value in params.items() if key not in ("page", "per_page")}
+    return CacheKey(
+        "cursor",
+        endpoint=endpoint,
+        api_environment=get_current_api_environment(),
+        params=json.dumps(query, sort_keys=True, default=str),
+        token=_token_hash(token),
+        row=start_row,
+    )
+
+
+def _keyset_params(
+    endpoint: str, token: str, params: Mapping[str, Any], keyset_columns: Iterable[str]
+) -> tuple[Mapping[str, Any], tuple[str, Any, tuple[Any, ...]] | None]:
+    """Turn page-addressed *params* into a seek request when a cursor is known.
+
+    Returns the params to send and the cursor ``(column, value, tie_ids)``
+    used, or *params* unchanged and ``None`` for the first block, for sorts
+    that are not keyset-able and for blocks whose predecessor was not served.
+    """
+    column, direction = _keyset_column(params, keyset_columns)
+    block = _block_start(params)
+    if not column or block is None or block[0] == 0:
+        return params, None
+    start_row, per_page = block
+    cursor = _cursors.get(_cursor_key(endpoint, token, params, start_row))
+    if cursor is None or cursor[0] != column:
+        return params, None
+    _, value, ties = cursor
+    operator = "<=" if direction == "desc" else ">="
+    seek = f"{column}{operator}'{_sanitize_value(value)}'"
+    return {
+        **params,
+        "page": 1,
+        "per_page": per_page + len(ties),
+        "filter": ",".join(clause for clause in (params.get("filter"), seek) if clause),
+    }, cursor
+
+
+def _apply_cursor(
+    data: list[dict[str, Any]],
+    total: int,
+    params: Mapping[str, Any],
+    cursor: tuple[str, Any, tuple[Any, ...]],
+) -> tuple[list[dict[str, Any]], int]:
+    """Drop already-served ties from a seek response; translate its total to grid rows."""
+    start_row, per_page = _block_start(params)
+    ties = set(cursor[2])
+    rows = [row for row in data if row.get("id") not in ties][:per_page]
+    return rows, start_row + max((total or 0) - len(ties), len(rows))
+
+
+def _remember_cursor(
+    endpoint: str,
+    token: str,
+    params: Mapping[str, Any],
+    data: list[dict[str, Any]],
+    keyset_columns: Iterable[str],
+    previous: tuple[str, Any, tuple[Any, ...]] | None,
+) -> None:
+    """Record the sort key of the block's last row as the cursor of the next block."""
+    column, _ = _keyset_column(params, keyset_columns)
+    block = _block_start(params)
+    if not column or block is None or not data:
+        return
+    value = data[-1].get(column)
+    if value is None:
+        return
+    ties = {row["id"] for row in data if row.get(column) == value and row.get("id") is not None}
+    if previous is not None and previous[1] == value:
+        ties.update(previous[2])  # the tie run spans more than one block
+    next_row = block[0] + len(data)
+    _cursors[_cursor_key(endpoint, token, params, next_row)] = (column, value, tuple(sorted(ties)))
+
+
+def _token_hash(token: str | None) -> str:
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _page_key(
+    endpoint: str, token: str, params: Mapping[str, Any], api_environment: str
+) -> CacheKey:
+    return CacheKey(
+        "page",
+        endpoint=endpoint,
+        api_environment=api_environment,
+        params=json.dumps(dict(params), sort_keys=True, default=str),
+        token=_token_hash(token),
+    )
+
+
+def _row_index_fields(
+    endpoint: str, token: str, table_state: Mapping[str, Any] | None
+) -> dict[str, Any]:
+    """Key fields shared by every row one session was shown in one table state."""
+    state = table_state or {}
+    state_json = json.dumps(
+        [state.get("sort_sql"), state.get("filter_sql"), state.get("extra_params") or {}],
+        sort_keys=True,
+        default=str,
+    )
+    return {
+        "endpoint": endpoint,
+        "api_environment": get_current_api_environment(),
+        "state": hashlib.sha256(state_json.encode("utf-8")).hexdigest()[:16],
+        "token": _token_hash(token),
+    }
+
+
+def index_rows(
+    endpoint: str,
+    token: str,
+    table_state: Mapping[str, Any] | None,
+    params: Mapping[str, Any],
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    id_field: str = "id",
+) -> None:
+    """Record the ids of a served block's *rows* by their grid row index."""
+    try:
+        start_row = (int(params["page"]) - 1) * int(params["per_page"])
+    except (KeyError, TypeError, ValueError):
+        return
+    fields = _row_index_fields(endpoint, token, table_state)
+    for offset, row in enumerate(rows):
+        if isinstance(row, Mapping) and row.get(id_field) is not None:
+            _row_index[CacheKey("rows", **fields, row=start_row + offset)] = row[id_field]
+
+
+def lookup_row_id(
+    endpoint: str, token: str, table_state: Mapping[str, Any] | None, row_index: int
+) -> Any | None:
+    """Return the id of the row at *row_index* as last served to this session, if known."""
+    fields = _row_index_fields(endpoint, token, table_state)
+    return _row_index.get(CacheKey("rows", **fields, row=row_index))
+
+
+def _take_prefetch_budget(session: str) -> bool:
+    """Count one prefetch against *session*'s budget; ``False`` once it is spent."""
+    with _prefetch_lock:
+        now = time.time()
+        started, used = _prefetch_budgets.get(session) or (now, 0)
+        if now - started >= PREFETCH_WINDOW_SECONDS:
+            started, used = now, 0
+        if used >= AGGRID_PREFETCH_BUDGET:
+            return False
+        _prefetch_budgets[session] = (started, used + 1)
+        return True
+
+
+def prefetch_next_block(
+    endpoint: str,
+    token: str,
+    params: Mapping[str, Any],
+    total: int,
+    *,
+    keyset_columns: Iterable[str] | None = None,
+) -> Future | None:
+    """Fetch the block after the one *params* requested into the block cache.
+
+    Runs on a small background pool with the same sort and filter params, so
+    the grid's next ``getRowsRequest`` is a cache hit.  With *keyset_columns*
+    the block is requested by cursor, as :func:`fetch_aggrid_page` will
+    request it.  Nothing is scheduled
+    past the last row, when the block is already cached or being fetched, or
+    once the session has used its ``AGGRID_PREFETCH_BUDGET`` for the minute.
+
+    Returns:
+        The scheduled fetch, or ``None`` if nothing was scheduled.
+    """
+    global _prefetch_executor
+    if AGGRID_PREFETCH_BUDGET <= 0 or AGGRID_BLOCK_CACHE_TTL <= 0 or not token:
+        return None
+    try:
+        page = int(params["page"])
+        per_page = int(params["per_page"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if page * per_page >= (total or 0):
+        return None
+
+    # The API base is resolved here: background threads have no request host.
+    api_environment = get_current_api_environment()
+    next_params, _, _ = _request_params(
+        endpoint, token, {**params, "page": page + 1}, keyset_columns
+    )
+    next_key = _page_key(endpoint, token, next_params, api_environment)
+    if next_key in _block_cache:
+        return None
+    with _prefetch_lock:
+        if next_key in _prefetching:
+            return None
+    if not _take_prefetch_budget(_token_hash(token)):
+        logger.debug("Prefetch budget spent for this session; not prefetching %s", endpoint)
+        return None
+    with _prefetch_lock:
+        if next_key in _prefetching:
+            return None
+        _prefetching.add(next_key)
+        generation = _block_generations.get(endpoint, 0)
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=max(AGGRID_PREFETCH_MAX_WORKERS, 1),
+                thread_name_prefix="te-prefetch",
+            )
+        executor = _prefetch_executor
+    url = get_api_base(api_environment) + endpoint
+
+    def run() -> None:
+        try:
+            resp = make_authenticated_request(
+                url, token, api_environment=api_environment, params=dict(next_params)
+            )
+            if resp.status_code == 200:
+                payload = resp.json()
+                with _prefetch_lock:
+                    if _block_generations.get(endpoint, 0) == generation:
+                        _block_cache[next_key] = (
+                            payload.get("data", []),
+                            payload.get("total", 0),
+                        )
+        except Exception as exc:
+            logger.debug("Prefetch of %s page %s failed: %s", endpoint, page + 1, exc)
+        finally:
+            with _prefetch_lock:
+                _prefetching.discard(next_key)
+
+    return executor.submit(run)
+
+
+def invalidate_aggrid_blocks(*endpoints: str) -> int:
+    """Drop the cached blocks of *endpoints* for every user; return how many were dropped.
+
+    Called after a mutation so no session is shown the rows it changed.  The
+    endpoints' cached totals are dropped too.
+    """
+    with _prefetch_lock:
+        for endpoint in endpoints:
+            _block_generations[endpoint] = _block_generations.get(endpoint, 0) + 1
+    for endpoint in endpoints:
+        cache_manager.invalidate(f"aggrid_counts:endpoint={endpoint}")
+    return sum(
+        cache_manager.invalidate(f"aggrid_blocks:endpoint={endpoint}") for endpoint in endpoints
+    )
 
 
 __all__ = [
@@ -408,4 +847,8 @@ __all__ = [
     "build_aggrid_request_params",
     "build_refresh_request_params",
     "fetch_aggrid_page",
+    "index_rows",
+    "invalidate_aggrid_blocks",
+    "lookup_row_id",
+    "prefetch_next_block",
 ]
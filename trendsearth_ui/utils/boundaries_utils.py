@@ -16,18 +16,18 @@ from pathlib import Path
 import re
 from threading import Lock
 
-from cachetools import TTLCache
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import RequestException
 from requests.exceptions import Timeout as RequestsTimeout
 
 from ..config import get_api_base
+from .cache_manager import CacheKey, cache_manager
 from .http_client import apply_default_headers, get_session
 
 logger = logging.getLogger(__name__)
 
 # Cache the resolver for 30 days per API environment and release type.
-_BOUNDARIES_CACHE: TTLCache[str, CountryIsoResolver] = TTLCache(maxsize=4, ttl=2_592_000)
+_BOUNDARIES_CACHE = cache_manager.namespace("boundaries_resolver", maxsize=4, ttl=2_592_000)
 _CACHE_LOCK = Lock()
 
 _NORMALIZE_PATTERN = re.compile(r"[^a-z0-9]+")
@@ -306,7 +306,7 @@ def get_country_iso_resolver(
         logger.warning("Cannot fetch boundaries without an authentication token")
         return None
 
-    cache_key = f"{api_environment}:{release_type}"
+    cache_key = CacheKey("resolver", api_environment=api_environment, release_type=release_type)
     with _CACHE_LOCK:
         cached = _BOUNDARIES_CACHE.get(cache_key)
         if cached is not None:
@@ -329,7 +329,7 @@ def _fetch_resolver(
     params = {"release_type": release_type}
 
     try:
-        response = get_session().get(url, headers=headers, params=params, timeout=20)
+        response = get_session(api_environment).get(url, headers=headers, params=params, timeout=20)
     except RequestException as exc:
         logger.error("Failed to fetch boundaries list: %s", exc)
         return None
@@ -379,7 +379,7 @@ def clear_country_iso_cache() -> int:
 _FALLBACK_COUNTRIES_PATH = Path(__file__).parent.parent / "data" / "countries_fallback.json"
 
 # Cache for country options (per API environment)
-_COUNTRY_OPTIONS_CACHE: TTLCache[str, list[dict]] = TTLCache(maxsize=4, ttl=3600)
+_COUNTRY_OPTIONS_CACHE = cache_manager.namespace("country_options", maxsize=4, ttl=3600)
 _COUNTRY_OPTIONS_LOCK = Lock()
 
 
@@ -423,7 +423,7 @@ def get_country_options(
     Returns:
         List of dicts with 'label' (country name) and 'value' (ISO code) keys.
     """
-    cache_key = api_environment or "fallback"
+    cache_key = CacheKey("country_options", api_environment=api_environment or "fallback")
 
     # Check cache first
     if use_cache:
@@ -473,7 +473,7 @@ def _fetch_country_options_from_api(api_environment: str, token: str | None) ->
         headers["Authorization"] = f"Bearer {token}"
 
     try:
-        response = get_session().get(
+        response = get_session(api_environment).get(
             url,
             headers=headers,
             params={"level": "0", "per_page": "300"},
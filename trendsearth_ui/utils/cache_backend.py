@@ -0,0 +1,683 @@
+"""Cache storage that can be shared between gunicorn workers.
+
+With ``CACHE_BACKEND=memory`` (the default) every cache store created by
+:func:`shared_cache` (for a :mod:`~.cache_manager` namespace) is an ordinary
+in-process ``cachetools`` cache.  With ``sqlite`` or ``redis`` the same caches are stored in a
+:class:`CacheBackend` instead, so several workers – and a worker that was just
+restarted after ``max_requests`` – see the same warm status, stats and
+boundaries data.
+
+:class:`SharedTTLCache` is a ``MutableMapping`` like the ``cachetools``
+caches it replaces.  Keys and values are pickled and stored under a hash of
+the key, so anything picklable can be cached.  A failing backend never breaks
+a page: errors are logged and treated as a miss.
+
+Pickled values are only safe to load from storage nobody else can write to:
+the SQLite file is created with ``0600`` permissions in a directory only its
+owner can write to, and the Redis server must be private to the deployment.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, MutableMapping
+import hashlib
+import json
+import logging
+import math
+import os
+from pathlib import Path
+import pickle
+import sqlite3
+from threading import Lock, local
+import time
+from typing import Any
+
+from ..config import CACHE_BACKEND, CACHE_REDIS_URL, CACHE_SQLITE_PATH
+from . import server_timing
+from .metrics import InstrumentedTTLCache, SizeAwareTTLCache, SynchronizedLRUCache
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class CacheBackendError(Exception):
+    """The shared cache store could not be read or written."""
+
+
+class CacheBackend(ABC):
+    """Byte storage for shared caches, partitioned by namespace (the cache name).
+
+    Each entry is stored under a string *key* and holds two blobs: the value
+    and the pickled original key, which :meth:`keys` returns without loading
+    any values.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> bytes | None:
+        """Return the stored bytes, or ``None`` when missing or expired."""
+
+    @abstractmethod
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: float | None,
+        maxsize: int,
+        pickled_key: bytes,
+    ) -> tuple[int, int]:
+        """Store *value*; return ``(expired, evicted)`` entries removed to make room."""
+
+    @abstractmethod
+    def add(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: float | None,
+        maxsize: int,
+        pickled_key: bytes,
+    ) -> bool:
+        """Store *value* only if *key* has no live entry, atomically; return whether it did."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> bool:
+        """Remove the entry; return whether there was one."""
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """Remove every entry in *namespace*."""
+
+    @abstractmethod
+    def count(self, namespace: str) -> int:
+        """Return the number of live entries in *namespace*."""
+
+    @abstractmethod
+    def keys(self, namespace: str) -> list[bytes]:
+        """Return the pickled original key of every live entry in *namespace*."""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache entries in a local SQLite file shared by every worker on the host.
+
+    Each thread opens its own connection (re-opened after a fork).  WAL mode
+    lets readers proceed while another worker writes.  Entry counts per
+    namespace are kept in ``cache_counts`` alongside each write, so a write
+    costs a few index lookups however large the namespace is.  Expired rows
+    are swept from a namespace at most every *prune_interval* seconds (reads
+    already ignore them), and whenever it is over ``maxsize``, before the
+    oldest-written entries are evicted.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike, timeout: float = 2.0, prune_interval: float = 60.0
+    ) -> None:
+        self.path = Path(path)
+        self.timeout = timeout
+        self.prune_interval = prune_interval
+        self._local = local()
+        self._schema_lock = Lock()
+        self._pruned_at: dict[str, float] = {}
+
+    def _check_private(self, path: Path) -> None:
+        """Refuse storage another user owns or can write to, since values are unpickled."""
+        if not hasattr(os, "getuid"):  # pragma: no cover - POSIX permissions only
+            return
+        info = path.stat()
+        if info.st_uid != os.getuid() or info.st_mode & 0o022:
+            raise CacheBackendError(f"{path} is writable by other users; not using it for caches")
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        with self._schema_lock:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self._check_private(self.path.parent)
+            if not self.path.exists():
+                os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            self._check_private(self.path)
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value BLOB NOT NULL,"
+                " pickled_key BLOB NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " expires_at REAL,"
+                " PRIMARY KEY (namespace, key)"
+                ") WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_age ON cache_entries (namespace, stored_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_expiry"
+                " ON cache_entries (namespace, expires_at)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_counts ("
+                " namespace TEXT PRIMARY KEY,"
+                " entries INTEGER NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            # Seed counts for files written before cache_counts existed; a
+            # namespace's row is otherwise created by its first write.
+            connection.execute(
+                "INSERT OR IGNORE INTO cache_counts (namespace, entries)"
+                " SELECT namespace, COUNT(*) FROM cache_entries GROUP BY namespace"
+            )
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        try:
+            return self._connect().execute(sql, params)
+        except sqlite3.Error as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        row = self._execute(
+            "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return value
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: float | None,
+        maxsize: int,
+        pickled_key: bytes,
+    ) -> tuple[int, int]:
+        _stored, expired, evicted = self._write(
+            namespace, key, value, ttl, maxsize, pickled_key, replace=True
+        )
+        return expired, evicted
+
+    def add(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: float | None,
+        maxsize: int,
+        pickled_key: bytes,
+    ) -> bool:
+        stored, _expired, _evicted = self._write(
+            namespace, key, value, ttl, maxsize, pickled_key, replace=False
+        )
+        return stored
+
+    def _write(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: float | None,
+        maxsize: int,
+        pickled_key: bytes,
+        replace: bool,
+    ) -> tuple[bool, int, int]:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        row = (sqlite3.Binary(value), sqlite3.Binary(pickled_key), now, expires_at)
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                expired = 0
+                if now - self._pruned_at.get(namespace, 0.0) >= self.prune_interval:
+                    expired = self._prune(connection, namespace, now)
+                existing = connection.execute(
+                    "SELECT expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+                if existing is None:
+                    connection.execute(
+                        "INSERT INTO cache_entries"
+                        " (value, pickled_key, stored_at, expires_at, namespace, key)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (*row, namespace, key),
+                    )
+                    size = self._adjust_count(connection, namespace, 1)
+                elif replace or (existing[0] is not None and existing[0] <= now):
+                    connection.execute(
+                        "UPDATE cache_entries"
+                        " SET value = ?, pickled_key = ?, stored_at = ?, expires_at = ?"
+                        " WHERE namespace = ? AND key = ?",
+                        (*row, namespace, key),
+                    )
+                    size = 0  # replaced in place, so the namespace did not grow
+                else:
+                    return False, expired, 0
+                evicted = 0
+                if size > maxsize:
+                    pruned = self._prune(connection, namespace, now)
+                    expired += pruned
+                    size -= pruned
+                if size > maxsize:
+                    evicted = connection.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                        " SELECT key FROM cache_entries WHERE namespace = ?"
+                        " ORDER BY stored_at LIMIT ?)",
+                        (namespace, namespace, size - maxsize),
+                    ).rowcount
+                    self._adjust_count(connection, namespace, -evicted)
+        except sqlite3.Error as exc:
+            raise CacheBackendError(str(exc)) from exc
+        return True, expired, evicted
+
+    def _prune(self, connection: sqlite3.Connection, namespace: str, now: float) -> int:
+        """Delete *namespace*'s expired rows (an index range scan); return how many."""
+        expired = connection.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?", (namespace, now)
+        ).rowcount
+        self._pruned_at[namespace] = now
+        if expired:
+            self._adjust_count(connection, namespace, -expired)
+        return expired
+
+    @staticmethod
+    def _adjust_count(connection: sqlite3.Connection, namespace: str, delta: int) -> int:
+        """Add *delta* to *namespace*'s stored entry count; return the new count."""
+        connection.execute(
+            "INSERT INTO cache_counts (namespace, entries) VALUES (?, ?)"
+            " ON CONFLICT (namespace) DO UPDATE SET entries = entries + excluded.entries",
+            (namespace, delta),
+        )
+        (entries,) = connection.execute(
+            "SELECT entries FROM cache_counts WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        return entries
+
+    def delete(self, namespace: str, key: str) -> bool:
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                deleted = connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key)
+                ).rowcount
+                if deleted:
+                    self._adjust_count(connection, namespace, -deleted)
+        except sqlite3.Error as exc:
+            raise CacheBackendError(str(exc)) from exc
+        return deleted > 0
+
+    def clear(self, namespace: str) -> None:
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+                connection.execute("DELETE FROM cache_counts WHERE namespace = ?", (namespace,))
+        except sqlite3.Error as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    def count(self, namespace: str) -> int:
+        (size,) = self._execute(
+            "SELECT COUNT(*) FROM cache_entries"
+            " WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (namespace, time.time()),
+        ).fetchone()
+        return size
+
+    def keys(self, namespace: str) -> list[bytes]:
+        rows = self._execute(
+            "SELECT pickled_key FROM cache_entries"
+            " WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (namespace, time.time()),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache entries in Redis (or any server speaking the Redis protocol).
+
+    Each entry is a hash with ``value`` and ``key`` fields, so listing the
+    keys reads only the small ``key`` field.  Expiry uses native key TTLs.
+    ``maxsize`` is not enforced per namespace; configure ``maxmemory`` with an
+    ``allkeys-lru`` policy on the server.
+    """
+
+    def __init__(self, url: str, prefix: str = "trendsearth_ui", client: Any = None) -> None:
+        if client is None:
+            if redis is None:
+                raise CacheBackendError("CACHE_BACKEND=redis requires the 'redis' package")
+            client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+        self.client = client
+        self.prefix = prefix
+        self._errors: tuple[type[Exception], ...] = (OSError,)
+        if redis is not None:
+            self._errors += (redis.RedisError,)
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def _call(self, method: str, *args, **kwargs):
+        try:
+            return getattr(self.client, method)(*args, **kwargs)
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    def _execute_pipeline(self, pipeline) -> list:
+        try:
+            return pipeline.execute()
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        return self._call("hget", self._key(namespace, key), "value")
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: float | None,
+        maxsize: int,  # noqa: ARG002 - bounded by the server's maxmemory policy
+        pickled_key: bytes,
+    ) -> tuple[int, int]:
+        name = self._key(namespace, key)
+        pipeline = self.client.pipeline()
+        pipeline.delete(name)
+        pipeline.hset(name, mapping={"value": value, "key": pickled_key})
+        if ttl is not None:
+            pipeline.expire(name, max(1, math.ceil(ttl)))
+        self._execute_pipeline(pipeline)
+        return 0, 0
+
+    # HSET then EXPIRE unless the entry exists, in one atomic step.
+    _ADD_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then return 0 end
+redis.call('hset', KEYS[1], 'value', ARGV[1], 'key', ARGV[2])
+if ARGV[3] ~= '' then redis.call('expire', KEYS[1], ARGV[3]) end
+return 1
+"""
+
+    def add(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl: float | None,
+        maxsize: int,  # noqa: ARG002 - bounded by the server's maxmemory policy
+        pickled_key: bytes,
+    ) -> bool:
+        expiry = str(max(1, math.ceil(ttl))) if ttl is not None else ""
+        added = self._call(
+            "eval", self._ADD_SCRIPT, 1, self._key(namespace, key), value, pickled_key, expiry
+        )
+        return bool(added)
+
+    def delete(self, namespace: str, key: str) -> bool:
+        return bool(self._call("delete", self._key(namespace, key)))
+
+    def _namespace_keys(self, namespace: str) -> list:
+        return list(self._call("scan_iter", match=f"{self.prefix}:{namespace}:*", count=500))
+
+    def clear(self, namespace: str) -> None:
+        keys = self._namespace_keys(namespace)
+        if keys:
+            self._call("delete", *keys)
+
+    def count(self, namespace: str) -> int:
+        return len(self._namespace_keys(namespace))
+
+    def keys(self, namespace: str) -> list[bytes]:
+        names = self._namespace_keys(namespace)
+        if not names:
+            return []
+        pipeline = self.client.pipeline(transaction=False)
+        for name in names:
+            pipeline.hget(name, "key")
+        return [key for key in self._execute_pipeline(pipeline) if key is not None]
+
+
+def _key_digest(key: Any) -> str:
+    """Stable string form of a cache key (tuples and strings alike), hashed."""
+    encoded = json.dumps(key, sort_keys=True, default=repr, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SharedTTLCache(MutableMapping):
+    """TTL cache stored in a :class:`CacheBackend` under the namespace *name*.
+
+    Entries are stored as pickled ``(key, value)`` pairs under a hash of the
+    key, with the pickled key alongside so iteration (used by pattern
+    invalidation) recovers the keys without loading any values.
+    Counts hits, misses, evictions and expirations for this process, like
+    :class:`~trendsearth_ui.utils.metrics.InstrumentedTTLCache`.  The backends
+    are safe to call from several threads, so only the counters need a lock.
+    """
+
+    def __init__(
+        self, name: str, backend: CacheBackend, maxsize: int, ttl: float | None = None
+    ) -> None:
+        self.name = name
+        self.backend = backend
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._counter_lock = Lock()
+
+    def _load(self, key: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            payload = self.backend.get(self.name, _key_digest(key))
+        except CacheBackendError as exc:
+            logger.warning("Shared cache %s read failed: %s", self.name, exc)
+            return _MISSING
+        finally:
+            server_timing.record("cache", time.perf_counter() - started)
+        if payload is None:
+            return _MISSING
+        try:
+            stored_key, value = pickle.loads(payload)
+        except Exception:
+            logger.warning("Discarding unreadable %s cache entry", self.name, exc_info=True)
+            return _MISSING
+        return value if stored_key == key else _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._load(key)
+        with self._counter_lock:
+            if value is _MISSING:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: Any) -> bool:
+        return self._load(key) is not _MISSING
+
+    def _dump(self, key: Any, value: Any) -> tuple[bytes, bytes] | None:
+        try:
+            payload = pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL)
+            pickled_key = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug("Not caching unpicklable %s value", self.name, exc_info=True)
+            return None
+        return payload, pickled_key
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        dumped = self._dump(key, value)
+        if dumped is None:
+            return
+        try:
+            expired, evicted = self.backend.set(
+                self.name, _key_digest(key), dumped[0], self.ttl, self.maxsize, dumped[1]
+            )
+        except CacheBackendError as exc:
+            logger.warning("Shared cache %s write failed: %s", self.name, exc)
+            return
+        with self._counter_lock:
+            self.expirations += expired
+            self.evictions += evicted
+
+    def add(self, key: Any, value: Any) -> bool:
+        """Store *value* unless *key* is present, atomically across workers.
+
+        Returns whether the value was stored; ``False`` when the backend
+        fails, so callers treat an outage as "someone else has it".
+        """
+        dumped = self._dump(key, value)
+        if dumped is None:
+            return False
+        try:
+            return self.backend.add(
+                self.name, _key_digest(key), dumped[0], self.ttl, self.maxsize, dumped[1]
+            )
+        except CacheBackendError as exc:
+            logger.warning("Shared cache %s write failed: %s", self.name, exc)
+            return False
+
+    def __delitem__(self, key: Any) -> None:
+        try:
+            deleted = self.backend.delete(self.name, _key_digest(key))
+        except CacheBackendError as exc:
+            logger.warning("Shared cache %s delete failed: %s", self.name, exc)
+            deleted = False
+        if not deleted:
+            raise KeyError(key)
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        value = self._load(key)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        try:
+            self.backend.delete(self.name, _key_digest(key))
+        except CacheBackendError as exc:
+            logger.warning("Shared cache %s delete failed: %s", self.name, exc)
+        return value
+
+    def clear(self) -> None:
+        try:
+            self.backend.clear(self.name)
+        except CacheBackendError as exc:
+            logger.warning("Shared cache %s clear failed: %s", self.name, exc)
+
+    def __len__(self) -> int:
+        try:
+            return self.backend.count(self.name)
+        except CacheBackendError:
+            return 0
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            pickled_keys = self.backend.keys(self.name)
+        except CacheBackendError as exc:
+            logger.warning("Shared cache %s scan failed: %s", self.name, exc)
+            return iter(())
+        keys = []
+        for pickled_key in pickled_keys:
+            try:
+                keys.append(pickle.loads(pickled_key))
+            except Exception:
+                continue
+        return iter(keys)
+
+
+_backend: CacheBackend | None = None
+_backend_resolved = False
+_backend_lock = Lock()
+
+
+def create_backend(kind: str) -> CacheBackend | None:
+    """Build the backend named by *kind*; ``None`` means in-process caches."""
+    if kind == "sqlite":
+        return SQLiteCacheBackend(CACHE_SQLITE_PATH)
+    if kind == "redis":
+        return RedisCacheBackend(CACHE_REDIS_URL)
+    if kind != "memory":
+        logger.error("Unknown CACHE_BACKEND %r; using in-process caches", kind)
+    return None
+
+
+def get_cache_backend() -> CacheBackend | None:
+    """Return the configured shared backend, or ``None`` for in-process caches."""
+    global _backend, _backend_resolved
+    with _backend_lock:
+        if not _backend_resolved:
+            try:
+                _backend = create_backend(CACHE_BACKEND)
+            except CacheBackendError as exc:
+                logger.error("Shared cache unavailable (%s); using in-process caches", exc)
+                _backend = None
+            _backend_resolved = True
+        return _backend
+
+
+def shared_cache(
+    name: str,
+    maxsize: int,
+    ttl: float | None = None,
+    max_bytes: int | None = None,
+    shared: bool = True,
+):
+    """Create the store for a cache that is shared between workers when configured.
+
+    Without a shared backend this returns an :class:`InstrumentedTTLCache`
+    (a :class:`SizeAwareTTLCache` holding at most *maxsize* entries within
+    *max_bytes* when that is given, or a :class:`SynchronizedLRUCache` when
+    *ttl* is ``None``), i.e. a per-process cache.  Shared backends ignore
+    *max_bytes*: they hold the data outside the worker's memory and have their
+    own limits.  ``shared=False`` always returns a per-process cache, for
+    values that must not be written outside the worker's memory.
+
+    Either way the cache is safe to use from several threads.  Modules
+    declare caches through :meth:`~.cache_manager.CacheManager.namespace`,
+    which wraps this store and registers it for metrics.
+    """
+    backend = get_cache_backend() if shared else None
+    if backend is not None:
+        return SharedTTLCache(name, backend, maxsize, ttl)
+    if ttl is None:
+        return SynchronizedLRUCache(maxsize=maxsize)
+    if max_bytes:
+        return SizeAwareTTLCache(maxsize=max_bytes, ttl=ttl, max_entries=maxsize)
+    return InstrumentedTTLCache(maxsize=maxsize, ttl=ttl)
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheBackendError",
+    "RedisCacheBackend",
+    "SQLiteCacheBackend",
+    "SharedTTLCache",
+    "create_backend",
+    "get_cache_backend",
+    "shared_cache",
+]
@@ -0,0 +1,356 @@
+"""One registry for every cache in the UI server.
+
+Each cache is a *namespace* declared on :data:`cache_manager` with its own
+TTL and size policy::
+
+    _status_data_cache = cache_manager.namespace("status_data", maxsize=50, ttl=870)
+
+A namespace is a ``MutableMapping`` backed by the store
+:func:`~.cache_backend.shared_cache` builds (in-process, SQLite or Redis), so
+modules use it exactly like the ``cachetools`` caches it replaces.  On top of
+that the manager provides:
+
+* **Typed keys.**  :class:`CacheKey` builds a key from a kind and named
+  fields.  It is a ``str`` (``"page_api_environment=production_endpoint=/execution"``),
+  so it hashes, pickles and logs like the hand-built keys it replaces, and
+  it remembers its fields.
+* **Tag-based invalidation.**  Every field of a :class:`CacheKey` is a tag.
+  :meth:`CacheManager.invalidate` accepts ``"status_data"`` (a whole
+  namespace), ``"aggrid_last_good:api_environment=production"`` (matching
+  entries of one namespace) or ``"api_environment=production"`` (matching
+  entries of every namespace).
+* **Statistics** per namespace (hits, misses, evictions, expirations, entries
+  and estimated bytes), reported on ``/metrics`` and by :meth:`CacheManager.stats`.
+* **A global memory budget** (``CACHE_MEMORY_BUDGET_MB``) across the
+  in-process namespaces.  Writes record each value's estimated size, and
+  entries a store evicts or expires by itself are subtracted again (for the
+  written namespace on each write, for all of them before enforcing the
+  budget or reporting statistics); once the total is over budget the
+  oldest-written entries of any namespace are evicted.  Shared backends are bounded by their own limits instead.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Iterator, MutableMapping
+import logging
+from threading import RLock
+from typing import Any
+
+from ..config import CACHE_MEMORY_BUDGET_MB
+from .cache_backend import SharedTTLCache, shared_cache
+from .metrics import estimate_size, register_cache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _restore_key(kind: str, fields: dict[str, Any]) -> CacheKey:
+    return CacheKey(kind, **fields)
+
+
+class CacheKey(str):
+    """Cache key built from a kind and named fields.
+
+    ``CacheKey("consolidated_stats", api_environment="production", period="last_day")``
+    equals ``"consolidated_stats_api_environment=production_period=last_day"``.
+    Fields whose value is ``None`` are left out.  :attr:`tags` lists
+    ``kind=<kind>`` and one ``name=value`` tag per field.
+    """
+
+    kind: str
+    fields: dict[str, Any]
+
+    def __new__(cls, kind: str, **fields: Any) -> CacheKey:
+        fields = {name: value for name, value in sorted(fields.items()) if value is not None}
+        key = super().__new__(cls, "_".join([kind, *(f"{k}={v}" for k, v in fields.items())]))
+        key.kind = kind
+        key.fields = fields
+        return key
+
+    def __reduce__(self):
+        return _restore_key, (self.kind, self.fields)
+
+    @property
+    def tags(self) -> frozenset[str]:
+        return frozenset([f"kind={self.kind}", *(f"{k}={v}" for k, v in self.fields.items())])
+
+
+def _parse_tag(tag: str) -> tuple[str | None, frozenset[str]]:
+    """Split ``"namespace:field=value,field=value"`` into the namespace and field tags."""
+    namespace, separator, fields = tag.partition(":")
+    if not separator:
+        namespace, fields = (None, tag) if "=" in tag else (tag, "")
+    return namespace, frozenset(part.strip() for part in fields.split(",") if part.strip())
+
+
+class CacheNamespace(MutableMapping):
+    """A named cache with its own TTL and size policy; see :meth:`CacheManager.namespace`."""
+
+    def __init__(
+        self,
+        manager: CacheManager,
+        name: str,
+        store: MutableMapping,
+        maxsize: int,
+        ttl: float | None,
+        track_bytes: bool,
+    ) -> None:
+        self.manager = manager
+        self.name = name
+        self.store = store
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.track_bytes = track_bytes
+        self.budget_evictions = 0
+        # Keys the store evicted or expired on its own, not yet reconciled.
+        # Appending needs no lock, so the store can report them under its own.
+        self._removed: deque[Any] = deque()
+        if track_bytes and hasattr(store, "on_remove"):
+            store.on_remove = self._removed.append
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.store[key]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self.store.get(key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.store
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.store[key] = value
+        self._account(key, value)
+
+    def add(self, key: Any, value: Any) -> bool:
+        """Store *value* unless *key* is present, atomically; return whether it was stored.
+
+        With a shared backend the check holds across workers, so one worker
+        can claim a key (a lease, say) for the others.
+        """
+        added = self.store.add(key, value)
+        if added:
+            self._account(key, value)
+        return added
+
+    def _account(self, key: Any, value: Any) -> None:
+        if self.track_bytes:
+            # Size-aware stores have already measured the value.
+            weight = getattr(self.store, "weight", None)
+            size = weight(key) if weight is not None else estimate_size(value)
+            self.manager._account(self, key, size)
+
+    def __delitem__(self, key: Any) -> None:
+        try:
+            del self.store[key]
+        finally:
+            self.manager._forget(self, key)
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        self.manager._forget(self, key)
+        if default is _MISSING:
+            return self.store.pop(key)
+        return self.store.pop(key, default)
+
+    def clear(self) -> None:
+        self.store.clear()
+        self.manager._forget_namespace(self)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.store)
+
+    def invalidate(self, tags: frozenset[str] | None = None) -> int:
+        """Drop the entries whose :class:`CacheKey` carries every tag in *tags*.
+
+        With no tags the whole namespace is cleared.  Returns the number of
+        entries dropped.
+        """
+        if not tags:
+            cleared = len(self.store)
+            self.clear()
+            return cleared
+        matching = [key for key in self if isinstance(key, CacheKey) and tags <= key.tags]
+        cleared = 0
+        for key in matching:
+            try:
+                del self[key]
+            except KeyError:
+                continue
+            cleared += 1
+        return cleared
+
+    def stats(self) -> dict[str, int]:
+        if self.track_bytes:
+            expire = getattr(self.store, "expire", None)
+            if expire is not None:
+                expire()
+            self.manager._reconcile(self)
+        values = {
+            name: getattr(self.store, name, 0)
+            for name in ("hits", "misses", "evictions", "expirations")
+        }
+        values["evictions"] += self.budget_evictions
+        values["entries"] = len(self.store)
+        values["bytes"] = self.manager._namespace_bytes.get(self.name, 0)
+        return values
+
+
+class CacheManager:
+    """Declares cache namespaces and invalidates, measures and bounds them together.
+
+    Args:
+        memory_budget: Bytes the in-process namespaces may hold in total;
+            ``None`` or ``0`` means unbounded (each namespace is still capped
+            at its ``maxsize``).
+    """
+
+    def __init__(self, memory_budget: int | None = None) -> None:
+        self.memory_budget = memory_budget or None
+        self._namespaces: dict[str, CacheNamespace] = {}
+        # (namespace, key) -> estimated bytes, oldest write first
+        self._sizes: OrderedDict[tuple[str, Any], int] = OrderedDict()
+        self._namespace_bytes: dict[str, int] = {}
+        self._lock = RLock()
+
+    def namespace(
+        self,
+        name: str,
+        *,
+        maxsize: int,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        shared: bool = True,
+    ) -> CacheNamespace:
+        """Declare the namespace *name*, holding at most *maxsize* entries for *ttl* seconds.
+
+        ``ttl=None`` keeps entries until they are evicted (least recently
+        used first).  *max_bytes* also bounds an in-process namespace by the
+        estimated size of its values, evicting large, little-used entries
+        first (see :class:`~.metrics.SizeAwareTTLCache`).  ``shared=False``
+        keeps the namespace in the worker's memory even when ``CACHE_BACKEND``
+        is configured, for secrets and for data written too often to be
+        worth a round trip to the backend.  Declaring a name
+        again replaces the earlier namespace, as a module reload or a second
+        warmer instance would.
+        """
+        store = shared_cache(name, maxsize=maxsize, ttl=ttl, max_bytes=max_bytes, shared=shared)
+        namespace = CacheNamespace(
+            self, name, store, maxsize, ttl, track_bytes=not isinstance(store, SharedTTLCache)
+        )
+        with self._lock:
+            previous = self._namespaces.get(name)
+            if previous is not None:
+                self._forget_namespace(previous)
+            self._namespaces[name] = namespace
+        return register_cache(name, namespace)
+
+    def __getitem__(self, name: str) -> CacheNamespace:
+        return self._namespaces[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._namespaces
+
+    @property
+    def namespaces(self) -> list[str]:
+        return sorted(self._namespaces)
+
+    def invalidate(self, tag: str) -> int:
+        """Drop the entries selected by *tag*; return how many were dropped.
+
+        *tag* is a namespace name (``"status_data"``), a namespace with field
+        tags (``"status_data:kind=comprehensive_status,api_environment=staging"``)
+        or field tags alone, which apply to every namespace.  Unknown
+        namespaces match nothing.
+        """
+        namespace, tags = _parse_tag(tag)
+        if namespace is not None:
+            target = self._namespaces.get(namespace)
+            targets = [target] if target is not None else []
+        else:
+            targets = list(self._namespaces.values())
+        cleared = sum(target.invalidate(tags) for target in targets)
+        logger.debug("Invalidated %d cache entries for %r", cleared, tag)
+        return cleared
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Counters, entry count and estimated bytes per namespace."""
+        return {name: namespace.stats() for name, namespace in list(self._namespaces.items())}
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._namespace_bytes.values())
+
+    # -- memory accounting ------------------------------------------------
+
+    def _account(self, namespace: CacheNamespace, key: Any, size: int) -> None:
+        with self._lock:
+            self._reconcile(namespace)
+            if self._namespaces.get(namespace.name) is not namespace:
+                return
+            entry = (namespace.name, key)
+            self._add_bytes(namespace.name, size - self._sizes.pop(entry, 0))
+            self._sizes[entry] = size
+            if self.memory_budget is not None and self.total_bytes > self.memory_budget:
+                # Other namespaces may still count entries their stores dropped.
+                self._reconcile()
+                if self.total_bytes > self.memory_budget:
+                    self._enforce_budget()
+
+    def _forget(self, namespace: CacheNamespace, key: Any) -> None:
+        with self._lock:
+            size = self._sizes.pop((namespace.name, key), None)
+            if size is not None:
+                self._add_bytes(namespace.name, -size)
+
+    def _forget_namespace(self, namespace: CacheNamespace) -> None:
+        with self._lock:
+            for entry in [entry for entry in self._sizes if entry[0] == namespace.name]:
+                del self._sizes[entry]
+            self._namespace_bytes.pop(namespace.name, None)
+
+    def _add_bytes(self, name: str, delta: int) -> None:
+        self._namespace_bytes[name] = self._namespace_bytes.get(name, 0) + delta
+
+    def _reconcile(self, namespace: CacheNamespace | None = None) -> None:
+        """Stop counting entries the stores have evicted or expired themselves.
+
+        Only *namespace* is reconciled when given, otherwise every namespace.
+        """
+        with self._lock:
+            targets = [namespace] if namespace is not None else list(self._namespaces.values())
+            for target in targets:
+                if self._namespaces.get(target.name) is not target:
+                    continue  # replaced; its entries were forgotten with it
+                removed = target._removed
+                while removed:
+                    key = removed.popleft()
+                    # The key may have been written again since it was removed.
+                    if key not in target.store:
+                        self._forget(target, key)
+
+    def _enforce_budget(self) -> None:
+        while self.total_bytes > self.memory_budget and len(self._sizes) > 1:
+            (name, key), size = self._sizes.popitem(last=False)
+            self._add_bytes(name, -size)
+            namespace = self._namespaces[name]
+            try:
+                del namespace.store[key]  # not pop(), which counts a hit
+            except KeyError:
+                continue
+            namespace.budget_evictions += 1
+            logger.debug("Evicted %s entry %r (%d bytes) to stay within budget", name, key, size)
+
+
+cache_manager = CacheManager(memory_budget=CACHE_MEMORY_BUDGET_MB * 1024 * 1024)
+
+
+__all__ = [
+    "CacheKey",
+    "CacheManager",
+    "CacheNamespace",
+    "cache_manager",
+]
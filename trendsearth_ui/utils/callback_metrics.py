@@ -0,0 +1,294 @@
+"""Per-callback latency and payload-size instrumentation.
+
+:func:`instrumented_callbacks` temporarily wraps ``app.callback`` and the
+registration behind the global ``dash.callback`` decorator while the callbacks
+are registered, so every server-side callback is timed without touching its
+module.  For each call it records wall time, the time
+spent waiting on the Trends.Earth API (accumulated by the HTTP adapter through
+:func:`record_upstream_time`) and whether the callback produced any update.
+Input and output payload sizes require JSON serialisation, so they are only
+measured for a ``CALLBACK_METRICS_SAMPLE_RATE`` fraction of calls.
+
+Results are exported through :mod:`.metrics` and summarised by
+:func:`get_callback_summary` for the superadmin panel.
+
+The wrapper also marks where the callback body ends for the ``serialize``
+segment of the ``Server-Timing`` header.  With ``CALLBACK_METRICS_ENABLED``
+off but ``SERVER_TIMING_ENABLED`` on, callbacks get a timing-only wrapper
+that does just that.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+import functools
+import logging
+import random
+from threading import Lock
+import time
+from typing import Any
+
+from dash import _callback as dash_callback
+from dash._callback import NoUpdate
+from dash.exceptions import PreventUpdate
+from plotly.io.json import to_json_plotly
+
+from ..config import (
+    CALLBACK_METRICS_ENABLED,
+    CALLBACK_METRICS_SAMPLE_RATE,
+    SERVER_TIMING_ENABLED,
+)
+from .metrics import counter, histogram
+from .server_timing import mark_callback_finished
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_BUCKETS = (1e3, 1e4, 5e4, 1e5, 5e5, 1e6, 5e6)
+
+CALLBACK_SECONDS = histogram(
+    "callback_duration_seconds", "Wall time of Dash callbacks.", ("callback",)
+)
+CALLBACK_UPSTREAM_SECONDS = histogram(
+    "callback_upstream_seconds",
+    "Time Dash callbacks spent waiting on the Trends.Earth API.",
+    ("callback",),
+)
+CALLBACK_CALLS = counter(
+    "callback_calls",
+    "Dash callback invocations by outcome (update, no_update or error).",
+    ("callback", "outcome"),
+)
+CALLBACK_PAYLOAD_BYTES = histogram(
+    "callback_payload_bytes",
+    "Serialised size of sampled callback inputs and outputs.",
+    ("callback", "direction"),
+    buckets=PAYLOAD_BUCKETS,
+)
+
+
+class _UpstreamTime:
+    """Upstream seconds for one callback call.
+
+    Fan-out threads run in copies of the callback's context and so share
+    this object; the lock keeps their additions from being lost.
+    """
+
+    __slots__ = ("_lock", "seconds")
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self._lock = Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.seconds += seconds
+
+
+# Upstream seconds accumulated by the callback running in the current context.
+_upstream_seconds: ContextVar[_UpstreamTime | None] = ContextVar(
+    "callback_upstream_seconds", default=None
+)
+
+
+def record_upstream_time(seconds: float) -> None:
+    """Add *seconds* of upstream API time to the running callback, if any."""
+    accumulator = _upstream_seconds.get()
+    if accumulator is not None:
+        accumulator.add(seconds)
+
+
+@dataclass(slots=True)
+class CallbackStats:
+    """Running totals for one callback."""
+
+    calls: int = 0
+    no_update: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    upstream_seconds: float = 0.0
+    sampled: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+
+
+_stats: dict[str, CallbackStats] = {}
+_stats_lock = Lock()
+
+
+def _is_no_update(value: Any) -> bool:
+    if NoUpdate.is_no_update(value):
+        return True
+    if isinstance(value, list | tuple) and value:
+        return all(NoUpdate.is_no_update(item) for item in value)
+    return False
+
+
+def _payload_size(value: Any) -> int:
+    try:
+        return len(to_json_plotly(value))
+    except Exception:
+        return 0
+
+
+def _record(
+    name: str,
+    outcome: str,
+    elapsed: float,
+    upstream: float,
+    sizes: tuple[int, int] | None,
+) -> None:
+    CALLBACK_SECONDS.observe(elapsed, callback=name)
+    CALLBACK_UPSTREAM_SECONDS.observe(upstream, callback=name)
+    CALLBACK_CALLS.inc(callback=name, outcome=outcome)
+    if sizes is not None:
+        CALLBACK_PAYLOAD_BYTES.observe(sizes[0], callback=name, direction="input")
+        CALLBACK_PAYLOAD_BYTES.observe(sizes[1], callback=name, direction="output")
+
+    with _stats_lock:
+        stats = _stats.setdefault(name, CallbackStats())
+        stats.calls += 1
+        stats.no_update += outcome == "no_update"
+        stats.errors += outcome == "error"
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.upstream_seconds += upstream
+        if sizes is not None:
+            stats.sampled += 1
+            stats.input_bytes += sizes[0]
+            stats.output_bytes += sizes[1]
+
+
+def instrument_callback(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """Wrap a Dash callback function so each call is measured under *name*."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        accumulator = _UpstreamTime()
+        token = _upstream_seconds.set(accumulator)
+        sampled = random.random() < CALLBACK_METRICS_SAMPLE_RATE
+        outcome = "error"
+        result = None
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            outcome = "no_update" if _is_no_update(result) else "update"
+            return result
+        except PreventUpdate:
+            outcome = "no_update"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            _upstream_seconds.reset(token)
+            sizes = None
+            if sampled:
+                sizes = (_payload_size([args, kwargs]), _payload_size(result))
+            try:
+                _record(name, outcome, elapsed, accumulator.seconds, sizes)
+            except Exception as exc:
+                logger.debug("Failed to record metrics for callback %s: %s", name, exc)
+            mark_callback_finished()
+
+    return wrapper
+
+
+def mark_callback_end(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a Dash callback function so only its end is marked for Server-Timing."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            mark_callback_finished()
+
+    return wrapper
+
+
+def _instrumenting(decorator: Callable[..., Any]) -> Callable[..., Any]:
+    def register(func):
+        if not CALLBACK_METRICS_ENABLED:
+            return decorator(mark_callback_end(func))
+        module = func.__module__.rsplit(".", 1)[-1]
+        return decorator(instrument_callback(func, f"{module}.{func.__name__}"))
+
+    return register
+
+
+@contextmanager
+def instrumented_callbacks(app) -> Iterator[None]:
+    """Instrument every callback registered in this block.
+
+    Covers ``app.callback`` and the global ``dash.callback`` (however it was
+    imported), which Dash registers through ``dash._callback.register_callback``
+    into its global callback map.  Nothing is wrapped when both callback
+    metrics and Server-Timing are disabled.
+    """
+    if not (CALLBACK_METRICS_ENABLED or SERVER_TIMING_ENABLED):
+        yield
+        return
+
+    original_callback = app.callback
+    original_register = dash_callback.register_callback
+
+    def callback(*args, **kwargs):
+        return _instrumenting(original_callback(*args, **kwargs))
+
+    def register_callback(callback_list, callback_map, *args, **kwargs):
+        decorator = original_register(callback_list, callback_map, *args, **kwargs)
+        if callback_map is not dash_callback.GLOBAL_CALLBACK_MAP:
+            return decorator  # app.callback, instrumented above
+        return _instrumenting(decorator)
+
+    app.callback = callback
+    dash_callback.register_callback = register_callback
+    try:
+        yield
+    finally:
+        app.callback = original_callback
+        dash_callback.register_callback = original_register
+
+
+def get_callback_summary(limit: int | None = None) -> list[dict[str, Any]]:
+    """Return per-callback totals and averages, slowest (by total time) first."""
+    with _stats_lock:
+        snapshot = {name: asdict(stats) for name, stats in _stats.items()}
+
+    rows = []
+    for name, stats in snapshot.items():
+        calls = stats["calls"] or 1
+        sampled = stats["sampled"] or 1
+        rows.append(
+            {
+                "callback": name,
+                **stats,
+                "avg_ms": stats["total_seconds"] * 1000 / calls,
+                "max_ms": stats["max_seconds"] * 1000,
+                "avg_upstream_ms": stats["upstream_seconds"] * 1000 / calls,
+                "no_update_rate": stats["no_update"] / calls,
+                "avg_input_bytes": stats["input_bytes"] / sampled if stats["sampled"] else None,
+                "avg_output_bytes": stats["output_bytes"] / sampled if stats["sampled"] else None,
+            }
+        )
+    rows.sort(key=lambda row: row["total_seconds"], reverse=True)
+    return rows[:limit] if limit else rows
+
+
+def reset_callback_stats() -> None:
+    """Clear the per-callback totals (the Prometheus series are unaffected)."""
+    with _stats_lock:
+        _stats.clear()
+
+
+__all__ = [
+    "CallbackStats",
+    "get_callback_summary",
+    "instrument_callback",
+    "instrumented_callbacks",
+    "mark_callback_end",
+    "record_upstream_time",
+    "reset_callback_stats",
+]
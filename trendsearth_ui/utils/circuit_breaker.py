@@ -0,0 +1,221 @@
+"""Per-endpoint-family circuit breakers for upstream API calls.
+
+When the API is slow or down, every callback that calls it would otherwise wait
+out its full timeout.  A :class:`CircuitBreaker` counts consecutive failures
+(connection errors, timeouts and 5xx responses) for one endpoint family on one
+host.  After ``CIRCUIT_BREAKER_FAILURE_THRESHOLD`` failures the circuit opens
+and requests fail fast with :class:`CircuitOpenError` instead of reaching the
+network.  Once ``CIRCUIT_BREAKER_RESET_TIMEOUT`` seconds have passed a single
+*half-open* probe request is let through; its outcome closes the circuit again
+or re-opens it for another period.
+
+Callers that keep a last good copy of their data (``StatusDataManager`` and the
+AG-Grid page fetches) check :func:`is_circuit_open` and serve that copy, marked
+as stale, while the circuit is open.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from threading import Lock
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from ..config import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    get_api_base,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Endpoint families guarded by a breaker; first match wins.  Requests outside
+# these families (auth, user and script management) are never short-circuited.
+ENDPOINT_FAMILIES: tuple[tuple[str, str], ...] = (
+    ("logs", r"/(execution|script)/[^/]+/(log|docker)"),
+    ("boundaries", r"/data/boundaries"),
+    ("stats", r"/stats/"),
+    ("status", r"/status(/|$)|/api-health$"),
+    ("execution", r"/execution(/|$)"),
+)
+
+# Response status codes counted as upstream failures.
+FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+class CircuitOpenError(RequestsConnectionError):
+    """Raised instead of sending a request while its circuit is open.
+
+    Subclasses :class:`requests.exceptions.ConnectionError` so existing
+    ``RequestException`` handlers treat it like an unreachable API.
+    """
+
+    def __init__(self, breaker_name: str, **kwargs) -> None:
+        super().__init__(f"Circuit open for {breaker_name}; failing fast", **kwargs)
+        self.breaker_name = breaker_name
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+        self._lock = Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state: ``closed``, ``open`` or ``half_open``."""
+        return self._state
+
+    def is_open(self) -> bool:
+        """Return True while requests would fail fast (open and not yet due a probe)."""
+        with self._lock:
+            if self._state == OPEN:
+                return time.monotonic() - self._opened_at < self.reset_timeout
+            return self._state == HALF_OPEN and self._probe_in_flight
+
+    def admit(self) -> str | None:
+        """Admit a request; return the state it was admitted in, or ``None`` if rejected.
+
+        While open, the first call after the reset timeout becomes the
+        half-open probe; other calls are rejected until it completes.  Only a
+        caller admitted as ``HALF_OPEN`` holds the probe slot, and must record
+        an outcome or :meth:`release` it.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return CLOSED
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return None
+                self._state = HALF_OPEN
+            if self._probe_in_flight:
+                return None
+            self._probe_in_flight = True
+            logger.info("Circuit %s half-open; sending probe request", self.name)
+            return HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now (see :meth:`admit`)."""
+        return self.admit() is not None
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("Circuit %s closed; upstream recovered", self.name)
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        "Circuit %s opened after %d consecutive failures",
+                        self.name,
+                        self._failures,
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Give up a half-open probe slot without recording an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        with self._lock:
+            return {"state": self._state, "consecutive_failures": self._failures}
+
+
+_breakers: dict[tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = Lock()
+
+
+def endpoint_family(url: str) -> str | None:
+    """Return the endpoint family of *url*, or None if it is not guarded."""
+    path = urlsplit(url).path
+    for family, pattern in ENDPOINT_FAMILIES:
+        if re.search(pattern, path):
+            return family
+    return None
+
+
+def get_breaker(host: str, family: str) -> CircuitBreaker:
+    """Return the breaker for *family* on *host*, creating it on first use."""
+    key = (host, family)
+    breaker = _breakers.get(key)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(key)
+            if breaker is None:
+                breaker = _breakers[key] = CircuitBreaker(f"{family}@{host}")
+    return breaker
+
+
+def breaker_for_url(url: str) -> CircuitBreaker | None:
+    """Return the breaker guarding *url*, or None if its endpoint is not guarded."""
+    family = endpoint_family(url)
+    if family is None:
+        return None
+    return get_breaker(urlsplit(url).netloc, family)
+
+
+def is_circuit_open(family: str, api_environment: str | None = None) -> bool:
+    """Return True if requests for *family* in *api_environment* currently fail fast."""
+    host = urlsplit(get_api_base(api_environment)).netloc
+    breaker = _breakers.get((host, family))
+    return breaker is not None and breaker.is_open()
+
+
+def get_breaker_states() -> dict[str, dict[str, Any]]:
+    """Return the state of every breaker created so far."""
+    return {breaker.name: breaker.snapshot() for breaker in list(_breakers.values())}
+
+
+def reset_breakers() -> None:
+    """Forget all breaker state (used by tests)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+__all__ = [
+    "CLOSED",
+    "ENDPOINT_FAMILIES",
+    "FAILURE_STATUS_CODES",
+    "HALF_OPEN",
+    "OPEN",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "breaker_for_url",
+    "endpoint_family",
+    "get_breaker",
+    "get_breaker_states",
+    "is_circuit_open",
+    "reset_breakers",
+]
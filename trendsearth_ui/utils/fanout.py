@@ -0,0 +1,191 @@
+"""Bounded thread-pool fan-out for independent upstream API calls.
+
+Several pages need data from a handful of unrelated API endpoints.  Running
+those requests one after another makes the callback wait for the *sum* of the
+round trips; :func:`run_fan_out` runs them concurrently on a shared, bounded
+pool so the callback only waits for the slowest one.
+
+Callers whose calls may outlive their deadline (the stats page) pass their
+own ``pool`` so that calls left running in the background cannot occupy the
+threads other fan-outs need.
+
+Each call is isolated: an exception or a missed deadline only affects that
+call's entry in the returned :class:`FanOutResult`, and the per-call timings
+are kept so callers can expose the critical path in their response metadata.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import contextvars
+from dataclasses import dataclass, field
+import logging
+from threading import Lock
+import time
+from typing import Any
+
+from ..config import API_FANOUT_MAX_WORKERS, STATS_FANOUT_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL = "default"
+STATS_POOL = "stats"
+
+_POOL_SIZES = {
+    DEFAULT_POOL: API_FANOUT_MAX_WORKERS,
+    STATS_POOL: STATS_FANOUT_MAX_WORKERS,
+}
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executor_lock = Lock()
+
+
+def get_fanout_executor(pool: str = DEFAULT_POOL) -> ThreadPoolExecutor:
+    """Return the executor for *pool*, creating it on first use."""
+    executor = _executors.get(pool)
+    if executor is None:
+        with _executor_lock:
+            executor = _executors.get(pool)
+            if executor is None:
+                suffix = "" if pool == DEFAULT_POOL else f"-{pool}"
+                executor = ThreadPoolExecutor(
+                    max_workers=max(_POOL_SIZES.get(pool, API_FANOUT_MAX_WORKERS), 1),
+                    thread_name_prefix=f"te-fanout{suffix}",
+                )
+                _executors[pool] = executor
+    return executor
+
+
+def _timed_call(func: Callable[[], Any]) -> tuple[Any, BaseException | None, float]:
+    """Run *func* and return ``(value, error, elapsed_ms)`` without raising."""
+    started = time.perf_counter()
+    try:
+        value = func()
+    except Exception as exc:
+        return None, exc, (time.perf_counter() - started) * 1000
+    return value, None, (time.perf_counter() - started) * 1000
+
+
+@dataclass(slots=True)
+class FanOutResult:
+    """Merged outcome of a fan-out run.
+
+    Attributes:
+        results: Values returned by calls that completed successfully.
+        errors: Error messages for calls that raised.
+        timings: Wall time in milliseconds for every call that finished.
+        pending: Futures for calls that were still running at the deadline.
+        elapsed_ms: Total time the caller spent waiting.
+    """
+
+    results: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    pending: dict[str, Future] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    @property
+    def critical_path(self) -> str | None:
+        """Name of the slowest finished call (the one the caller waited on)."""
+        if not self.timings:
+            return None
+        return max(self.timings, key=self.timings.__getitem__)
+
+    def ok(self, name: str) -> bool:
+        """Return True when *name* finished without raising."""
+        return name in self.results
+
+    def record(self, name: str, outcome: tuple[Any, BaseException | None, float]) -> None:
+        """Store the outcome of a finished call under *name*."""
+        value, error, elapsed_ms = outcome
+        self.timings[name] = round(elapsed_ms, 2)
+        if error is None:
+            self.results[name] = value
+        else:
+            self.errors[name] = str(error) or error.__class__.__name__
+
+    def collect(self) -> list[str]:
+        """Move pending calls that have since finished into the results.
+
+        Returns:
+            Names of the calls that were collected.
+        """
+        collected = []
+        for name, future in list(self.pending.items()):
+            if future.done():
+                self.record(name, future.result())
+                del self.pending[name]
+                collected.append(name)
+        return collected
+
+    def to_meta(self) -> dict[str, Any]:
+        """Summarise the run for inclusion in a response ``meta`` block."""
+        return {
+            "timings_ms": dict(self.timings),
+            "errors": dict(self.errors),
+            "pending": sorted(self.pending),
+            "elapsed_ms": round(self.elapsed_ms, 2),
+            "critical_path": self.critical_path,
+        }
+
+
+def run_fan_out(
+    calls: Mapping[str, Callable[[], Any]],
+    *,
+    timeout: float | None = None,
+    pool: str = DEFAULT_POOL,
+) -> FanOutResult:
+    """Run independent zero-argument callables concurrently and merge their outcomes.
+
+    Calls run on the bounded executor for *pool* inside a copy of the caller's
+    ``contextvars`` context, so Flask request/app context (cookies, locale,
+    ``flask.g``) stays visible to them.  Setting ``API_FANOUT_MAX_WORKERS`` to
+    1 runs the calls sequentially in the calling thread instead, with no
+    deadline.
+
+    Args:
+        calls: Mapping of section name to callable.
+        timeout: Overall deadline in seconds. Calls still running when it
+            passes are left in :attr:`FanOutResult.pending` and keep running
+            in the background.  Ignored in sequential mode
+            (``API_FANOUT_MAX_WORKERS=1``), where every call runs to completion
+            and nothing is ever pending.
+        pool: Name of the executor to run on (``DEFAULT_POOL`` or
+            ``STATS_POOL``).
+
+    Returns:
+        FanOutResult with per-call values, errors and timings.
+    """
+    outcome = FanOutResult()
+    started = time.perf_counter()
+
+    if API_FANOUT_MAX_WORKERS <= 1:
+        for name, func in calls.items():
+            outcome.record(name, _timed_call(func))
+        outcome.elapsed_ms = (time.perf_counter() - started) * 1000
+        return outcome
+
+    executor = get_fanout_executor(pool)
+    futures: dict[Future, str] = {}
+    for name, func in calls.items():
+        context = contextvars.copy_context()
+        futures[executor.submit(context.run, _timed_call, func)] = name
+
+    done, not_done = wait(futures, timeout=timeout)
+    for future in done:
+        outcome.record(futures[future], future.result())
+    for future in not_done:
+        outcome.pending[futures[future]] = future
+
+    outcome.elapsed_ms = (time.perf_counter() - started) * 1000
+    if outcome.pending:
+        logger.warning(
+            "Fan-out deadline of %ss reached; still waiting on: %s",
+            timeout,
+            ", ".join(sorted(outcome.pending)),
+        )
+    return outcome
+
+
+__all__ = ["DEFAULT_POOL", "STATS_POOL", "FanOutResult", "get_fanout_executor", "run_fan_out"]
@@ -1,25 +1,48 @@
 """Utility functions for the Trends.Earth API Dashboard."""
 
 from datetime import datetime
+import hashlib
 import json
 import logging
+from threading import Lock
 from typing import Any
 
 import requests
 
-from ..config import API_BASE
+from ..config import (
+    API_BASE,
+    API_CONNECT_TIMEOUT,
+    API_FAST_READ_TIMEOUT,
+    API_READ_TIMEOUT,
+    TOKEN_REFRESH_REUSE_SECONDS,
+)
+from .cache_manager import CacheKey, cache_manager
 from .http_client import apply_default_headers, get_session
+from .singleflight import SingleFlight
 from .timezone_utils import format_local_time, get_safe_timezone
 
 logger = logging.getLogger(__name__)
 
 # Requests timeout policy: (connect timeout, read timeout)
-DEFAULT_API_TIMEOUT = (3, 20)
-FAST_API_TIMEOUT = (3, 10)
+DEFAULT_API_TIMEOUT = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+FAST_API_TIMEOUT = (API_CONNECT_TIMEOUT, API_FAST_READ_TIMEOUT)
 
 # Role constants
 ADMIN_ROLES = ("ADMIN", "SUPERADMIN")
 
+# Coalesces identical concurrent GETs issued by make_authenticated_request
+_get_single_flight = SingleFlight()
+
+# Refresh tokens are rotated on use, so concurrent refreshes of the same token
+# are coordinated: one caller refreshes and the others reuse its result.  The
+# results hold live access and refresh tokens, so they stay in this worker's
+# memory and are never written to a shared CACHE_BACKEND.
+_refresh_single_flight = SingleFlight()
+_refresh_results = cache_manager.namespace(
+    "token_refresh", maxsize=256, ttl=TOKEN_REFRESH_REUSE_SECONDS, shared=False
+)
+_refresh_results_lock = Lock()
+
 
 def is_admin(role: str | None) -> bool:
     """Return True if the given role has admin privileges (ADMIN or SUPERADMIN)."""
@@ -185,7 +208,7 @@ def refresh_access_token(
 
     try:
         refresh_data = {"refresh_token": refresh_token}
-        resp = get_session().post(
+        resp = get_session(api_environment).post(
             f"{auth_url}/refresh?legacy=false",
             headers=apply_default_headers(),
             json=refresh_data,
@@ -214,6 +237,46 @@ def refresh_access_token(
         return None, None, None
 
 
+def coordinated_refresh_access_token(
+    refresh_token: str, api_environment: str = None
+) -> tuple[str | None, int | None, str | None]:
+    """Refresh an access token, deduplicating concurrent refreshes of the same token.
+
+    Because the API rotates refresh tokens, only the first refresh with a
+    given token succeeds.  The first caller performs the refresh; callers
+    that arrive while it is in flight, or within
+    ``TOKEN_REFRESH_REUSE_SECONDS`` afterwards, receive the same new tokens.
+
+    Args:
+        refresh_token: Refresh token to exchange
+        api_environment: API environment to use for refresh
+
+    Returns:
+        Same tuple as :func:`refresh_access_token`
+    """
+    if not refresh_token:
+        return None, None, None
+
+    key = hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+    cache_key = CacheKey("refresh", refresh_token=key, api_environment=api_environment)
+
+    def refresh() -> tuple[str | None, int | None, str | None]:
+        with _refresh_results_lock:
+            cached = _refresh_results.get(cache_key)
+        if cached is not None:
+            return cached
+        result = refresh_access_token(refresh_token, api_environment)
+        if result[0]:
+            with _refresh_results_lock:
+                _refresh_results[cache_key] = result
+        return result
+
+    result, shared = _refresh_single_flight.do((key, api_environment), refresh)
+    if shared:
+        logger.debug("Reused access token from a concurrent refresh")
+    return result
+
+
 def logout_user(access_token: str, refresh_token: str = None, api_environment: str = None) -> bool:
     """Logout user by revoking refresh token.
 
@@ -242,7 +305,7 @@ def logout_user(access_token: str, refresh_token: str = None, api_environment: s
         if refresh_token:
             logout_data["refresh_token"] = refresh_token
 
-        resp = get_session().post(
+        resp = get_session(api_environment).post(
             f"{auth_url}/logout",
             headers=headers,
             json=logout_data if logout_data else None,
@@ -288,7 +351,9 @@ def logout_all_devices(access_token: str, api_environment: str = None) -> bool:
 
     try:
         headers = apply_default_headers({"Authorization": f"Bearer {access_token}"})
-        resp = get_session().post(f"{auth_url}/logout-all", headers=headers, timeout=10)
+        resp = get_session(api_environment).post(
+            f"{auth_url}/logout-all", headers=headers, timeout=10
+        )
 
         if resp.status_code == 200:
             logger.debug("User logged out from all devices successfully")
@@ -308,8 +373,44 @@ def logout_all_devices(access_token: str, api_environment: str = None) -> bool:
         return False
 
 
+def _build_coalescing_key(full_url: str, token: str, kwargs: dict) -> str:
+    """Build the single-flight key for a GET: URL, params, extra headers and auth scope."""
+    token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16] if token else ""
+    headers = {k: v for k, v in kwargs["headers"].items() if k.lower() != "authorization"}
+    return json.dumps(
+        [full_url, kwargs.get("params"), headers, token_hash], sort_keys=True, default=str
+    )
+
+
+def _coalesced_get(
+    session: requests.Session, full_url: str, token: str, kwargs: dict
+) -> requests.Response:
+    """Issue a GET, sharing the response with identical concurrent callers."""
+
+    def issue() -> requests.Response:
+        resp = session.get(full_url, **kwargs)
+        # Read the body before the response is handed to other threads
+        _ = resp.content
+        return resp
+
+    resp, shared = _get_single_flight.do(_build_coalescing_key(full_url, token, kwargs), issue)
+    if shared:
+        logger.debug("Coalesced GET %s with an in-flight request", full_url)
+    return resp
+
+
+def get_request_coalescing_stats() -> dict[str, int]:
+    """Return issued/coalesced counters for coalesced GET requests."""
+    return _get_single_flight.stats()
+
+
 def make_authenticated_request(
-    url: str, token: str, method: str = "GET", **kwargs
+    url: str,
+    token: str,
+    method: str = "GET",
+    coalesce: bool | None = None,
+    api_environment: str | None = None,
+    **kwargs,
 ) -> requests.Response:
     """Make an authenticated API request with automatic token refresh on authentication failure.
 
@@ -317,15 +418,26 @@ def make_authenticated_request(
         url: The API endpoint URL (can be relative like '/script/123/log' or full URL)
         token: Current access token
         method: HTTP method (GET, POST, etc.)
+        coalesce: Share one upstream request between identical concurrent GETs
+            (same URL, params and token). Defaults to ``API_REQUEST_COALESCING``.
+            Ignored for other methods.
+        api_environment: Environment whose session (and API base, for
+            relative URLs) to use. Defaults to the environment of the current
+            request; background threads have none, so they must pass it.
         **kwargs: Additional arguments to pass to requests
 
     Returns:
-        requests.Response object
+        requests.Response object. Coalesced callers receive the same response
+        object, so it must be treated as read-only.
     """
-    from ..config import get_current_api_base
+    from ..config import API_REQUEST_COALESCING, get_api_base, get_current_api_base
 
-    # If URL is relative (starts with /), prepend the current API base
-    full_url = get_current_api_base() + url if url.startswith("/") else url
+    # If URL is relative (starts with /), prepend the API base
+    if url.startswith("/"):
+        base = get_api_base(api_environment) if api_environment else get_current_api_base()
+        full_url = base + url
+    else:
+        full_url = url
 
     headers = apply_default_headers(kwargs.get("headers"))
     headers["Authorization"] = f"Bearer {token}"
@@ -333,8 +445,13 @@ def make_authenticated_request(
     kwargs.setdefault("timeout", DEFAULT_API_TIMEOUT)
 
     # Make the initial request
-    session = get_session()
-    resp = getattr(session, method.lower())(full_url, **kwargs)
+    session = get_session(api_environment)
+    if coalesce is None:
+        coalesce = API_REQUEST_COALESCING
+    if coalesce and method.upper() == "GET":
+        resp = _coalesced_get(session, full_url, token, kwargs)
+    else:
+        resp = getattr(session, method.lower())(full_url, **kwargs)
 
     # If authentication failed, try to refresh the token and retry
     # Look for 401 Unauthorized or 422 with token-related errors
@@ -368,7 +485,7 @@ def make_authenticated_request(
 
         # Try to get refresh token from cookie
         refresh_token = None
-        api_environment = None
+        cookie_environment = None
         cookie_data = None
         try:
             auth_cookie = request.cookies.get("auth_token")
@@ -376,13 +493,13 @@ def make_authenticated_request(
                 cookie_data = json.loads(auth_cookie)
                 if cookie_data and isinstance(cookie_data, dict):
                     refresh_token = cookie_data.get("refresh_token")
-                    api_environment = cookie_data.get("api_environment", "production")
+                    cookie_environment = cookie_data.get("api_environment", "production")
         except Exception as e:
             logger.debug("Error reading refresh token from cookie: %s", e)
 
         if refresh_token:
-            new_access_token, expires_in, new_refresh_token = refresh_access_token(
-                refresh_token, api_environment
+            new_access_token, expires_in, new_refresh_token = coordinated_refresh_access_token(
+                refresh_token, cookie_environment
             )
             if new_access_token:
                 logger.debug("Token refreshed successfully, retrying %s %s", method, full_url)
@@ -404,7 +521,7 @@ def make_authenticated_request(
                             new_refresh_token or refresh_token,
                             email,
                             user_data,
-                            api_environment,
+                            cookie_environment,
                         )
                         g.updated_auth_cookie = json.dumps(new_cookie_data)
                         logger.debug("Prepared updated cookie data for session maintenance")
@@ -0,0 +1,226 @@
+"""Conditional-request (ETag / Last-Modified) cache for the shared HTTP session.
+
+The UI polls several endpoints on a timer (executions every 30s, logs every
+10s, news, boundaries and scripts).  Most polls return exactly the same body
+as the previous one.  :class:`ConditionalCacheAdapter` remembers the
+validators of cacheable responses, sends ``If-None-Match`` /
+``If-Modified-Since`` on the next request for the same resource and, when the
+API answers ``304 Not Modified``, rebuilds the full response from the stored
+body.  Every request still reaches the API, so responses are never stale –
+only the body transfer is saved.
+
+What may be cached is decided per endpoint class by
+:data:`ENDPOINT_CACHE_POLICIES`.  Entries are keyed by the hash of the
+``Authorization`` header so responses are never shared across tokens, unless
+the policy marks the endpoint as public.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import logging
+import re
+from threading import Lock
+import time
+from urllib.parse import urlsplit
+
+from cachetools import LRUCache
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..config import HTTP_CACHE_MAX_BODY_BYTES, HTTP_CACHE_MAX_ENTRIES
+from .http_client import PooledHTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Headers from a 304 response that refresh the stored ones.
+_REVALIDATION_HEADERS = ("Date", "ETag", "Last-Modified", "Cache-Control", "Expires")
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointCachePolicy:
+    """Conditional-cache policy for a class of API endpoints.
+
+    Attributes:
+        name: Endpoint class name, used in logs and stats.
+        path_pattern: Regex searched against the request URL path.
+        public: Share entries between tokens (only for data that does not
+            depend on the caller).
+        max_age: Seconds a stored body may be used to answer a 304.
+    """
+
+    name: str
+    path_pattern: str
+    public: bool = False
+    max_age: int = 600
+
+    def matches(self, path: str) -> bool:
+        """Return True when *path* belongs to this endpoint class."""
+        return re.search(self.path_pattern, path) is not None
+
+
+# First matching policy wins; GETs to endpoints without a policy are not cached.
+ENDPOINT_CACHE_POLICIES: tuple[EndpointCachePolicy, ...] = (
+    EndpointCachePolicy("logs", r"/(execution|script)/[^/]+/log$", max_age=300),
+    EndpointCachePolicy("executions", r"/execution(/[^/]+)?$", max_age=300),
+    EndpointCachePolicy("scripts", r"/script(/[^/]+)?$"),
+    EndpointCachePolicy("news", r"/news$", public=True, max_age=3600),
+    EndpointCachePolicy("boundaries", r"/data/boundaries(/list)?$", public=True, max_age=86400),
+)
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Body and validators of a stored response."""
+
+    status_code: int
+    reason: str | None
+    headers: CaseInsensitiveDict
+    content: bytes
+    stored_at: float
+    max_age: int
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() - self.stored_at > self.max_age
+
+
+class _CountingLRUCache(LRUCache):
+    """LRU cache that counts evictions."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize=maxsize)
+        self.evictions = 0
+
+    def popitem(self):
+        self.evictions += 1
+        return super().popitem()
+
+
+class ConditionalCacheAdapter(PooledHTTPAdapter):
+    """HTTP adapter that revalidates cacheable GETs with stored validators."""
+
+    def __init__(
+        self,
+        *args,
+        policies: tuple[EndpointCachePolicy, ...] = ENDPOINT_CACHE_POLICIES,
+        max_entries: int = HTTP_CACHE_MAX_ENTRIES,
+        max_body_bytes: int = HTTP_CACHE_MAX_BODY_BYTES,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.policies = policies
+        self.max_body_bytes = max_body_bytes
+        self._store = _CountingLRUCache(maxsize=max(max_entries, 1))
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    def _policy_for(self, request) -> EndpointCachePolicy | None:
+        if request.method != "GET":
+            return None
+        path = urlsplit(request.url).path
+        for policy in self.policies:
+            if policy.matches(path):
+                return policy
+        return None
+
+    @staticmethod
+    def _cache_key(request, policy: EndpointCachePolicy) -> tuple[str, str, str]:
+        if policy.public:
+            scope = "public"
+        else:
+            auth = request.headers.get("Authorization", "")
+            scope = hashlib.sha256(auth.encode("utf-8")).hexdigest()[:16]
+        return request.url, scope, request.headers.get("Accept-Language", "")
+
+    def send(self, request, **kwargs):
+        policy = self._policy_for(request)
+        if policy is None or kwargs.get("stream"):
+            return super().send(request, **kwargs)
+
+        key = self._cache_key(request, policy)
+        with self._lock:
+            entry = self._store.get(key)
+        if entry is not None and entry.expired:
+            entry = None
+
+        if entry is not None and not (
+            "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+        ):
+            if "ETag" in entry.headers:
+                request.headers["If-None-Match"] = entry.headers["ETag"]
+            if "Last-Modified" in entry.headers:
+                request.headers["If-Modified-Since"] = entry.headers["Last-Modified"]
+        else:
+            entry = None
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self._hits += 1
+            return self._serve_stored(response, entry)
+
+        with self._lock:
+            self._misses += 1
+        if response.status_code == 200 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            self._store_response(key, response, policy)
+        return response
+
+    def _serve_stored(self, response, entry: _CachedResponse):
+        """Turn a 304 response into the stored full response."""
+        # Drain the (empty) body so the connection goes back to the pool.
+        _ = response.content
+        headers = CaseInsensitiveDict(entry.headers)
+        for name in _REVALIDATION_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        response.status_code = entry.status_code
+        response.reason = entry.reason
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = entry.content
+        response._content_consumed = True
+        response.from_conditional_cache = True
+        logger.debug("Served %s from conditional cache (304)", response.url)
+        return response
+
+    def _store_response(self, key, response, policy: EndpointCachePolicy) -> None:
+        content = response.content
+        if len(content) > self.max_body_bytes:
+            return
+        entry = _CachedResponse(
+            status_code=response.status_code,
+            reason=response.reason,
+            headers=CaseInsensitiveDict(response.headers),
+            content=content,
+            stored_at=time.monotonic(),
+            max_age=policy.max_age,
+        )
+        with self._lock:
+            self._store[key] = entry
+            self._stores += 1
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._store.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit (304 served), miss, store, eviction and size counters."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stores": self._stores,
+                "evictions": self._store.evictions,
+                "entries": len(self._store),
+            }
+
+
+__all__ = ["ENDPOINT_CACHE_POLICIES", "ConditionalCacheAdapter", "EndpointCachePolicy"]
@@ -1,10 +1,34 @@
 """HTTP helper utilities for Trends.Earth UI."""
 
+from http.cookiejar import DefaultCookiePolicy
 from importlib.util import find_spec
 import os
+import socket
 import sys
+from threading import Lock
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from ..config import (
+    CIRCUIT_BREAKER_ENABLED,
+    HTTP_CACHE_ENABLED,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_BACKOFF_FACTOR,
+    HTTP_RETRY_BACKOFF_JITTER,
+    HTTP_RETRY_STATUS_FORCELIST,
+    HTTP_RETRY_TOTAL,
+    HTTP_TCP_KEEPALIVE,
+    get_current_api_environment,
+)
+from . import server_timing
+from .callback_metrics import record_upstream_time
+from .circuit_breaker import FAILURE_STATUS_CODES, HALF_OPEN, CircuitOpenError, breaker_for_url
+from .metrics import UPSTREAM_IN_FLIGHT, UPSTREAM_REQUEST_SECONDS, endpoint_template, register_cache
 
 
 def _module_available(module_name: str) -> bool:
@@ -58,24 +82,214 @@ if BROTLI_SUPPORTED:
 DEFAULT_ACCEPT_ENCODING = ", ".join(_DEFAULT_ENCODINGS)
 
 # ---------------------------------------------------------------------------
-# Shared requests.Session – reuses TCP connections across HTTP calls,
-# avoiding the overhead of a fresh TLS handshake on every request.
+# Shared requests.Session per API environment – reuses TCP connections across
+# HTTP calls, avoiding the overhead of a fresh TLS handshake on every request.
+# Each environment gets its own session so production and staging traffic do
+# not compete for the same connection pool.
+#
+# Thread-safety contract: a session returned by get_session() is shared by
+# every thread of a gthread worker, so it must be treated as
+# read-only once created.  Sending requests concurrently is safe – urllib3's
+# pool hands each thread its own connection and the adapters lock their own
+# state – but callers must pass tokens and other per-user headers with each
+# request and never mutate session.headers, .auth, .params or the mounts.
+# Cookies are refused outright so one user's Set-Cookie cannot be replayed
+# on another user's request.
 # ---------------------------------------------------------------------------
-_session: requests.Session | None = None
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = Lock()
+
+_KEEPALIVE_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with TCP keep-alive and per-endpoint-family circuit breakers."""
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        if HTTP_TCP_KEEPALIVE:
+            pool_kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def send(self, request, **kwargs):
+        endpoint = endpoint_template(request.url)
+        status = "error"
+        started = time.perf_counter()
+        UPSTREAM_IN_FLIGHT.inc(endpoint=endpoint)
+        try:
+            response = self._send_guarded(request, **kwargs)
+            status = str(response.status_code)
+            return response
+        except CircuitOpenError:
+            status = "circuit_open"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            UPSTREAM_IN_FLIGHT.dec(endpoint=endpoint)
+            record_upstream_time(elapsed)
+            server_timing.record("api", elapsed)
+            UPSTREAM_REQUEST_SECONDS.observe(
+                elapsed,
+                method=request.method,
+                endpoint=endpoint,
+                status=status,
+            )
+
+    def _send_guarded(self, request, **kwargs):
+        """Send through the circuit breaker guarding the request's endpoint family."""
+        breaker = breaker_for_url(request.url) if CIRCUIT_BREAKER_ENABLED else None
+        if breaker is None:
+            return super().send(request, **kwargs)
+        admitted = breaker.admit()
+        if admitted is None:
+            raise CircuitOpenError(breaker.name, request=request)
+
+        try:
+            response = super().send(request, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            breaker.record_failure()
+            raise
+        except Exception:
+            # Free the probe slot, but only if this request holds it: another
+            # request's probe may be in flight.
+            if admitted == HALF_OPEN:
+                breaker.release()
+            raise
 
+        if response.status_code in FAILURE_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
 
-def get_session() -> requests.Session:
-    """Return the module-level shared :class:`requests.Session`.
 
-    The session is created lazily on first call so that import-time side
-    effects are kept to a minimum.  It carries the default
-    ``Accept-Encoding`` header automatically.
+def build_retry() -> Retry:
+    """Build the retry policy for outbound API requests.
+
+    Only idempotent methods are retried, on connection errors and on
+    ``HTTP_RETRY_STATUS_FORCELIST`` responses, with exponential backoff plus
+    random jitter so that workers do not retry in lockstep.  The final
+    response is returned instead of raising once retries are exhausted.
+
+    Read timeouts are not retried: the upstream has already had the whole
+    timeout, and retrying would hold the worker for several of them.
+    ``read=False`` re-raises the original error so callers still see
+    :class:`requests.exceptions.ReadTimeout`.
     """
-    global _session
-    if _session is None:
-        _session = requests.Session()
-        _session.headers.update({"Accept-Encoding": DEFAULT_ACCEPT_ENCODING})
-    return _session
+    return Retry(
+        total=HTTP_RETRY_TOTAL,
+        read=False,
+        backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+        backoff_jitter=HTTP_RETRY_BACKOFF_JITTER,
+        status_forcelist=HTTP_RETRY_STATUS_FORCELIST,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+
+
+def _build_adapter() -> HTTPAdapter:
+    """Create the transport adapter mounted on every session."""
+    adapter_kwargs = {
+        "pool_connections": HTTP_POOL_CONNECTIONS,
+        "pool_maxsize": HTTP_POOL_MAXSIZE,
+        "max_retries": build_retry(),
+    }
+    if HTTP_CACHE_ENABLED:
+        # Imported here to avoid a circular import (http_cache extends PooledHTTPAdapter)
+        from .http_cache import ConditionalCacheAdapter
+
+        return ConditionalCacheAdapter(**adapter_kwargs)
+    return PooledHTTPAdapter(**adapter_kwargs)
+
+
+def create_session() -> requests.Session:
+    """Create a :class:`requests.Session` configured from the HTTP settings in config."""
+    session = requests.Session()
+    session.headers.update({"Accept-Encoding": DEFAULT_ACCEPT_ENCODING})
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = _build_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(api_environment: str | None = None) -> requests.Session:
+    """Return the shared :class:`requests.Session` for an API environment.
+
+    Sessions are created lazily on first use so that import-time side
+    effects are kept to a minimum.  They carry the default
+    ``Accept-Encoding`` header, retry idempotent requests (see
+    :func:`build_retry`) and, unless ``HTTP_CACHE_ENABLED`` is off,
+    revalidate cacheable GETs through the conditional-request cache (see
+    :mod:`.http_cache`).
+
+    The session is shared between threads: pass per-user headers with each
+    request and never modify the session itself.
+
+    Args:
+        api_environment: Environment whose session to return. Defaults to the
+            environment of the current request.
+    """
+    environment = api_environment or get_current_api_environment()
+    session = _sessions.get(environment)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(environment)
+            if session is None:
+                session = _sessions[environment] = create_session()
+                adapter = session.get_adapter("https://")
+                if hasattr(adapter, "stats"):
+                    register_cache(f"http_conditional_{environment}", adapter)
+    return session
+
+
+def _pool_stats(pool) -> dict[str, int | float | None]:
+    """Summarise one urllib3 connection pool."""
+    # The pool queue holds idle connections plus empty slots; the rest are in use.
+    in_use = pool.pool.maxsize - pool.pool.qsize() if pool.pool is not None else 0
+    requests_made = pool.num_requests
+    return {
+        "maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+        "in_use": in_use,
+        "connections_created": pool.num_connections,
+        "requests": requests_made,
+        "reuse_rate": (
+            round(1 - pool.num_connections / requests_made, 3) if requests_made else None
+        ),
+    }
+
+
+def get_pool_stats() -> dict[str, dict[str, dict[str, int | float | None]]]:
+    """Return connection-pool statistics per API environment and host.
+
+    ``in_use`` is the number of connections currently checked out and
+    ``reuse_rate`` the share of requests served by an existing connection.
+    """
+    stats: dict[str, dict[str, dict[str, int | float | None]]] = {}
+    for environment, session in list(_sessions.items()):
+        hosts: dict[str, dict[str, int | float | None]] = {}
+        for adapter in {id(a): a for a in session.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    hosts[f"{key.key_scheme}://{key.key_host}:{key.key_port}"] = _pool_stats(pool)
+        stats[environment] = hosts
+    return stats
+
+
+def get_http_cache_stats() -> dict[str, int] | None:
+    """Return conditional-cache counters summed over all sessions, or None when disabled."""
+    totals: dict[str, int] = {}
+    for session in list(_sessions.values()):
+        stats = getattr(session.get_adapter("https://"), "stats", None)
+        if stats is None:
+            continue
+        for name, value in stats().items():
+            totals[name] = totals.get(name, 0) + value
+    return totals if HTTP_CACHE_ENABLED else None
 
 
 def apply_default_headers(headers: dict | None = None) -> dict:
@@ -0,0 +1,616 @@
+"""Lightweight Prometheus metrics for the UI server.
+
+Implements the small subset of the Prometheus client model the app needs –
+labelled counters, gauges and histograms plus scrape-time collectors – and
+renders it in the text exposition format served by the ``/metrics`` route.
+Recording a sample is a dictionary update under a lock, so the metrics are
+cheap enough to leave on in production.
+
+Cache effectiveness is reported for every cache registered with
+:func:`register_cache`; :class:`InstrumentedTTLCache` is a drop-in
+``TTLCache`` that counts hits, misses, evictions and expirations, and
+:class:`SizeAwareTTLCache` bounds one by the estimated bytes of its values.
+They and :class:`SynchronizedLRUCache` serialise access on a lock, so they can
+be shared by the threads of a ``gthread`` worker.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from itertools import islice
+import math
+import pickle
+import re
+import sys
+from threading import Lock, RLock
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+from cachetools import LRUCache, TTLCache
+
+from . import server_timing
+
+METRIC_PREFIX = "trendsearth_ui"
+
+# Upper bounds in seconds; suited to API calls between a few ms and a minute.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def format_family(name: str, kind: str, help_text: str, samples: Iterable[Sample]) -> list[str]:
+    """Render one metric family in the Prometheus text format.
+
+    Args:
+        name: Metric name, without the sample suffix.
+        kind: ``counter``, ``gauge`` or ``histogram``.
+        help_text: One-line description.
+        samples: ``(suffix, labels, value)`` tuples; *suffix* is appended to
+            *name* (e.g. ``_bucket``).
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for suffix, labels, value in samples:
+        if labels:
+            rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            lines.append(f"{name}{suffix}{{{rendered}}} {_format_value(value)}")
+        else:
+            lines.append(f"{name}{suffix} {_format_value(value)}")
+    return lines
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = f"{METRIC_PREFIX}_{name}"
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    def samples(self) -> list[Sample]:
+        raise NotImplementedError
+
+    def collect(self) -> list[str]:
+        return format_family(self.name, self.kind, self.help_text, self.samples())
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        return [("_total", self._labels(key), value) for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        return [("", self._labels(key), value) for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: Any) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        samples: list[Sample] = []
+        for key, counts, total in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = "+Inf" if math.isinf(bound) else _format_value(bound)
+                samples.append(("_bucket", {**labels, "le": le}, cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors and renders them for scraping."""
+
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Callable[[], list[str]]] = []
+        self._lock = Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], list[str]]) -> None:
+        """Add a callable returning rendered lines, evaluated on every scrape."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in list(self._metrics):
+            lines.extend(metric.collect())
+        for collector in list(self._collectors):
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+    """Create and register a counter."""
+    return REGISTRY.register(Counter(name, help_text, labelnames))
+
+
+def gauge(name: str, help_text: str, labelnames: Iterable[str] = ()) -> Gauge:
+    """Create and register a gauge."""
+    return REGISTRY.register(Gauge(name, help_text, labelnames))
+
+
+def histogram(
+    name: str,
+    help_text: str,
+    labelnames: Iterable[str] = (),
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+) -> Histogram:
+    """Create and register a histogram."""
+    return REGISTRY.register(Histogram(name, help_text, labelnames, buckets))
+
+
+def render_metrics() -> str:
+    """Render every registered metric in the Prometheus text format."""
+    return REGISTRY.render()
+
+
+# ---------------------------------------------------------------------------
+# Upstream API requests
+# ---------------------------------------------------------------------------
+UPSTREAM_REQUEST_SECONDS = histogram(
+    "upstream_request_duration_seconds",
+    "Latency of requests to the Trends.Earth API by endpoint template and status.",
+    ("method", "endpoint", "status"),
+)
+UPSTREAM_IN_FLIGHT = gauge(
+    "upstream_requests_in_flight",
+    "Requests to the Trends.Earth API currently awaiting a response.",
+    ("endpoint",),
+)
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{16,}|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|.+@.+)$"
+)
+
+
+def endpoint_template(url: str) -> str:
+    """Reduce a request URL to a low-cardinality endpoint template.
+
+    The API version prefix is dropped and identifier-like path segments
+    (numbers, UUIDs, long hex strings, e-mail addresses) become ``{id}``, so
+    ``/api/v1/execution/<uuid>/log`` is reported as ``/execution/{id}/log``.
+    """
+    path = urlsplit(url).path
+    if path.startswith("/api/v1"):
+        path = path[len("/api/v1") :]
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return "/".join(segments) or "/"
+
+
+# ---------------------------------------------------------------------------
+# Caches
+# ---------------------------------------------------------------------------
+class _LockedCacheMixin:
+    """Run every operation of a ``cachetools`` cache under one re-entrant lock.
+
+    ``cachetools`` caches are not thread-safe: even a read reorders the LRU
+    links or expires TTL entries, and two threads doing that at once corrupt
+    the internal linked lists.  Iteration returns a snapshot of the keys so
+    callers can delete while they loop.
+
+    :attr:`on_remove`, when set, is called with each key the cache evicts or
+    expires by itself.  It runs under the cache lock, so it must not block or
+    take other locks.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._lock = RLock()
+        self.on_remove: Callable[[Any], None] | None = None
+        super().__init__(*args, **kwargs)
+
+    def _removed(self, key) -> None:
+        if self.on_remove is not None:
+            self.on_remove(key)
+
+    def __getitem__(self, key):
+        with self._lock:
+            return super().__getitem__(key)
+
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        with self._lock:
+            super().__delitem__(key)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return super().__contains__(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return super().__len__()
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(super().__iter__()))
+
+    def get(self, key, default=None):
+        with self._lock:
+            return super().get(key, default)
+
+    def pop(self, key, *default):
+        with self._lock:
+            return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        with self._lock:
+            return super().setdefault(key, default)
+
+    def add(self, key, value) -> bool:
+        """Store *value* unless *key* is present; return whether it was stored."""
+        with self._lock:
+            if super().__contains__(key):
+                return False
+            self[key] = value
+            return True
+
+    def popitem(self):
+        with self._lock:
+            key, value = super().popitem()
+            self._removed(key)
+            return key, value
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+
+
+class SynchronizedLRUCache(_LockedCacheMixin, LRUCache):
+    """``LRUCache`` that is safe to share between threads."""
+
+
+class InstrumentedTTLCache(_LockedCacheMixin, TTLCache):
+    """Thread-safe ``TTLCache`` that counts hits, misses, evictions and expirations."""
+
+    def __init__(self, maxsize, ttl, *args, **kwargs) -> None:
+        super().__init__(maxsize, ttl, *args, **kwargs)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._evicting = False
+
+    def __getitem__(self, key):
+        with self._lock:
+            if self._evicting:
+                return super().__getitem__(key)
+            started = time.perf_counter()
+            try:
+                value = super().__getitem__(key)
+            except KeyError:
+                self.misses += 1
+                raise
+            finally:
+                server_timing.record("cache", time.perf_counter() - started)
+            self.hits += 1
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def popitem(self):
+        # The base popitem reads the value through __getitem__; that is not a hit.
+        with self._lock:
+            self.evictions += 1
+            self._evicting = True
+            try:
+                return super().popitem()
+            finally:
+                self._evicting = False
+
+    def expire(self, time=None):
+        with self._lock:
+            expired = super().expire(time)
+            self.expirations += len(expired)
+            for key, _value in expired:
+                self._removed(key)
+        return expired
+
+
+_SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate bytes held by *value*: its pickled length, or ``sys.getsizeof``.
+
+    Scalars (ids, counts, short strings) are measured with ``sys.getsizeof``;
+    pickling them would cost more than they hold.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return sys.getsizeof(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class SizeAwareTTLCache(InstrumentedTTLCache):
+    """``InstrumentedTTLCache`` bounded by the estimated bytes of its values.
+
+    *maxsize* is a byte ceiling and each value weighs ``estimate_size(value)``;
+    *max_entries* optionally caps the entry count as well.  When the cache is
+    full the victim is the largest of the :attr:`EVICTION_WINDOW` least
+    recently used entries, so a cold multi-megabyte payload goes before the
+    small entries around it.  A value larger than the whole ceiling is not
+    cached.
+    """
+
+    EVICTION_WINDOW = 8
+
+    def __init__(self, maxsize, ttl, *args, max_entries: int | None = None, **kwargs) -> None:
+        super().__init__(maxsize, ttl, *args, **kwargs)
+        self.max_entries = max_entries
+        # key -> weight, least recently used first
+        self._weights: OrderedDict[Any, int] = OrderedDict()
+        self._incoming_size: int | None = None
+
+    def getsizeof(self, value) -> int:
+        # Called by cachetools while storing; the size was measured just before.
+        return self._incoming_size if self._incoming_size is not None else estimate_size(value)
+
+    def weight(self, key) -> int:
+        """Estimated bytes of the value stored under *key* (0 when absent)."""
+        with self._lock:
+            return self._weights.get(key, 0)
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            if key in self._weights:
+                self._weights.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value) -> None:
+        size = estimate_size(value)
+        with self._lock:
+            self._incoming_size = size
+            try:
+                super().__setitem__(key, value)
+            except ValueError:
+                # Larger than the whole cache; drop any older value for the key.
+                self._incoming_size = None
+                with suppress(KeyError):
+                    del self[key]
+                return
+            finally:
+                self._incoming_size = None
+            self._weights[key] = size
+            self._weights.move_to_end(key)
+            while self.max_entries is not None and len(self._weights) > self.max_entries:
+                self.popitem()
+
+    def __delitem__(self, key) -> None:
+        with self._lock:
+            self._weights.pop(key, None)
+            super().__delitem__(key)
+
+    def popitem(self):
+        with self._lock:
+            self.expire()
+            if not self._weights:
+                raise KeyError(f"{type(self).__name__} is empty")
+            oldest = islice(self._weights.items(), self.EVICTION_WINDOW)
+            key = max(oldest, key=lambda item: item[1])[0]
+            self.evictions += 1
+            self._evicting = True
+            try:
+                value = self.pop(key)
+            finally:
+                self._evicting = False
+            self._removed(key)
+            return key, value
+
+    def expire(self, time=None):
+        with self._lock:
+            expired = super().expire(time)
+            for key, _value in expired:
+                self._weights.pop(key, None)
+        return expired
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+            self._weights.clear()
+
+
+_caches: dict[str, Any] = {}
+
+
+_CACHE_COUNTERS = (
+    ("hits", "Cache lookups that found a value."),
+    ("misses", "Cache lookups that found nothing."),
+    ("evictions", "Entries evicted because the cache was full."),
+    ("expirations", "Entries removed because their TTL passed."),
+)
+
+
+def register_cache(name: str, cache: Any) -> Any:
+    """Report hit/miss/eviction counters for *cache* under *name*.
+
+    *cache* is either a mapping with counter attributes (such as
+    :class:`InstrumentedTTLCache`) or an object whose ``stats()`` method
+    returns the counters and an ``entries`` count.  Plain ``cachetools``
+    caches only report their size.
+    """
+    _caches[name] = cache
+    return cache
+
+
+def _cache_stats(cache: Any) -> dict[str, int]:
+    stats = getattr(cache, "stats", None)
+    if callable(stats):
+        return stats()
+    values = {name: getattr(cache, name) for name, _ in _CACHE_COUNTERS if hasattr(cache, name)}
+    values["entries"] = len(cache)
+    return values
+
+
+def _collect_caches() -> list[str]:
+    stats = {name: _cache_stats(cache) for name, cache in list(_caches.items())}
+    lines: list[str] = []
+    for counter_name, help_text in _CACHE_COUNTERS:
+        samples = [
+            ("_total", {"cache": name}, values[counter_name])
+            for name, values in stats.items()
+            if counter_name in values
+        ]
+        lines.extend(
+            format_family(f"{METRIC_PREFIX}_cache_{counter_name}", "counter", help_text, samples)
+        )
+    lines.extend(
+        format_family(
+            f"{METRIC_PREFIX}_cache_entries",
+            "gauge",
+            "Entries currently held in the cache.",
+            [("", {"cache": name}, values.get("entries", 0)) for name, values in stats.items()],
+        )
+    )
+    lines.extend(
+        format_family(
+            f"{METRIC_PREFIX}_cache_bytes",
+            "gauge",
+            "Estimated bytes held in the cache (in-process caches only).",
+            [
+                ("", {"cache": name}, values["bytes"])
+                for name, values in stats.items()
+                if "bytes" in values
+            ],
+        )
+    )
+    return lines
+
+
+REGISTRY.add_collector(_collect_caches)
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "REGISTRY",
+    "UPSTREAM_IN_FLIGHT",
+    "UPSTREAM_REQUEST_SECONDS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "InstrumentedTTLCache",
+    "MetricsRegistry",
+    "SizeAwareTTLCache",
+    "counter",
+    "endpoint_template",
+    "estimate_size",
+    "format_family",
+    "gauge",
+    "histogram",
+    "register_cache",
+    "render_metrics",
+]
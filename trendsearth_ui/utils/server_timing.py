@@ -0,0 +1,137 @@
+"""Per-request ``Server-Timing`` breakdown for Dash callback responses.
+
+Each Flask request gets a :class:`RequestTimings` accumulator on ``flask.g``.
+Code on the callback path reports into it with :func:`timed` /
+:func:`timed_phase` (or :func:`record` for already-measured durations):
+
+* ``api`` – upstream Trends.Earth API calls (reported by the HTTP adapter)
+* ``cache`` – in-process cache lookups
+* ``format`` – row formatting such as ``process_execution_data``
+* ``figure`` – Plotly figure and chart component building
+* ``serialize`` – time between the callback returning and the response
+  leaving Flask, i.e. Dash's output validation and JSON serialisation
+
+``add_security_headers`` turns the totals into a ``Server-Timing`` header so
+the split shows up in the browser devtools network panel.  Fan-out threads
+copy the request context, so their time is included; parallel calls are
+summed, so phases can add up to more than ``total``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import functools
+from threading import Lock
+import time
+from typing import Any
+
+import flask
+
+PHASES = {
+    "api": "Upstream API",
+    "cache": "Cache lookups",
+    "format": "Data formatting",
+    "figure": "Figure building",
+    "serialize": "JSON serialization",
+}
+
+_G_ATTR = "server_timings"
+
+
+class RequestTimings:
+    """Accumulated seconds and call counts per phase for one request."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.callback_finished: float | None = None
+        self._seconds: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+        self._lock = Lock()
+
+    def add(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self._seconds[phase] = self._seconds.get(phase, 0.0) + seconds
+            self._counts[phase] = self._counts.get(phase, 0) + 1
+
+    def header_value(self) -> str:
+        """Render the ``Server-Timing`` header value, ending with ``total``."""
+        now = time.perf_counter()
+        if self.callback_finished is not None:
+            self.add("serialize", now - self.callback_finished)
+
+        with self._lock:
+            seconds = dict(self._seconds)
+            counts = dict(self._counts)
+
+        entries = []
+        for phase, description in PHASES.items():
+            if phase not in seconds:
+                continue
+            if counts[phase] > 1:
+                description = f"{description} ({counts[phase]} calls)"
+            entries.append(f'{phase};dur={seconds[phase] * 1000:.1f};desc="{description}"')
+        entries.append(f"total;dur={(now - self.started) * 1000:.1f}")
+        return ", ".join(entries)
+
+
+def start_request() -> None:
+    """Attach a fresh accumulator to the current request."""
+    setattr(flask.g, _G_ATTR, RequestTimings())
+
+
+def current_timings() -> RequestTimings | None:
+    """Return the current request's accumulator, or ``None`` outside a request."""
+    if not flask.has_app_context():
+        return None
+    return flask.g.get(_G_ATTR)
+
+
+def record(phase: str, seconds: float) -> None:
+    """Add *seconds* to *phase* for the current request, if any."""
+    timings = current_timings()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+def mark_callback_finished() -> None:
+    """Note that the callback body returned; the remainder counts as serialisation."""
+    timings = current_timings()
+    if timings is not None:
+        timings.callback_finished = time.perf_counter()
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Time the enclosed block under *phase*."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - started)
+
+
+def timed_phase(phase: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator form of :func:`timed`."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(phase):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "PHASES",
+    "RequestTimings",
+    "current_timings",
+    "mark_callback_finished",
+    "record",
+    "start_request",
+    "timed",
+    "timed_phase",
+]
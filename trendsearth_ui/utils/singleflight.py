@@ -0,0 +1,102 @@
+"""Single-flight coalescing of identical concurrent calls.
+
+When several callbacks ask for exactly the same upstream resource at the same
+time (multiple tabs refreshing the status page, several admins paging the
+executions grid), only the first caller – the *leader* – performs the call.
+Callers that arrive while it is in flight wait for it and receive the same
+result (or exception) instead of issuing a duplicate request.
+
+Nothing is cached: once the leader finishes, the next caller with the same key
+starts a fresh call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from threading import Event, Lock
+from typing import Any
+
+
+class _InFlightCall:
+    """State shared between the leader of a call and its waiters."""
+
+    __slots__ = ("done", "error", "value")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    Keeps counters of issued (executed) and coalesced (shared) calls so the
+    effectiveness of coalescing can be monitored.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[Hashable, _InFlightCall] = {}
+        self._issued = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> tuple[Any, bool]:
+        """Run *func* unless a call with the same *key* is already in flight.
+
+        Args:
+            key: Identity of the call; callers with equal keys are coalesced.
+            func: Zero-argument callable performing the work.
+
+        Returns:
+            Tuple of ``(value, shared)`` where ``shared`` is True when the
+            value came from another caller's in-flight call.
+
+        Raises:
+            Whatever *func* raised, for the leader and every waiter.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._issued += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.value, False
+
+    def stats(self) -> dict[str, int]:
+        """Return the issued, coalesced and currently in-flight call counts."""
+        with self._lock:
+            return {
+                "issued": self._issued,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the issued and coalesced counters."""
+        with self._lock:
+            self._issued = 0
+            self._coalesced = 0
+
+
+__all__ = ["SingleFlight"]
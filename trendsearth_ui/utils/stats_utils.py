@@ -88,7 +88,7 @@ def fetch_dashboard_stats(
         params["include"] = ",".join(include_sections)
 
     try:
-        resp = get_session().get(
+        resp = get_session(api_environment).get(
             f"{get_api_base(api_environment)}/stats/dashboard",
             headers=headers,
             params=params,
@@ -150,7 +150,7 @@ def fetch_scripts_count(token, api_environment="production"):
     params = {"page": 1, "per_page": 1}  # Minimal data transfer
 
     try:
-        resp = get_session().get(
+        resp = get_session(api_environment).get(
             f"{get_api_base(api_environment)}/script",
             headers=headers,
             params=params,
@@ -206,7 +206,7 @@ def fetch_user_stats(
         params["country"] = country
 
     try:
-        resp = get_session().get(
+        resp = get_session(api_environment).get(
             f"{get_api_base(api_environment)}/stats/users",
             headers=headers,
             params=params,
@@ -287,7 +287,7 @@ def fetch_execution_stats(
         params["status"] = status
 
     try:
-        resp = get_session().get(
+        resp = get_session(api_environment).get(
             f"{get_api_base(api_environment)}/stats/executions",
             headers=headers,
             params=params,
@@ -354,7 +354,7 @@ def fetch_client_stats(token, api_environment="production", days=30, client_type
         params["client_type"] = client_type
 
     try:
-        resp = get_session().get(
+        resp = get_session(api_environment).get(
             f"{get_api_base(api_environment)}/admin/client-stats",
             headers=headers,
             params=params,
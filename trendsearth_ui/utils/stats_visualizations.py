@@ -2381,7 +2381,9 @@ def create_deployment_information(api_environment="production"):
             api_base_root = get_api_base(api_environment).replace("/api/v1", "")
             api_url = f"{api_base_root}/api-health"
             logger.info(f"Fetching API deployment info from: {api_url}")
-            resp = get_session().get(api_url, headers=apply_default_headers(), timeout=5)
+            resp = get_session(api_environment).get(
+                api_url, headers=apply_default_headers(), timeout=5
+            )
             logger.info(f"API health response status: {resp.status_code}")
             if resp.status_code == 200:
                 data = resp.json()
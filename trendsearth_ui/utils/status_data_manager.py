@@ -1,15 +1,29 @@
 """Centralized status data management for optimized API calls and caching."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import copy
 from datetime import UTC, datetime
 import logging
 import math
+from threading import Lock
+import time
 from typing import Any
 
-from cachetools import TTLCache
 from requests.exceptions import RequestException
 
-from ..config import get_api_base
+from ..config import (
+    STATS_FETCH_DEADLINE,
+    STATUS_CACHE_MAX_MB,
+    STATUS_CACHE_STALE_SECONDS,
+    STATUS_FANOUT_TIMEOUT,
+    STATUS_REVALIDATE_MAX_WORKERS,
+    get_api_base,
+)
 from .boundaries_utils import clear_country_iso_cache, get_country_iso_resolver
+from .cache_manager import CacheKey, cache_manager
+from .circuit_breaker import is_circuit_open
+from .fanout import STATS_POOL, FanOutResult, run_fan_out
 from .helpers import is_superadmin
 from .http_client import apply_default_headers, get_session
 from .stats_utils import (
@@ -29,11 +43,68 @@ from .timezone_utils import get_safe_timezone
 
 logger = logging.getLogger(__name__)
 
-# Centralized cache for all status-related data
-_status_data_cache = TTLCache(
-    maxsize=50, ttl=270
-)  # 4.5-minute TTL to align with slower refresh cadence
-_stats_data_cache = TTLCache(maxsize=50, ttl=300)  # 5-minute TTL for stats data
+STATUS_CACHE_TTL = 270  # 4.5-minute TTL to align with slower refresh cadence
+STATS_CACHE_TTL = 300  # 5-minute TTL for stats data
+
+# Centralized cache for all status-related data.  Entries are (stored_at, data)
+# pairs.  They are fresh for the TTL above and are then kept for another
+# STATUS_CACHE_STALE_SECONDS, during which they are served stale while one
+# background refetch replaces them (stale-while-revalidate).  Each cache is
+# bounded by estimated size (STATUS_CACHE_MAX_MB) as well as entry count, since
+# a single comprehensive stats payload can be megabytes.
+_status_data_cache = cache_manager.namespace(
+    "status_data",
+    maxsize=50,
+    ttl=STATUS_CACHE_TTL + STATUS_CACHE_STALE_SECONDS,
+    max_bytes=STATUS_CACHE_MAX_MB * 1024 * 1024,
+)
+_stats_data_cache = cache_manager.namespace(
+    "stats_data",
+    maxsize=50,
+    ttl=STATS_CACHE_TTL + STATUS_CACHE_STALE_SECONDS,
+    max_bytes=STATUS_CACHE_MAX_MB * 1024 * 1024,
+)
+
+# Last good value per cache key, kept past the TTL so it can be served (marked
+# stale) while the circuit for its API endpoint family is open.
+_last_good_data = cache_manager.namespace("status_last_good", maxsize=100)
+
+
+# Cache keys with a background revalidation in flight, so that each stale
+# entry triggers a single refetch however many callers read it.
+_revalidating: set[str] = set()
+_revalidating_lock = Lock()
+_revalidation_executor: ThreadPoolExecutor | None = None
+
+# Sections of a comprehensive result that carry their own ``fetched_at``.
+_COMPREHENSIVE_SECTIONS = ("status_data", "stats_data", "time_series_data")
+
+
+def _revalidate_in_background(cache_key: str, refetch: Callable[[], Any]) -> bool:
+    """Run *refetch* on the revalidation pool unless one is already running for *cache_key*."""
+    global _revalidation_executor
+    with _revalidating_lock:
+        if cache_key in _revalidating:
+            return False
+        _revalidating.add(cache_key)
+        if _revalidation_executor is None:
+            _revalidation_executor = ThreadPoolExecutor(
+                max_workers=max(STATUS_REVALIDATE_MAX_WORKERS, 1),
+                thread_name_prefix="te-revalidate",
+            )
+        executor = _revalidation_executor
+
+    def run() -> None:
+        try:
+            refetch()
+        except Exception:
+            logger.exception("Background revalidation of %s failed", cache_key)
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(cache_key)
+
+    executor.submit(run)
+    return True
 
 
 def _extract_summary_from_stats(stats_payload: Any) -> dict[str, Any]:
@@ -53,29 +124,213 @@ def _extract_summary_from_stats(stats_payload: Any) -> dict[str, Any]:
     return summary if isinstance(summary, dict) else {}
 
 
+def _fetch_latest_status(token: str, api_environment: str):
+    """Request the newest ``/status`` record (raises on network errors)."""
+    headers = apply_default_headers({"Authorization": f"Bearer {token}"})
+    return get_session(api_environment).get(
+        f"{get_api_base(api_environment)}/status",
+        headers=headers,
+        params={
+            "per_page": 1,
+            "sort": "-timestamp",  # Descending order (newest first)
+        },
+        timeout=5,
+    )
+
+
+# Stats fan-outs that missed their deadline, keyed by stats cache key.  The
+# unfinished calls keep running and are merged into the cached result the
+# next time that entry is requested.  Entries live no longer than the stats
+# entry they fill, and stay in this worker: futures cannot be shared.  The lock
+# stops two threads collecting the same fan-out at once.
+_pending_stats_fetches = cache_manager.namespace(
+    "stats_pending_fanouts",
+    maxsize=50,
+    ttl=STATS_CACHE_TTL + STATUS_CACHE_STALE_SECONDS,
+    shared=False,
+)
+_pending_stats_lock = Lock()
+
+
+def _apply_stats_sections(result: dict[str, Any], fanout: FanOutResult) -> None:
+    """Merge finished stats fan-out calls into *result* and derive the all-time totals."""
+
+    for name, value in fanout.results.items():
+        if name == "country_iso_resolver":
+            if value is not None:
+                result["country_iso_resolver"] = value
+            else:
+                logger.warning("Country ISO resolver unavailable")
+        else:
+            result[name] = value
+
+    if result.get("api_period") == "all":
+        result["dashboard_stats_all_time"] = result["dashboard_stats"]
+
+    summary_all_time = _extract_summary_from_stats(result["dashboard_stats_all_time"])
+    result["total_executions_all_time"] = summary_all_time.get("total_executions")
+    result["total_users_all_time"] = summary_all_time.get("total_users")
+    # Prefer scripts count from summary if available; fall back to the scripts API
+    result["total_scripts_all_time"] = summary_all_time.get("total_scripts")
+    if result["total_scripts_all_time"] is None and fanout.ok("scripts_count"):
+        result["total_scripts_all_time"] = result["scripts_count"]
+
+    result["pending_sections"] = sorted(fanout.pending)
+    result["meta"] = fanout.to_meta()
+
+
+def _fill_pending_stats_sections(cache_key: str, cached: dict[str, Any]) -> dict[str, Any] | None:
+    """Merge stats sections that finished after the deadline into a cached result.
+
+    Returns:
+        The updated cached result, or ``None`` when the pending calls can no
+        longer be recovered and the entry should be refetched.
+    """
+
+    with _pending_stats_lock:
+        fanout = _pending_stats_fetches.get(cache_key)
+        if fanout is None:
+            return None
+
+        collected = fanout.collect()
+        if collected:
+            # Fill a copy: the cached dict may be serialised by another thread.
+            cached = dict(cached)
+            _apply_stats_sections(cached, fanout)
+            # Write back so other threads and workers see the filled sections,
+            # keeping the original age so the entry still goes stale on time.
+            entry = _stats_data_cache.get(cache_key)
+            stored_at = entry[0] if entry is not None else time.time()
+            _stats_data_cache[cache_key] = (stored_at, cached)
+            logger.info("Filled in pending stats sections: %s", ", ".join(collected))
+        if not fanout.pending:
+            _pending_stats_fetches.pop(cache_key, None)
+        return cached
+
+
+def _drop_pending_stats_sections(cache_key: str) -> None:
+    """Forget the pending fan-out for *cache_key*, cancelling calls not yet started."""
+    with _pending_stats_lock:
+        fanout = _pending_stats_fetches.pop(cache_key, None)
+    if fanout is not None:
+        for future in fanout.pending.values():
+            future.cancel()
+
+
 class StatusDataManager:
     """Centralized manager for status page data to minimize API calls and optimize caching."""
 
     @staticmethod
-    def get_cache_key(data_type: str, **kwargs) -> str:
-        """Generate cache key for different types of status data."""
-        key_parts = [data_type]
-        for k, v in sorted(kwargs.items()):
-            if v is not None:
-                key_parts.append(f"{k}={v}")
-        return "_".join(key_parts)
+    def get_cache_key(data_type: str, **kwargs) -> CacheKey:
+        """Generate cache key for different types of status data.
+
+        The key's ``kind`` is *data_type* and each keyword becomes a tag, so
+        ``invalidate_cache("status_data:kind=time_series_status")`` drops
+        every cached time series.
+        """
+        return CacheKey(data_type, **kwargs)
 
     @staticmethod
     def get_cached_data(cache_key: str, cache_type: str = "status") -> Any | None:
-        """Get data from appropriate cache."""
+        """Get fresh data (younger than the cache's TTL) from the appropriate cache."""
         cache = _status_data_cache if cache_type == "status" else _stats_data_cache
-        return cache.get(cache_key)
+        ttl = STATUS_CACHE_TTL if cache_type == "status" else STATS_CACHE_TTL
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        return data if time.time() - stored_at <= ttl else None
 
     @staticmethod
     def set_cached_data(cache_key: str, data: Any, cache_type: str = "status") -> None:
-        """Set data in appropriate cache."""
+        """Set data in appropriate cache.
+
+        Results carrying an ``error`` are cached so a failing API is not
+        hammered, but they do not replace the last good value served while the
+        circuit is open.
+        """
         cache = _status_data_cache if cache_type == "status" else _stats_data_cache
-        cache[cache_key] = data
+        stored_at = time.time()
+        cache[cache_key] = (stored_at, data)
+        if not (isinstance(data, dict) and data.get("error")):
+            _last_good_data[cache_key] = (stored_at, data)
+
+    @staticmethod
+    def get_stale_while_revalidate(
+        cache_key: str, refetch: Callable[[], Any], cache_type: str = "status"
+    ) -> Any | None:
+        """Serve an entry past its TTL and start a background refetch of it.
+
+        Entries stay cached for ``STATUS_CACHE_STALE_SECONDS`` after their TTL.
+        Within that window the cached dict is returned immediately, copied
+        and marked ``stale=True`` with ``stale_age_seconds``, and *refetch*
+        runs in the background (once per key however many callers arrive).
+
+        Returns:
+            The stale data, or ``None`` when nothing is cached for the key.
+        """
+        cache = _status_data_cache if cache_type == "status" else _stats_data_cache
+        ttl = STATUS_CACHE_TTL if cache_type == "status" else STATS_CACHE_TTL
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        age = time.time() - stored_at
+        if age <= ttl:
+            return data
+        if _revalidate_in_background(cache_key, refetch):
+            logger.info("Serving %s stale (%ds old) while revalidating", cache_key, age)
+        if isinstance(data, dict):
+            data = {**data, "stale": True, "stale_age_seconds": int(age)}
+        return data
+
+    @staticmethod
+    def with_freshness(result: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of a comprehensive result with ``meta.age_seconds`` and ``meta.is_stale``.
+
+        The age is that of the oldest section, so a page assembled from a
+        four-minute-old stats entry reports four minutes.
+        """
+        fetched = [
+            section["fetched_at"]
+            for name in _COMPREHENSIVE_SECTIONS
+            if isinstance(section := result.get(name), dict) and section.get("fetched_at")
+        ]
+        age = max(time.time() - min(fetched), 0.0) if fetched else 0.0
+        meta = result.get("meta") or {}
+        meta = {**meta, "age_seconds": int(age), "is_stale": bool(meta.get("stale_sections"))}
+        return {**result, "meta": meta}
+
+    @staticmethod
+    def get_stale_data(cache_key: str) -> Any | None:
+        """Return a copy of the last good value for a cache key, marked stale.
+
+        Dict values get ``stale=True`` and ``stale_age_seconds``.  Returns None
+        if nothing was ever cached under the key.
+        """
+        entry = _last_good_data.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        stale = copy.deepcopy(data)
+        if isinstance(stale, dict):
+            stale["stale"] = True
+            stale["stale_age_seconds"] = int(time.time() - stored_at)
+        return stale
+
+    @staticmethod
+    def get_stale_data_if_circuit_open(
+        cache_key: str, family: str, api_environment: str
+    ) -> Any | None:
+        """Return the stale copy for a cache key while *family*'s circuit is open."""
+        if not is_circuit_open(family, api_environment):
+            return None
+        stale = StatusDataManager.get_stale_data(cache_key)
+        if stale is not None:
+            logger.warning(
+                "API circuit for %s is open; serving stale data for %s", family, cache_key
+            )
+        return stale
 
     @staticmethod
     def fetch_consolidated_status_data(
@@ -87,6 +342,12 @@ class StatusDataManager:
         """
         Fetch all status-related data in one consolidated call.
 
+        The deployment, cluster, availability and latest-status requests run
+        concurrently; ``meta`` records per-call timings and any failed calls.
+        If the availability probe or the status call misses
+        ``STATUS_FANOUT_TIMEOUT``, the last good value is returned (marked
+        stale) when there is one, and the partial result is never cached.
+
         Returns:
             dict: Contains summary, deployment, cluster, and basic stats data
         """
@@ -102,6 +363,20 @@ class StatusDataManager:
             if cached_data is not None:
                 logger.info("Returning cached consolidated status data")
                 return cached_data
+            stale_data = StatusDataManager.get_stale_while_revalidate(
+                cache_key,
+                lambda: StatusDataManager.fetch_consolidated_status_data(
+                    token, api_environment, force_refresh=True, user_timezone=safe_timezone
+                ),
+            )
+            if stale_data is not None:
+                return stale_data
+
+        stale_data = StatusDataManager.get_stale_data_if_circuit_open(
+            cache_key, "status", api_environment
+        )
+        if stale_data is not None:
+            return stale_data
 
         logger.info("Fetching fresh consolidated status data")
 
@@ -113,41 +388,60 @@ class StatusDataManager:
             "status_endpoint_available": False,
             "latest_status": None,
             "error": None,
+            "fetched_at": time.time(),
+            "meta": {},
         }
 
-        try:
-            # Fetch deployment and cluster info (these are fast and can be done in parallel)
-            result["deployment"] = fetch_deployment_info(api_environment, token)
-            cluster_info, cluster_cached_time = fetch_cluster_info(
-                api_environment, token, safe_timezone
-            )
+        # The four upstream calls are independent, so run them concurrently and
+        # only wait for the slowest one.  A failure in one call degrades only
+        # its own section of the result.
+        fanout = run_fan_out(
+            {
+                "deployment": lambda: fetch_deployment_info(api_environment, token),
+                "cluster": lambda: fetch_cluster_info(api_environment, token, safe_timezone),
+                "status_endpoint": lambda: is_status_endpoint_available(token, api_environment),
+                "latest_status": lambda: _fetch_latest_status(token, api_environment),
+            },
+            timeout=STATUS_FANOUT_TIMEOUT,
+        )
+        result["meta"] = fanout.to_meta()
+
+        # A probe or status call still running at the deadline says nothing
+        # about the API, so prefer the last good value and never cache this run.
+        timed_out = bool({"status_endpoint", "latest_status"} & set(fanout.pending))
+        if timed_out:
+            stale_data = StatusDataManager.get_stale_data(cache_key)
+            if stale_data is not None:
+                logger.warning(
+                    "Status calls still pending after %ss; serving last good data",
+                    STATUS_FANOUT_TIMEOUT,
+                )
+                return stale_data
+
+        result["deployment"] = fanout.results.get("deployment")
+        if fanout.ok("cluster"):
+            cluster_info, cluster_cached_time = fanout.results["cluster"]
             result["cluster"] = {
                 "info": cluster_info,
                 "cached_time": cluster_cached_time,
             }
 
-            # Check if status endpoint is available
-            result["status_endpoint_available"] = is_status_endpoint_available(
-                token, api_environment
-            )
+        # Check if status endpoint is available; a status call that succeeded
+        # shows it is when the probe itself has not answered yet.
+        if "status_endpoint" in fanout.pending:
+            result["status_endpoint_available"] = fanout.ok("latest_status")
+        else:
+            result["status_endpoint_available"] = fanout.results.get("status_endpoint", False)
 
-            if not result["status_endpoint_available"]:
-                result["summary"] = get_fallback_summary()
-                StatusDataManager.set_cached_data(cache_key, result)
-                return result
-
-            # Fetch latest status data with optimized parameters
-            headers = apply_default_headers({"Authorization": f"Bearer {token}"})
-            resp = get_session().get(
-                f"{get_api_base(api_environment)}/status",
-                headers=headers,
-                params={
-                    "per_page": 1,
-                    "sort": "-timestamp",  # Descending order (newest first)
-                },
-                timeout=5,
-            )
+        if not result["status_endpoint_available"] and not timed_out:
+            result["summary"] = get_fallback_summary()
+            StatusDataManager.set_cached_data(cache_key, result)
+            return result
 
+        if not result["status_endpoint_available"]:
+            result["summary"] = get_fallback_summary()
+        elif fanout.ok("latest_status"):
+            resp = fanout.results["latest_status"]
             if resp.status_code == 200:
                 status_data = resp.json().get("data", [])
                 if status_data:
@@ -159,14 +453,15 @@ class StatusDataManager:
             else:
                 result["error"] = f"Status API error: {resp.status_code}"
                 result["summary"] = "API_ERROR"
-
-        except RequestException as e:
-            logger.error(f"Error fetching consolidated status data: {e}")
-            result["error"] = str(e)
+        else:
+            error = fanout.errors.get("latest_status", "Timed out waiting for status data")
+            logger.error(f"Error fetching consolidated status data: {error}")
+            result["error"] = error
             result["summary"] = "REQUEST_ERROR"
 
         # Cache the result
-        StatusDataManager.set_cached_data(cache_key, result)
+        if not timed_out:
+            StatusDataManager.set_cached_data(cache_key, result)
         return result
 
     @staticmethod
@@ -180,6 +475,11 @@ class StatusDataManager:
         """
         Fetch all stats-related data for SUPERADMIN users.
 
+        The stats sections are fetched concurrently under ``STATS_FETCH_DEADLINE``
+        on the stats fan-out pool.
+        Sections that miss the deadline are listed in ``pending_sections`` and
+        merged into the cached entry once they finish.
+
         Returns:
             dict: Contains dashboard stats, user stats, execution stats, and scripts count
         """
@@ -200,9 +500,23 @@ class StatusDataManager:
             "consolidated_stats", api_environment=api_environment, period=api_period
         )
 
+        def revalidate():
+            # The refetch replaces the stale entry, so the sections it was
+            # still waiting on are no longer worth collecting.
+            _drop_pending_stats_sections(cache_key)
+            return StatusDataManager.fetch_consolidated_stats_data(
+                token, api_environment, time_period, role, force_refresh=True
+            )
+
         # Check cache first unless forced refresh
         if not force_refresh:
             cached_data = StatusDataManager.get_cached_data(cache_key, cache_type="stats")
+            if cached_data is None:
+                cached_data = StatusDataManager.get_stale_while_revalidate(
+                    cache_key, revalidate, cache_type="stats"
+                )
+            elif cached_data.get("pending_sections"):
+                cached_data = _fill_pending_stats_sections(cache_key, cached_data)
             if cached_data is not None:
                 cached_execution_stats = cached_data.get("execution_stats")
                 if isinstance(cached_execution_stats, dict) and cached_execution_stats.get("error"):
@@ -214,6 +528,12 @@ class StatusDataManager:
                     logger.info(f"Returning cached consolidated stats data for period {api_period}")
                     return cached_data
 
+        stale_data = StatusDataManager.get_stale_data_if_circuit_open(
+            cache_key, "stats", api_environment
+        )
+        if stale_data is not None:
+            return stale_data
+
         logger.info(f"Fetching fresh consolidated stats data for period {api_period}")
 
         # Initialize result structure
@@ -228,65 +548,62 @@ class StatusDataManager:
             "total_executions_all_time": None,
             "total_users_all_time": None,
             "total_scripts_all_time": None,
+            "pending_sections": [],
+            "fetched_at": time.time(),
+            "meta": {},
         }
 
-        try:
-            # Get optimal grouping for time series data
-            user_group_by, execution_group_by = get_optimal_grouping_for_period(api_period)
+        # Get optimal grouping for time series data
+        user_group_by, execution_group_by = get_optimal_grouping_for_period(api_period)
 
-            # Fetch all stats data with comprehensive sections
-            # (Note: These calls have their own caching, so we benefit from both levels)
-            period_stats = fetch_dashboard_stats(
+        # All stats sections are independent, so fetch them concurrently under a
+        # single deadline instead of letting each 10-15s timeout add up.
+        # (Note: These calls have their own caching, so we benefit from both levels)
+        calls = {
+            "dashboard_stats": lambda: fetch_dashboard_stats(
                 token,
                 api_environment,
                 api_period,
                 include_sections=None,  # Fetch all available sections for comprehensive stats
-            )
-            result["dashboard_stats"] = period_stats
-
-            if api_period == "all":
-                result["dashboard_stats_all_time"] = period_stats
-            else:
-                result["dashboard_stats_all_time"] = fetch_dashboard_stats(
-                    token,
-                    api_environment,
-                    "all",
-                    include_sections=["summary"],
-                )
-
-            summary_all_time = _extract_summary_from_stats(result["dashboard_stats_all_time"])
-
-            result["total_executions_all_time"] = summary_all_time.get("total_executions")
-            result["total_users_all_time"] = summary_all_time.get("total_users")
-            # Prefer scripts count from summary if available; will fall back to scripts API below
-            result["total_scripts_all_time"] = summary_all_time.get("total_scripts")
-
-            result["user_stats"] = fetch_user_stats(
+            ),
+            "user_stats": lambda: fetch_user_stats(
                 token, api_environment, api_period, group_by=user_group_by
-            )
-
-            result["execution_stats"] = fetch_execution_stats(
+            ),
+            "execution_stats": lambda: fetch_execution_stats(
                 token, api_environment, api_period, group_by=execution_group_by
+            ),
+            "scripts_count": lambda: fetch_scripts_count(token, api_environment),
+            "country_iso_resolver": lambda: get_country_iso_resolver(token, api_environment),
+        }
+        if api_period != "all":
+            calls["dashboard_stats_all_time"] = lambda: fetch_dashboard_stats(
+                token,
+                api_environment,
+                "all",
+                include_sections=["summary"],
             )
 
-            result["scripts_count"] = fetch_scripts_count(token, api_environment)
-            if result["total_scripts_all_time"] is None:
-                result["total_scripts_all_time"] = result["scripts_count"]
+        fanout = run_fan_out(calls, timeout=STATS_FETCH_DEADLINE, pool=STATS_POOL)
+        _apply_stats_sections(result, fanout)
 
-            resolver = get_country_iso_resolver(token, api_environment)
-            if resolver is not None:
-                result["country_iso_resolver"] = resolver
-            else:
+        if fanout.ok("dashboard_stats") or "dashboard_stats" in fanout.pending:
+            if result["pending_sections"]:
+                with _pending_stats_lock:
+                    _pending_stats_fetches[cache_key] = fanout
                 logger.warning(
-                    "Country ISO resolver unavailable for environment '%s'",
-                    api_environment,
+                    "Stats deadline of %ss reached for period %s; pending sections: %s",
+                    STATS_FETCH_DEADLINE,
+                    api_period,
+                    ", ".join(result["pending_sections"]),
                 )
-
-            logger.info(f"Successfully fetched consolidated stats data for period {api_period}")
-
-        except Exception as e:
-            logger.error(f"Error fetching consolidated stats data: {e}")
-            result["error"] = str(e)
+            else:
+                with _pending_stats_lock:
+                    _pending_stats_fetches.pop(cache_key, None)
+                logger.info(f"Successfully fetched consolidated stats data for period {api_period}")
+        else:
+            error = fanout.errors.get("dashboard_stats")
+            logger.error(f"Error fetching consolidated stats data: {error}")
+            result["error"] = error
 
         # Cache the result unless execution stats returned an error
         execution_stats = result.get("execution_stats")
@@ -322,6 +639,20 @@ class StatusDataManager:
             if cached_data is not None:
                 logger.info(f"Returning cached time series data for period {time_period}")
                 return cached_data
+            stale_data = StatusDataManager.get_stale_while_revalidate(
+                cache_key,
+                lambda: StatusDataManager.fetch_time_series_status_data(
+                    token, api_environment, time_period, force_refresh=True
+                ),
+            )
+            if stale_data is not None:
+                return stale_data
+
+        stale_data = StatusDataManager.get_stale_data_if_circuit_open(
+            cache_key, "status", api_environment
+        )
+        if stale_data is not None:
+            return stale_data
 
         logger.info(f"Fetching fresh time series data for period {time_period}")
 
@@ -383,6 +714,7 @@ class StatusDataManager:
             "request_limit": request_limit,
             "optimization_applied": False,
             "error": None,
+            "fetched_at": time.time(),
         }
 
         try:
@@ -404,7 +736,7 @@ class StatusDataManager:
                 if request_limit is not None:
                     params["per_page"] = request_limit
 
-            resp = get_session().get(
+            resp = get_session(api_environment).get(
                 f"{get_api_base(api_environment)}/status",
                 headers=headers,
                 params=params,
@@ -528,32 +860,26 @@ class StatusDataManager:
         return StatusDataManager._systematic_sample(data, target_points)
 
     @staticmethod
-    def invalidate_cache(pattern: str | None = None) -> int:
+    def invalidate_cache(tag: str | None = None) -> int:
         """
         Invalidate cached data.
 
         Args:
-            pattern: Optional pattern to match cache keys for selective invalidation
+            tag: Cache manager tag selecting what to drop, e.g. ``"status_data"``
+                (a whole namespace) or ``"status_data:kind=comprehensive_status"``;
+                see :meth:`CacheManager.invalidate`.  ``None`` clears the status,
+                stats and last-good data and the boundaries resolver.
 
         Returns:
             int: Number of cache entries cleared
         """
-        cleared_count = 0
-
-        for cache in [_status_data_cache, _stats_data_cache]:
-            if pattern is None:
-                cleared_count += len(cache)
-                cache.clear()
-            else:
-                keys_to_remove = [k for k in cache if pattern in k]
-                for key in keys_to_remove:
-                    del cache[key]
-                cleared_count += len(keys_to_remove)
-
-        # Only clear the expensive boundaries resolver when explicitly requested or when
-        # invalidating everything; manual status refreshes should continue reusing the
-        # cached hierarchy until the TTL expires.
-        if pattern is None or pattern == "boundaries":
+        if tag is not None:
+            cleared_count = cache_manager.invalidate(tag)
+        else:
+            _last_good_data.clear()
+            cleared_count = _status_data_cache.invalidate() + _stats_data_cache.invalidate()
+            # Only clear the expensive boundaries resolver when invalidating everything;
+            # manual status refreshes keep reusing the cached hierarchy until the TTL expires.
             cleared_count += clear_country_iso_cache()
 
         logger.info(f"Invalidated {cleared_count} cache entries")
@@ -605,9 +931,9 @@ class StatusDataManager:
             cached_data = StatusDataManager.get_cached_data(cache_key, cache_type="status")
             if cached_data is not None:
                 logger.info("Returning cached comprehensive status page data")
-                # Add cache hit metadata
-                cached_data.setdefault("meta", {})["cache_hit"] = True
-                return cached_data
+                # Add cache hit metadata to a copy; the cached dict is shared between threads
+                meta = {**(cached_data.get("meta") or {}), "cache_hit": True}
+                return StatusDataManager.with_freshness({**cached_data, "meta": meta})
 
         logger.info(
             f"Fetching fresh comprehensive status page data for period {time_period}, role {role}"
@@ -638,6 +964,8 @@ class StatusDataManager:
             )
             result["status_data"] = status_result
             result["meta"]["api_calls_made"].append("consolidated_status")
+            if status_result.get("meta"):
+                result["meta"]["status_fanout"] = status_result["meta"]
 
             # 2. Reuse deployment and cluster info gathered with consolidated status fetch
             deployment_from_status = status_result.get("deployment")
@@ -682,8 +1010,14 @@ class StatusDataManager:
                         or stats_result.get("dashboard_stats")
                     )
 
-                    latest_status = result.get("status_data", {}).get("latest_status")
+                    # The status payload is shared with the consolidated-status
+                    # cache, so work on copies rather than the cached dicts.
+                    status_data = dict(result.get("status_data") or {})
+                    latest_status = status_data.get("latest_status")
                     if latest_status is not None:
+                        latest_status = dict(latest_status)
+                        status_data["latest_status"] = latest_status
+                        result["status_data"] = status_data
                         if summary_all_time:
                             total_users = summary_all_time.get("total_users")
                             if total_users is not None:
@@ -724,9 +1058,21 @@ class StatusDataManager:
             result["error"] = str(e)
             result["meta"]["error"] = str(e)
 
-        # Cache the result (excluding error cases)
-        if not result.get("error"):
+        # Cache the result (excluding error cases).  Results with stats sections
+        # still pending, or with sections served stale while the API circuit is
+        # open, are not cached so the next refresh can replace them.
+        stale_sections = [
+            section
+            for section in ("status_data", "stats_data", "time_series_data")
+            if isinstance(result.get(section), dict) and result[section].get("stale")
+        ]
+        if stale_sections:
+            result["meta"]["stale_sections"] = stale_sections
+        pending_sections = (result.get("stats_data") or {}).get("pending_sections")
+        if pending_sections:
+            result["meta"]["pending_sections"] = list(pending_sections)
+        elif not result.get("error") and not stale_sections:
             StatusDataManager.set_cached_data(cache_key, result, cache_type="status")
             result["meta"]["optimizations_applied"].append("response_cached")
 
-        return result
+        return StatusDataManager.with_freshness(result)
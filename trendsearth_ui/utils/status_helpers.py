@@ -31,7 +31,7 @@ def _create_commit_link(commit_sha, repo_url):
         return commit_sha
 
 
-def _fetch_health_status(url, headers=None, timeout=10):
+def _fetch_health_status(url, headers=None, timeout=10, api_environment=None):
     """
     Fetch health status from a given URL.
 
@@ -44,7 +44,7 @@ def _fetch_health_status(url, headers=None, timeout=10):
     merged_headers = apply_default_headers(headers)
 
     try:
-        resp = get_session().get(url, headers=merged_headers, timeout=timeout)
+        resp = get_session(api_environment).get(url, headers=merged_headers, timeout=timeout)
         if resp.status_code == 200:
             return True, resp.json(), resp.status_code, None
         return False, None, resp.status_code, f"HTTP {resp.status_code}"
@@ -142,7 +142,9 @@ def fetch_deployment_info(api_environment, token=None):
     # Fetch API health info (public endpoint, no auth required)
     # API health endpoint is at the root level, not under /api/v1
     api_url = f"{get_api_base(api_environment).removesuffix('/api/v1')}/api-health"
-    api_success, api_data, api_status, api_error = _fetch_health_status(api_url)
+    api_success, api_data, api_status, api_error = _fetch_health_status(
+        api_url, api_environment=api_environment
+    )
 
     api_info = _create_service_info(
         "Trends.Earth API",
@@ -187,7 +189,7 @@ def fetch_cluster_info(api_environment, token=None, user_timezone=None):
         # Fetch raw cluster data from API
         headers = apply_default_headers({"Authorization": f"Bearer {token}"})
         cluster_url = f"{get_api_base(api_environment)}/status/cluster"
-        resp = get_session().get(
+        resp = get_session(api_environment).get(
             cluster_url,
             headers=headers,
             timeout=5,
@@ -281,7 +283,7 @@ def is_status_endpoint_available(token, api_environment):
     """Check if the /status endpoint is available and returns data."""
     headers = apply_default_headers({"Authorization": f"Bearer {token}"})
     try:
-        resp = get_session().get(
+        resp = get_session(api_environment).get(
             f"{get_api_base(api_environment)}/status",
             headers=headers,
             params={"per_page": 1},
@@ -0,0 +1,345 @@
+"""Refresh-ahead warmer for the status page caches.
+
+The status and time-series entries live for 270s and the stats for 300s, so
+they run out just as the page's five-minute auto-refresh fires and an unlucky
+admin pays for the whole stats fetch inside the callback.
+:class:`StatusCacheWarmer` re-fetches each configured target – the
+consolidated status per environment and display timezone, the stats and time
+series per environment and period – ``lead_seconds`` before its entries
+expire, signed in as a service account, so callbacks almost always find warm
+data.
+
+A lease per target records that it was refreshed recently.  The leases live
+in a :data:`~.cache_manager.cache_manager` namespace and are claimed with an
+atomic add, so with a shared cache backend each target is refreshed by one
+worker per cycle rather than by every worker.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
+import os
+from threading import Event, Lock, Thread
+import time
+
+from ..config import (
+    API_ENVIRONMENTS,
+    STATUS_WARMER_EMAIL,
+    STATUS_WARMER_ENVIRONMENTS,
+    STATUS_WARMER_LEAD_SECONDS,
+    STATUS_WARMER_MAX_CONCURRENCY,
+    STATUS_WARMER_PASSWORD,
+    STATUS_WARMER_PERIODS,
+    STATUS_WARMER_TIMEZONES,
+    STATUS_WARMER_TOKEN,
+    get_api_base,
+    get_auth_url,
+    get_current_api_environment,
+)
+from .cache_manager import cache_manager
+from .helpers import coordinated_refresh_access_token, get_user_info, is_superadmin
+from .http_client import apply_default_headers, get_session
+from .jwt_helpers import get_token_expiration
+from .metrics import counter
+from .status_data_manager import STATS_CACHE_TTL, STATUS_CACHE_TTL, StatusDataManager
+from .timezone_utils import DEFAULT_TIMEZONE, is_valid_timezone
+
+logger = logging.getLogger(__name__)
+
+WARMABLE_PERIODS = ("day", "week", "month", "year", "all")
+RETRY_SECONDS = 30  # wait before retrying a target whose refresh failed
+TOKEN_RENEW_MARGIN = 60  # seconds before expiry at which the service token is renewed
+
+WARMER_REFRESHES = counter(
+    "status_warmer_refreshes",
+    "Background status cache refreshes by kind and outcome (ok, error, skipped).",
+    ("kind", "outcome"),
+)
+
+
+@dataclass(frozen=True)
+class WarmTarget:
+    """One group of cache entries the warmer keeps fresh."""
+
+    kind: str  # "status", "stats" or "time_series"
+    environment: str
+    period: str | None = None
+    timezone: str | None = None  # status targets only
+
+    @property
+    def lease_key(self) -> str:
+        key = f"{self.kind}:{self.environment}:{self.period or '-'}"
+        return f"{key}:{self.timezone}" if self.timezone else key
+
+
+@dataclass
+class _ServiceSession:
+    access_token: str
+    refresh_token: str | None
+    role: str | None
+    expires_at: float | None  # epoch seconds; None when unknown
+
+
+class StatusCacheWarmer:
+    """Keep the status page caches for some environments and periods warm.
+
+    Call :meth:`start` to run it in a daemon thread, or :meth:`run_pending`
+    to refresh whatever is due once.  Refreshes run on a pool of
+    *max_concurrency* threads.
+    """
+
+    def __init__(
+        self,
+        environments: list[str],
+        periods: list[str],
+        *,
+        timezones: list[str] | None = None,
+        token: str = "",
+        email: str = "",
+        password: str = "",
+        max_concurrency: int = 2,
+        lead_seconds: float = 30,
+    ) -> None:
+        for period in periods:
+            if period not in WARMABLE_PERIODS:
+                logger.warning("Ignoring unknown status warmer period %r", period)
+        periods = [period for period in periods if period in WARMABLE_PERIODS]
+        timezones = timezones or [DEFAULT_TIMEZONE]
+        for timezone in timezones:
+            if not is_valid_timezone(timezone):
+                logger.warning("Ignoring unknown status warmer timezone %r", timezone)
+        timezones = [timezone for timezone in timezones if is_valid_timezone(timezone)]
+        self.targets = [
+            WarmTarget("status", environment, timezone=timezone)
+            for environment in environments
+            for timezone in timezones
+        ]
+        self.targets += [
+            WarmTarget(kind, environment, period)
+            for environment in environments
+            for period in periods
+            for kind in ("stats", "time_series")
+        ]
+        self.token = token
+        self.email = email
+        self.password = password
+        self.refresh_interval = max(min(STATUS_CACHE_TTL, STATS_CACHE_TTL) - lead_seconds, 1)
+        self.tick_seconds = min(10.0, max(lead_seconds / 3, 1.0))
+        self._leases = cache_manager.namespace(
+            "status_warmer_leases", maxsize=max(len(self.targets), 1), ttl=self.refresh_interval
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_concurrency, 1), thread_name_prefix="te-warmer"
+        )
+        self._lock = Lock()
+        self._in_flight: set[WarmTarget] = set()
+        self._retry_at: dict[WarmTarget, float] = {}
+        self._sessions: dict[str, _ServiceSession] = {}
+        self._sessions_lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    # -- scheduling -------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="te-status-warmer", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Status cache warmer started for %d target(s), refreshing every %ss",
+            len(self.targets),
+            self.refresh_interval,
+        )
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception:
+                logger.exception("Status cache warmer tick failed")
+            self._stop.wait(self.tick_seconds)
+
+    def run_pending(self) -> list[Future]:
+        """Submit every target whose lease has lapsed; return the submitted futures."""
+        now = time.monotonic()
+        futures = []
+        for target in self.targets:
+            with self._lock:
+                if target in self._in_flight or self._retry_at.get(target, 0) > now:
+                    continue
+                if not self._leases.add(target.lease_key, time.time()):
+                    continue
+                self._in_flight.add(target)
+            futures.append(self._executor.submit(self._refresh_target, target))
+        return futures
+
+    def _refresh_target(self, target: WarmTarget) -> str:
+        try:
+            outcome = self.refresh(target)
+        except Exception:
+            logger.exception("Status cache warmer failed to refresh %s", target.lease_key)
+            outcome = "error"
+        with self._lock:
+            self._in_flight.discard(target)
+            if outcome == "error":
+                self._leases.pop(target.lease_key, None)
+                self._retry_at[target] = time.monotonic() + RETRY_SECONDS
+            else:
+                self._retry_at.pop(target, None)
+        WARMER_REFRESHES.inc(kind=target.kind, outcome=outcome)
+        return outcome
+
+    # -- refreshing -------------------------------------------------------
+
+    def refresh(self, target: WarmTarget) -> str:
+        """Re-fetch *target* into the caches; return ``ok``, ``error`` or ``skipped``."""
+        session = self._service_session(target.environment)
+        if session is None:
+            return "error"
+        token = session.access_token
+        if target.kind == "status":
+            result = StatusDataManager.fetch_consolidated_status_data(
+                token, target.environment, force_refresh=True, user_timezone=target.timezone
+            )
+        elif target.kind == "time_series":
+            result = StatusDataManager.fetch_time_series_status_data(
+                token, target.environment, target.period, force_refresh=True
+            )
+        elif is_superadmin(session.role):
+            result = StatusDataManager.fetch_consolidated_stats_data(
+                token, target.environment, target.period, session.role, force_refresh=True
+            )
+        else:
+            logger.debug("Status warmer account is not a SUPERADMIN; not warming stats")
+            return "skipped"
+
+        if result.get("error"):
+            logger.warning(
+                "Status cache warmer got an error for %s: %s", target.lease_key, result["error"]
+            )
+            # The token may have been revoked; sign in again on the retry.
+            with self._sessions_lock:
+                self._sessions.pop(target.environment, None)
+            return "error"
+        logger.debug("Status cache warmer refreshed %s", target.lease_key)
+        return "ok"
+
+    def _service_session(self, environment: str) -> _ServiceSession | None:
+        with self._sessions_lock:
+            session = self._sessions.get(environment)
+            if session is not None and (
+                session.expires_at is None or time.time() < session.expires_at - TOKEN_RENEW_MARGIN
+            ):
+                return session
+            renewed = None
+            if session is not None and session.refresh_token:
+                access_token, expires_in, refresh_token = coordinated_refresh_access_token(
+                    session.refresh_token, environment
+                )
+                if access_token:
+                    renewed = self._build_session(
+                        access_token, refresh_token, expires_in, session.role
+                    )
+            if renewed is None:
+                renewed = self._sign_in(environment)
+            if renewed is None:
+                self._sessions.pop(environment, None)
+            else:
+                self._sessions[environment] = renewed
+            return renewed
+
+    def _sign_in(self, environment: str) -> _ServiceSession | None:
+        refresh_token = expires_in = None
+        if self.token:
+            access_token = self.token
+        else:
+            try:
+                resp = get_session(environment).post(
+                    get_auth_url(environment),
+                    headers=apply_default_headers(),
+                    json={"email": self.email, "password": self.password},
+                    timeout=10,
+                )
+            except Exception as e:
+                logger.warning("Status warmer sign-in to %s failed: %s", environment, e)
+                return None
+            if resp.status_code != 200:
+                logger.warning(
+                    "Status warmer sign-in to %s failed with status %s",
+                    environment,
+                    resp.status_code,
+                )
+                return None
+            data = resp.json()
+            access_token = data.get("access_token")
+            refresh_token = data.get("refresh_token")
+            expires_in = data.get("expires_in")
+            if not access_token:
+                return None
+
+        user = get_user_info(access_token, get_api_base(environment))
+        if not user:
+            logger.warning("Status warmer token for %s was rejected", environment)
+            return None
+        return self._build_session(access_token, refresh_token, expires_in, user.get("role"))
+
+    @staticmethod
+    def _build_session(
+        access_token: str, refresh_token: str | None, expires_in: int | None, role: str | None
+    ) -> _ServiceSession:
+        if expires_in:
+            expires_at = time.time() + float(expires_in)
+        else:
+            expiration = get_token_expiration(access_token)
+            expires_at = expiration.timestamp() if expiration else None
+        return _ServiceSession(access_token, refresh_token, role, expires_at)
+
+
+_warmer: StatusCacheWarmer | None = None
+_warmer_pid: int | None = None
+_warmer_lock = Lock()
+
+
+def start_status_warmer() -> StatusCacheWarmer | None:
+    """Start this process's warmer from the ``STATUS_WARMER_*`` settings.
+
+    Returns ``None`` (and starts nothing) without credentials or periods.  A
+    process forked after the warmer started gets its own warmer.
+    """
+    global _warmer, _warmer_pid
+    has_credentials = STATUS_WARMER_TOKEN or (STATUS_WARMER_EMAIL and STATUS_WARMER_PASSWORD)
+    if not has_credentials or not STATUS_WARMER_PERIODS:
+        return None
+    with _warmer_lock:
+        if _warmer is not None and _warmer_pid == os.getpid():
+            return _warmer
+        environments = STATUS_WARMER_ENVIRONMENTS or [get_current_api_environment()]
+        for environment in environments:
+            if environment not in API_ENVIRONMENTS:
+                logger.warning("Ignoring unknown status warmer environment %r", environment)
+        _warmer = StatusCacheWarmer(
+            [environment for environment in environments if environment in API_ENVIRONMENTS],
+            STATUS_WARMER_PERIODS,
+            timezones=STATUS_WARMER_TIMEZONES,
+            token=STATUS_WARMER_TOKEN,
+            email=STATUS_WARMER_EMAIL,
+            password=STATUS_WARMER_PASSWORD,
+            max_concurrency=STATUS_WARMER_MAX_CONCURRENCY,
+            lead_seconds=STATUS_WARMER_LEAD_SECONDS,
+        )
+        _warmer_pid = os.getpid()
+        _warmer.start()
+        return _warmer
+
+
+__all__ = ["StatusCacheWarmer", "WarmTarget", "start_status_warmer"]